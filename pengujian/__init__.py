@@ -0,0 +1,25 @@
+"""
+Mesin evaluasi akurasi sistem deteksi arc flash.
+
+Semua ukuran window (10ws, 20ws, 25ws, 50ws) dievaluasi dengan kode pemuatan
+CSV, normalisasi label dan metrik yang sama; perbedaan antar dataset hanya
+ada di konfigurasi (lihat pengujian.config.DATASETS).
+
+Mengimpor paket ini hanya memuat numpy/pandas; matplotlib, seaborn, sklearn dan
+openpyxl baru dimuat saat tahap laporan yang membutuhkannya berjalan.
+"""
+from time import perf_counter as _perf_counter
+
+IMPORT_STARTED_AT = _perf_counter()
+
+from .compare import run_comparison
+from .config import DATASETS, SCHEMAS, load_config
+from .engine import evaluate_dataset, run, run_metrics, write_reports
+from .recording import convert_datasets, read_recording
+from .sweep import run_sweep
+from .watch import run_watch
+
+# Lama impor paket (tanpa startup interpreter), dicetak oleh CLI.
+IMPORT_SECONDS = _perf_counter() - IMPORT_STARTED_AT
+
+__all__ = ['DATASETS', 'SCHEMAS', 'load_config', 'convert_datasets', 'read_recording', 'evaluate_dataset', 'run', 'run_comparison', 'run_metrics', 'run_sweep', 'run_watch', 'write_reports']
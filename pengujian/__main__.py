@@ -0,0 +1,141 @@
+import argparse
+import os
+import sys
+from contextlib import nullcontext
+from time import perf_counter
+
+from . import IMPORT_SECONDS, IMPORT_STARTED_AT
+from .bootstrap import DEFAULT_CONFIDENCE, DEFAULT_REPLICATES, DEFAULT_SEED
+from .cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, TrialCache
+from .compare import run_comparison
+from .config import load_config, select_datasets
+from .engine import run, run_metrics
+from .export import DEFAULT_EXCEL_ROWS, SPILL_FORMATS
+from .integrity import DEFAULT_ATOL, DEFAULT_RTOL, run_check
+from .manifest import ResultManifest
+from .recording import convert_datasets, recording_to_csv
+from .segments import print_segment
+from .sweep import run_sweep
+from .timing import collect, write_chrome_trace, write_json
+from .watch import DEFAULT_IDLE, DEFAULT_INTERVAL, DEFAULT_REFRESH, run_watch
+
+# Modul yang seharusnya hanya dimuat oleh tahap laporan (impor malas).
+HEAVY_MODULES = ['matplotlib', 'seaborn', 'sklearn', 'scipy', 'openpyxl']
+
+
+def print_trace_summary(times):
+    summary = times.summary()
+    titles = {'stages': 'Waktu per Tahap (semua thread)', 'background_stages': 'Di antaranya di thread pemuat (bersamaan dengan thread utama)'}
+    for key, title in titles.items():
+        if not summary[key]:
+            continue
+        print(f"\n--- {title} ---")
+        print(f"{'Tahap':<22} | {'Dinding (s)':>11} | {'CPU (s)':>9} | {'Panggilan':>9} | {'Baris':>12}")
+        for name, row in summary[key].items():
+            print(f"{name:<22} | {row['wall_seconds']:>11.4f} | {row['cpu_seconds']:>9.4f} | {row['calls']:>9} | {row['rows']:>12}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m pengujian', description='Evaluasi akurasi semua ukuran window dalam satu proses.')
+    parser.add_argument('datasets', nargs='*', help="Nama dataset yang dievaluasi (misalnya 10ws 50ws). Kosong berarti semua.")
+    parser.add_argument('--config', help='File konfigurasi JSON berformat {"datasets": [...]}.')
+    parser.add_argument('--base-dir', default='.', help='Folder induk hasil_pengujian_*.')
+    parser.add_argument('--output-dir', help='Tulis laporan ke <output-dir>/<dataset> alih-alih folder output bawaan.')
+    parser.add_argument('--chunksize', type=int, help='Mode streaming: baca file per potongan berisi N baris agar memori tetap terbatas.')
+    parser.add_argument('--cache-dir', help=f'Folder cache kolumnar CSV yang sudah di-parse (bawaan: <base-dir>/{DEFAULT_CACHE_DIR}).')
+    parser.add_argument('--cache-max-mb', type=float, default=DEFAULT_MAX_BYTES / 2**20, help='Batas ukuran cache; entri paling lama tidak dipakai dihapus lebih dulu.')
+    parser.add_argument('--no-cache', action='store_true', help='Selalu parse ulang CSV dan hitung ulang semua percobaan tanpa cache maupun manifest hasil.')
+    parser.add_argument('--metrics-only', action='store_true', help='Mode cepat: cetak akurasi, metrik per kelas dan waktu tunda saja (tanpa laporan, hanya numpy/pandas).')
+    parser.add_argument('--sweep', type=int, nargs='+', metavar='WINDOW', help='Sweep offline: hitung ulang fitur rolling dari sinyal mentah untuk ukuran window ini, terapkan classifier ambang dan laporkan akurasi serta waktu tunda per ukuran window.')
+    parser.add_argument('--sweep-workers', type=int, help='Jumlah proses pekerja untuk sweep (bawaan: jumlah CPU).')
+    parser.add_argument('--compare-windows', action='store_true', help='Bandingkan semua ukuran window: satu tabel dan grafik akurasi, F1 per kelas dan persentil waktu tunda (perbandingan_ukuran_window).')
+    parser.add_argument('--compare-workers', type=int, help='Jumlah proses pekerja perbandingan, satu root per pekerja (bawaan: jumlah CPU).')
+    parser.add_argument('--watch', action='store_true', help='Mode pantau: ikuti file percobaan yang baru dibuat atau masih bertambah dan cetak ringkasan berjalan (Ctrl+C untuk berhenti).')
+    parser.add_argument('--watch-interval', type=float, default=DEFAULT_INTERVAL, help='Selang pemindaian file mode pantau (detik).')
+    parser.add_argument('--watch-refresh', type=float, default=DEFAULT_REFRESH, help='Selang minimum pencetakan ringkasan berjalan (detik).')
+    parser.add_argument('--watch-idle', type=float, default=DEFAULT_IDLE, help='Percobaan ditutup setelah filenya tidak bertambah selama sekian detik.')
+    parser.add_argument('--watch-port', type=int, help='Sajikan ringkasan berjalan sebagai JSON di http://127.0.0.1:PORT/.')
+    parser.add_argument('--watch-duration', type=float, help='Hentikan mode pantau setelah sekian detik (bawaan: sampai Ctrl+C).')
+    parser.add_argument('--to-recording', metavar='FOLDER', help='Konversi file percobaan ke rekaman biner (.pgrec) di FOLDER dengan susunan folder yang sama (dapat dipakai sebagai --base-dir).')
+    parser.add_argument('--recording-to-csv', nargs=2, metavar=('REKAMAN', 'CSV'), help='Tulis ulang satu rekaman biner sebagai CSV aslinya.')
+    parser.add_argument('--check-features', action='store_true', help='Cek integritas: hitung ulang fitur rolling dari sinyal mentah, bandingkan dengan kolom Mean/Std Dev tercatat dan laporkan file serta rentang baris yang menyimpang (kode keluar 1 jika ada).')
+    parser.add_argument('--atol', type=float, default=DEFAULT_ATOL, help='Toleransi absolut cek integritas fitur.')
+    parser.add_argument('--rtol', type=float, default=DEFAULT_RTOL, help='Toleransi relatif cek integritas fitur.')
+    parser.add_argument('--trace', metavar='FILE', help='Tulis trace JSON per tahap dan per file (waktu dinding, waktu CPU per thread, baris, puncak memori).')
+    parser.add_argument('--chrome-trace', metavar='FILE', help='Tulis trace dalam format trace-event Chrome (chrome://tracing, Perfetto).')
+    parser.add_argument('--trace-memory', action='store_true', help='Catat puncak alokasi memori per tahap dengan tracemalloc (lebih lambat).')
+    parser.add_argument('--spill-format', choices=SPILL_FORMATS, default='csv', help='Format file detail_kesalahan yang berisi semua baris mismatch (ditulis per file percobaan).')
+    parser.add_argument('--excel-max-rows', type=int, default=DEFAULT_EXCEL_ROWS, help='Batas baris sheet Excel Detail Kesalahan; sisanya hanya ada di file detail_kesalahan.')
+    parser.add_argument('--segments-only', action='store_true', help='Catat kesalahan hanya sebagai segmen (segmen_kesalahan.csv) tanpa menyalin baris mismatch mentah ke memori maupun file detail_kesalahan.')
+    parser.add_argument('--segment-rows', nargs=2, metavar=('TABEL', 'NOMOR'), help='Tampilkan baris mentah segmen nomor NOMOR dari file segmen_kesalahan.csv TABEL (dibaca ulang dari file sumber).')
+    parser.add_argument('--bootstrap', type=int, nargs='?', const=DEFAULT_REPLICATES, metavar='N', help=f'Tulis interval kepercayaan bootstrap (N replikasi, bawaan {DEFAULT_REPLICATES}) untuk semua angka akurasi dan waktu tunda ke interval_kepercayaan.csv.')
+    parser.add_argument('--confidence', type=float, default=DEFAULT_CONFIDENCE, help='Tingkat kepercayaan interval bootstrap.')
+    parser.add_argument('--bootstrap-seed', type=int, default=DEFAULT_SEED, help='Seed bootstrap (hasil sama untuk seed dan N yang sama).')
+    parser.add_argument('--bootstrap-workers', type=int, help='Jumlah proses pekerja bootstrap (bawaan: jumlah CPU).')
+    parser.add_argument('--align-tolerance', type=float, metavar='DETIK', help='Toleransi penyelarasan waktu file kebenaran dan prediksi (bawaan dari skema, 0.05 detik untuk skema sistem).')
+    parser.add_argument('--positional', action='store_true', help='Bandingkan file kebenaran dan prediksi per posisi baris tanpa penyelarasan waktu.')
+    parser.add_argument('--io-workers', type=int, help='Jumlah thread pemuat file percobaan secara paralel (bawaan: jumlah CPU + 4, maksimal 32; 1 = berurutan).')
+    parser.add_argument('--no-figures', action='store_true', help='Hanya tulis keluaran yang dapat dibaca mesin (CSV/Excel), tanpa gambar PNG.')
+    parser.add_argument('--render-workers', type=int, help='Jumlah proses pekerja untuk menggambar PNG (bawaan: jumlah CPU; 1 = tanpa proses pekerja).')
+    args = parser.parse_args(argv)
+    cache = manifest = None
+    if not args.no_cache:
+        cache_dir = args.cache_dir or os.path.join(args.base_dir, DEFAULT_CACHE_DIR)
+        cache = TrialCache(cache_dir, int(args.cache_max_mb * 2**20))
+        manifest = ResultManifest(os.path.join(cache_dir, 'hasil'))
+    print(f"Waktu impor: {IMPORT_SECONDS:.3f} s, startup: {perf_counter() - IMPORT_STARTED_AT:.3f} s")
+    status = 0
+    tracing = args.trace or args.chrome_trace or args.trace_memory
+    with collect(args.trace_memory) if tracing else nullcontext() as times:
+        if args.segment_rows:
+            table_path, index = args.segment_rows
+            datasets = select_datasets(load_config(args.config), args.datasets or None)
+            print_segment(table_path, int(index), datasets[0]['schema'] if len(datasets) == 1 else 'sistem', cache)
+        elif args.check_features:
+            status = 1 if run_check(args.datasets or None, config_path=args.config, base_dir=args.base_dir,
+                                     output_root=args.output_dir, cache=cache, atol=args.atol, rtol=args.rtol) else 0
+        elif args.sweep:
+            run_sweep(args.sweep, args.datasets or None, config_path=args.config, base_dir=args.base_dir,
+                      output_root=args.output_dir, cache=cache, workers=args.sweep_workers)
+        elif args.to_recording:
+            convert_datasets(args.datasets or None, config_path=args.config, base_dir=args.base_dir, output_root=args.to_recording)
+        elif args.recording_to_csv:
+            recording_to_csv(*args.recording_to_csv)
+        elif args.watch:
+            run_watch(args.datasets or None, config_path=args.config, base_dir=args.base_dir, interval=args.watch_interval,
+                      refresh=args.watch_refresh, idle=args.watch_idle, port=args.watch_port, duration=args.watch_duration,
+                      align_tolerance=args.align_tolerance, positional=args.positional)
+        else:
+            options = {'config_path': args.config, 'base_dir': args.base_dir, 'chunksize': args.chunksize, 'cache': cache,
+                       'manifest': manifest, 'align_tolerance': args.align_tolerance, 'positional': args.positional,
+                       'io_workers': args.io_workers}
+            if args.compare_windows:
+                run_comparison(args.datasets or None, output_root=args.output_dir, workers=args.compare_workers,
+                               figures=not args.no_figures, **options)
+            elif args.metrics_only:
+                run_metrics(args.datasets or None, **options)
+            else:
+                bootstrap = None
+                if args.bootstrap is not None:
+                    bootstrap = {'replicates': args.bootstrap, 'confidence': args.confidence, 'seed': args.bootstrap_seed,
+                                 'workers': args.bootstrap_workers}
+                run(args.datasets or None, output_root=args.output_dir, figures=not args.no_figures,
+                    render_workers=args.render_workers, spill_format=args.spill_format, excel_rows=args.excel_max_rows,
+                    collect_rows=not args.segments_only, bootstrap=bootstrap, **options)
+    if tracing:
+        print_trace_summary(times)
+        if args.trace:
+            write_json(times, args.trace)
+            print(f"Trace JSON ditulis ke '{args.trace}'.")
+        if args.chrome_trace:
+            write_chrome_trace(times, args.chrome_trace)
+            print(f"Trace Chrome ditulis ke '{args.chrome_trace}'.")
+    if manifest is not None and manifest.hits:
+        print(f"\nManifest: {manifest.hits} percobaan diambil dari hasil sebelumnya, {manifest.misses} dihitung ulang.")
+    loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+    print(f"\nTotal waktu: {perf_counter() - IMPORT_STARTED_AT:.3f} s (modul berat dimuat: {', '.join(loaded) or '-'})")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+"""
+Benchmark pipeline evaluasi pada data sintetis yang dapat diskalakan.
+
+Rekaman sintetis dibuat dalam kedua skema kolom ('sistem' dengan file
+kebenaran/prediksi terpisah dan 'percobaan' satu file per percobaan) dengan
+jumlah baris, transisi per file, laju kesalahan prediksi dan jumlah file yang
+dapat diatur (10k sampai 100M baris; file ditulis per blok sehingga memori
+tetap terbatas). Pipeline yang sama dengan CLI lalu dijalankan dan lama setiap
+tahap dicatat lewat pengujian.timing: baca CSV, parse timestamp, encode label,
+pengelompokan transisi, pencarian waktu tunda, confusion matrix, penyusunan
+laporan, tulis Excel dan gambar PNG. Setiap run ditambahkan sebagai satu baris
+JSON ke file hasil sehingga angka antar versi dapat dibandingkan.
+
+    python -m pengujian.benchmark --rows 10k 1M --files 4 --output hasil_benchmark.jsonl
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from .engine import evaluate_dataset, open_spill, write_reports
+from .export import DEFAULT_EXCEL_ROWS
+from .render import FigureRenderer
+from .sweep import rolling_features
+from .timing import collect, peak_rss_mb
+
+BLOCK_ROWS = 1_000_000
+SPEC_FILE = 'spesifikasi.json'
+DEFAULT_OUTPUT = 'hasil_benchmark.jsonl'
+
+LABELS = ['NORMAL', 'ARC FLASH', 'NO CONTACT']
+PERCOBAAN_LABELS = ['Status: Normal', 'Status: Arc Flash', 'Status: Off Contact']
+LABEL_NUMERIK = [1, 2, 0]
+# Urutan label antar segmen: normal -> arc -> off -> arc -> normal -> ...
+LABEL_CYCLE = np.array([0, 1, 2, 1])
+# Prediksi sintetis tertinggal beberapa sampel dari kebenaran di setiap transisi.
+DETECTION_DELAY = 3
+SAMPLE_SECONDS = {'sistem': 0.008, 'percobaan': 0.27}
+SUFFIXES = {'k': 10**3, 'm': 10**6, 'g': 10**9}
+
+
+def parse_count(text):
+    """'10k', '1M', '100M' atau '35000' menjadi bilangan bulat."""
+    text = str(text).strip().lower()
+    if text and text[-1] in SUFFIXES:
+        return int(float(text[:-1]) * SUFFIXES[text[-1]])
+    return int(text)
+
+
+def _signals(truth, rng):
+    n = len(truth)
+    voltage = np.choose(truth, [330 + rng.normal(0, 1, n), rng.uniform(0, 340, n), np.zeros(n)]).round(2)
+    current = np.choose(truth, [np.full(n, 0.06), rng.uniform(0, 0.1, n), np.zeros(n)]).round(2)
+    return voltage, current
+
+
+def _block_labels(start, stop, rows, transitions, error_rate, rng):
+    index = np.arange(max(start - DETECTION_DELAY, 0), stop, dtype=np.int64)
+    codes = LABEL_CYCLE[index * (transitions + 1) // rows % len(LABEL_CYCLE)]
+    truth = codes[len(codes) - (stop - start):]
+    pred = codes[np.maximum(np.arange(start, stop) - DETECTION_DELAY, 0) - index[0]]
+    flip = rng.random(stop - start) < error_rate
+    pred = np.where(flip, (pred + 1) % len(LABELS), pred)
+    return truth, pred
+
+
+def _write_block(path, frame, first):
+    frame.to_csv(path, mode='w' if first else 'a', header=first, index=False)
+
+
+def _write_trial(paths, schema_name, rows, transitions, error_rate, rng):
+    names = np.asarray(LABELS if schema_name == 'sistem' else PERCOBAAN_LABELS, dtype=object)
+    for start in range(0, rows, BLOCK_ROWS):
+        stop = min(start + BLOCK_ROWS, rows)
+        truth, pred = _block_labels(start, stop, rows, transitions, error_rate, rng)
+        voltage, current = _signals(truth, rng)
+        features = rolling_features(voltage, current, 10, 1 if schema_name == 'sistem' else 0)
+        index = np.arange(start, stop)
+        first = start == 0
+        if schema_name == 'sistem':
+            timestamp = np.datetime64('2025-08-08T17:23:55.616', 'ms') + index * np.timedelta64(round(SAMPLE_SECONDS['sistem'] * 1000), 'ms')
+            base = {
+                'Timestamp': timestamp,
+                'Tegangan_V': voltage,
+                'Arus_A': current,
+                'Daya': (voltage * current).round(1),
+                'Energy': index // 1000,
+                'Mean_V': features['mean_v'].round(2),
+                'Std_Dev_V': features['std_v'].round(2),
+                'Mean_I': features['mean_i'].round(2),
+                'Std_Dev_I': features['std_i'].round(2),
+            }
+            for path, codes in zip(paths, (truth, pred)):
+                frame = pd.DataFrame(base)
+                frame['Label_Numerik'] = np.asarray(LABEL_NUMERIK)[codes]
+                frame['Hasil_Prediksi'] = names[codes]
+                _write_block(path, frame, first)
+        else:
+            frame = pd.DataFrame({
+                'Waktu Relatif (detik)': (index * SAMPLE_SECONDS['percobaan']).round(2),
+                'Tegangan (V)': voltage,
+                'Arus (A)': current,
+                'Mean Tegangan (V)': features['mean_v'].round(2),
+                'Std Dev Tegangan (V)': features['std_v'].round(2),
+                'Mean Arus (A)': features['mean_i'].round(8),
+                'Std Dev Arus (A)': features['std_i'].round(8),
+                'Output Sistem Aktual': names[pred],
+                'Output Sistem yang Diharapkan': names[truth],
+                'Akurasi': np.where(truth == pred, 'Sesuai', 'Tidak Sesuai'),
+            })
+            _write_block(paths[0], frame, first)
+
+
+def synthesize_dataset(workdir, schema_name, rows, files=4, transitions=3, error_rate=0.02, seed=0):
+    """
+    Menulis dataset sintetis berisi rows baris (dibagi rata ke files percobaan)
+    di bawah workdir dan mengembalikan konfigurasi datasetnya (format yang sama
+    dengan config.DATASETS). Dataset dengan spesifikasi sama tidak ditulis ulang.
+    """
+    spec = {'schema': schema_name, 'rows': rows, 'files': files, 'transitions': transitions,
+            'error_rate': error_rate, 'seed': seed}
+    root = f"sintetis_{schema_name}_{rows}"
+    if schema_name == 'sistem':
+        dataset = {
+            'name': f"sintetis-{schema_name}-{rows}", 'window_size': 10, 'root': root, 'schema': schema_name,
+            'scenarios': [{'truth_folder': 'kebenaran', 'truth_prefix': 'percobaan_',
+                           'pred_folder': 'prediksi', 'pred_prefix': 'percobaan_'}],
+            'file_indices': list(range(1, files + 1)),
+            'output': {'folder': 'output', 'format': 'laporan_lengkap'},
+        }
+        folders = ['kebenaran', 'prediksi']
+    else:
+        dataset = {
+            'name': f"sintetis-{schema_name}-{rows}", 'window_size': 10, 'root': root, 'schema': schema_name,
+            'scenarios': [{'name': 'Sintetis', 'folder': 'data', 'prefix': 'percobaan_'}],
+            'file_indices': list(range(1, files + 1)),
+            'output': {'folder': 'output', 'format': 'laporan_csv'},
+        }
+        folders = ['data']
+
+    folder = os.path.join(workdir, root)
+    spec_path = os.path.join(folder, SPEC_FILE)
+    try:
+        with open(spec_path, encoding='utf-8') as f:
+            if json.load(f) == spec:
+                return dataset
+    except (FileNotFoundError, ValueError):
+        pass
+    for name in folders:
+        os.makedirs(os.path.join(folder, name), exist_ok=True)
+    per_file = np.full(files, rows // files)
+    per_file[:rows % files] += 1
+    for i, trial_rows in zip(dataset['file_indices'], per_file):
+        rng = np.random.default_rng([seed, i])
+        paths = [os.path.join(folder, name, f"percobaan_{i}.csv") for name in folders]
+        _write_trial(paths, schema_name, int(trial_rows), transitions, error_rate, rng)
+    with open(spec_path, 'w', encoding='utf-8') as f:
+        json.dump(spec, f)
+    return dataset
+
+
+def benchmark_dataset(dataset, workdir, chunksize=None, reports=True, figures=True, render_workers=1):
+    """
+    Menjalankan evaluasi (dan laporan) satu dataset tanpa cache maupun manifest.
+    Keluaran cetak pipeline ditelan. Mengembalikan (lama total, dict detik per
+    tahap di thread utama, dict detik per tahap di thread pemuat). Tahap thread
+    pemuat berjalan bersamaan dengan thread utama, jadi tidak termasuk 'lainnya'.
+    """
+    with collect() as times, contextlib.redirect_stdout(io.StringIO()):
+        started = perf_counter()
+        folder = os.path.join(workdir, dataset['root'], dataset['output']['folder'])
+        spill = open_spill(dataset, folder) if reports else None
+        result = evaluate_dataset(dataset, workdir, chunksize=chunksize, spill=spill, max_mismatch_rows=DEFAULT_EXCEL_ROWS if reports else 0)
+        if reports and result['files']:
+            with FigureRenderer(figures, render_workers) as renderer:
+                write_reports(result, folder, renderer)
+        elapsed = perf_counter() - started
+    if not result['files']:
+        raise RuntimeError(f"Tidak ada file yang diproses untuk {dataset['name']}")
+    main = times.main_seconds()
+    stages = {name: round(seconds, 6) for name, seconds in sorted(main.items())}
+    stages['lainnya'] = round(max(elapsed - sum(main.values()), 0.0), 6)
+    thread_stages = {name: round(seconds, 6) for name, seconds in sorted(times.background.seconds.items())}
+    return elapsed, stages, thread_stages
+
+
+def environment():
+    """Versi kode dan lingkungan untuk membandingkan hasil antar versi."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def run_benchmark(rows_list, schemas=('sistem', 'percobaan'), files=4, transitions=3, error_rate=0.02, workdir='.benchmark',
+                  output=DEFAULT_OUTPUT, chunksize=None, reports=True, figures=True, render_workers=1, seed=0):
+    """
+    Benchmark untuk setiap jumlah baris di rows_list dan setiap skema. Setiap run
+    dicetak dan ditambahkan ke output (JSON Lines). Mengembalikan daftar record.
+    """
+    env = environment()
+    records = []
+    for rows in rows_list:
+        for schema_name in schemas:
+            started = perf_counter()
+            dataset = synthesize_dataset(workdir, schema_name, rows, files, transitions, error_rate, seed)
+            synth_seconds = perf_counter() - started
+            elapsed, stages, thread_stages = benchmark_dataset(dataset, workdir, chunksize, reports, figures, render_workers)
+            record = {
+                'waktu': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                **env,
+                'schema': schema_name,
+                'rows': rows,
+                'files': files,
+                'transitions': transitions,
+                'error_rate': error_rate,
+                'chunksize': chunksize,
+                'reports': reports,
+                'figures': figures and reports,
+                'synth_seconds': round(synth_seconds, 3),
+                'total_seconds': round(elapsed, 6),
+                'rows_per_second': round(rows / elapsed, 1) if elapsed else None,
+                'peak_rss_mb': peak_rss_mb(),
+                'stages': stages,
+                'thread_stages': thread_stages,
+            }
+            records.append(record)
+            print(f"\n--- {schema_name}, {rows} baris, {files} file: {elapsed:.3f} s ({record['rows_per_second']:.0f} baris/s) ---")
+            for name, seconds in sorted(stages.items(), key=lambda item: -item[1]):
+                print(f"{name:<22} {seconds:>10.4f} s {seconds / elapsed * 100 if elapsed else 0:>6.1f}%")
+            if thread_stages:
+                print("Thread pemuat (bersamaan dengan thread utama, tidak ikut dijumlahkan; % terhadap waktu total):")
+                for name, seconds in sorted(thread_stages.items(), key=lambda item: -item[1]):
+                    print(f"  {name:<20} {seconds:>10.4f} s {seconds / elapsed * 100 if elapsed else 0:>6.1f}%")
+            if output:
+                with open(output, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    if output:
+        print(f"\nHasil benchmark ditambahkan ke '{output}'.")
+    return records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m pengujian.benchmark', description='Benchmark pipeline evaluasi pada data sintetis.')
+    parser.add_argument('--rows', nargs='+', default=['10k'], help='Jumlah baris total per dataset, misalnya 10k 1M 100M.')
+    parser.add_argument('--schema', nargs='+', choices=['sistem', 'percobaan'], default=['sistem', 'percobaan'], help='Skema kolom yang diuji.')
+    parser.add_argument('--files', type=int, default=4, help='Jumlah file percobaan per dataset.')
+    parser.add_argument('--transitions', type=int, default=3, help='Jumlah transisi label per file.')
+    parser.add_argument('--error-rate', type=float, default=0.02, help='Fraksi baris yang prediksinya salah.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workdir', default='.benchmark', help='Folder data sintetis (dipakai ulang jika spesifikasinya sama).')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='File JSON Lines tempat hasil ditambahkan.')
+    parser.add_argument('--chunksize', type=int, help='Mode streaming dengan potongan N baris (disarankan untuk jutaan baris).')
+    parser.add_argument('--no-reports', action='store_true', help='Hanya evaluasi, tanpa laporan, Excel dan PNG.')
+    parser.add_argument('--no-figures', action='store_true', help='Tanpa gambar PNG.')
+    parser.add_argument('--render-workers', type=int, default=1, help='Jumlah proses pekerja untuk PNG.')
+    args = parser.parse_args(argv)
+    run_benchmark([parse_count(rows) for rows in args.rows], args.schema, args.files, args.transitions, args.error_rate,
+                  args.workdir, args.output, args.chunksize, not args.no_reports, not args.no_figures,
+                  args.render_workers, args.seed)
+
+
+if __name__ == "__main__":
+    main()
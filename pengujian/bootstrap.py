@@ -0,0 +1,228 @@
+"""
+Interval kepercayaan bootstrap untuk angka akurasi dan waktu tunda.
+
+Satu dataset hanya berisi beberapa file per skenario, sehingga satu angka
+akurasi atau rata-rata tunda menyembunyikan variasi antar percobaan. Modul ini
+me-resample di dua tingkat:
+
+- percobaan: file diambil ulang dengan pengembalian di dalam setiap skenario.
+  Setiap file sudah diringkas menjadi vektor hitungan (confusion matrix,
+  total/benar per transisi dan per skenario), sehingga satu replikasi hanyalah
+  jumlah berbobot: seluruh replikasi dihitung sekaligus sebagai perkalian
+  matriks bobot (replikasi x file) dengan matriks hitungan (file x hitungan).
+- transisi: kejadian waktu tunda diambil ulang dengan pengembalian di dalam
+  setiap jenis transisi (indeks acak replikasi x kejadian).
+
+Replikasi dibagi ke blok berukuran tetap dengan seed turunan per blok, sehingga
+hasil hanya bergantung pada seed dan jumlah replikasi, bukan jumlah pekerja.
+Blok dihitung paralel di proses pekerja (spawn) jika workers > 1.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .report import delay_label_names
+from .streaming import grow_square
+
+DEFAULT_REPLICATES = 10_000
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_SEED = 0
+BLOCK_REPLICATES = 2_500
+BOOTSTRAP_FILE = 'interval_kepercayaan.csv'
+INTERVAL_COLUMNS = ['Kelompok', 'Nama', 'Metrik', 'Nilai', 'Batas Bawah', 'Batas Atas', 'Jumlah Sampel']
+
+
+def trial_count_matrix(result):
+    """
+    Matriks hitungan per percobaan (file x hitungan) beserta strata (skenario
+    setiap file) dan dict nama blok kolom -> slice. Blok kolom: 'confusion'
+    (n x n, diratakan), 'transition_total' dan 'transition_correct'
+    (n x n per pasangan kode asal/tujuan) serta 'scenario_total' dan
+    'scenario_correct' (satu kolom per skenario).
+    """
+    n = len(result['vocabulary'])
+    trials = result['trials']
+    scenarios = list(dict.fromkeys(trial['scenario'] for trial in trials))
+    strata = np.array([scenarios.index(trial['scenario']) for trial in trials], dtype=np.int64)
+    confusion = np.stack([grow_square(trial['confusion'], n) for trial in trials])
+    tensor = np.stack([grow_square(trial['transition_confusion'], n) for trial in trials])
+    scenario_total = np.zeros((len(trials), len(scenarios)), dtype=np.int64)
+    scenario_correct = np.zeros_like(scenario_total)
+    rows = np.arange(len(trials))
+    scenario_total[rows, strata] = confusion.sum(axis=(1, 2))
+    scenario_correct[rows, strata] = np.trace(confusion, axis1=1, axis2=2)
+    blocks = {
+        'confusion': confusion.reshape(len(trials), n * n),
+        'transition_total': tensor.sum(axis=3).reshape(len(trials), n * n),
+        'transition_correct': tensor[:, :, np.arange(n), np.arange(n)].reshape(len(trials), n * n),
+        'scenario_total': scenario_total,
+        'scenario_correct': scenario_correct,
+    }
+    slices, start = {}, 0
+    for name, block in blocks.items():
+        slices[name] = slice(start, start + block.shape[1])
+        start += block.shape[1]
+    return np.hstack(list(blocks.values())).astype(np.float64), strata, scenarios, slices
+
+
+def trial_weights(strata, replicates, rng):
+    """Bobot resample (replikasi x file): jumlah kali setiap file terambil, per stratum."""
+    weights = np.zeros((replicates, len(strata)), dtype=np.float64)
+    for stratum in np.unique(strata):
+        members = np.flatnonzero(strata == stratum)
+        weights[:, members] = rng.multinomial(len(members), np.full(len(members), 1 / len(members)), size=replicates)
+    return weights
+
+
+def delay_replicates(values, replicates, rng):
+    """(rata-rata, minimum, maksimum) setiap replikasi resample kejadian tunda: array (3, replikasi)."""
+    sample = values[rng.integers(0, len(values), size=(replicates, len(values)))]
+    return np.stack([sample.mean(axis=1), sample.min(axis=1), sample.max(axis=1)])
+
+
+def _replicate_block(task):
+    counts, strata, delay_groups, replicates, seed = task
+    rng = np.random.default_rng(seed)
+    totals = trial_weights(strata, replicates, rng) @ counts
+    delays = {key: delay_replicates(values, replicates, rng) for key, values in delay_groups.items()}
+    return totals, delays
+
+
+def bootstrap_replicates(counts, strata, delay_groups, replicates=DEFAULT_REPLICATES, seed=DEFAULT_SEED, workers=None):
+    """
+    Semua replikasi bootstrap: (hitungan per replikasi, dict kunci -> statistik
+    tunda per replikasi). delay_groups memetakan kunci ke array nilai tunda.
+    """
+    sizes = [BLOCK_REPLICATES] * (replicates // BLOCK_REPLICATES)
+    if replicates % BLOCK_REPLICATES:
+        sizes.append(replicates % BLOCK_REPLICATES)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(counts, strata, delay_groups, size, block_seed) for size, block_seed in zip(sizes, seeds)]
+    workers = min((os.cpu_count() or 1) if workers is None else workers, len(tasks))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            outcomes = list(pool.map(_replicate_block, tasks))
+    else:
+        outcomes = [_replicate_block(task) for task in tasks]
+    totals = np.vstack([totals for totals, _ in outcomes])
+    delays = {key: np.hstack([block[key] for _, block in outcomes]) for key in delay_groups}
+    return totals, delays
+
+
+def _ratio(numerator, denominator):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator > 0, numerator / denominator, np.nan)
+
+
+def _interval(point, replicates, confidence):
+    alpha = (1 - confidence) / 2 * 100
+    if np.isnan(replicates).all():
+        return point, np.nan, np.nan
+    lower, upper = np.nanpercentile(replicates, [alpha, 100 - alpha])
+    return point, lower, upper
+
+
+def accuracy_statistics(totals, result, scenarios, slices):
+    """
+    Angka akurasi sebagai dict (kelompok, nama, metrik) -> nilai per baris
+    totals (kolom sesuai trial_count_matrix). Angka tanpa data bernilai NaN.
+    """
+    n = len(result['vocabulary'])
+    vocabulary = result['vocabulary']
+    confusion = totals[:, slices['confusion']].reshape(-1, n, n)
+    stats = {}
+    diagonal = confusion[:, np.arange(n), np.arange(n)]
+    stats[('Keseluruhan', 'Semua Data', 'Akurasi')] = _ratio(diagonal.sum(axis=1), confusion.sum(axis=(1, 2)))
+
+    support = confusion.sum(axis=2)
+    predicted = confusion.sum(axis=1)
+    for code in sorted(range(n), key=result['label_names'].__getitem__):
+        label = result['label_names'][code]
+        recall = _ratio(diagonal[:, code], support[:, code])
+        precision = _ratio(diagonal[:, code], predicted[:, code])
+        stats[('Per Kelas', label, 'Recall (Akurasi Kelas)')] = recall
+        stats[('Per Kelas', label, 'Precision')] = precision
+        stats[('Per Kelas', label, 'F1-Score')] = _ratio(2 * precision * recall, precision + recall)
+
+    transition_total = totals[:, slices['transition_total']].reshape(-1, n, n)
+    transition_correct = totals[:, slices['transition_correct']].reshape(-1, n, n)
+    keys = {}
+    for code_from in range(n):
+        for code_to in range(n):
+            if code_from != code_to:
+                keys.setdefault(vocabulary.transition_key(code_from, code_to), []).append((code_from, code_to))
+    for key in sorted(keys):
+        index = tuple(np.array(keys[key]).T)
+        total = transition_total[:, index[0], index[1]].sum(axis=1)
+        stats[('Per Transisi', key, 'Akurasi')] = _ratio(transition_correct[:, index[0], index[1]].sum(axis=1), total)
+    stats[('Per Transisi', 'Total', 'Akurasi')] = _ratio(transition_correct.sum(axis=(1, 2)), transition_total.sum(axis=(1, 2)))
+
+    scenario_total = totals[:, slices['scenario_total']]
+    scenario_correct = totals[:, slices['scenario_correct']]
+    for i, scenario in enumerate(scenarios):
+        stats[('Per Skenario', scenario, 'Akurasi')] = _ratio(scenario_correct[:, i], scenario_total[:, i])
+    return stats
+
+
+def delay_groups(result):
+    """Nilai tunda per jenis transisi ('Dari ... ke ...'): dict (kunci, satuan) -> array, satuan 'baris data' atau 'detik'."""
+    delays = result['delays']
+    groups = {}
+    if delays.empty:
+        return groups
+    label_from, label_to = delay_label_names(delays, result['label_names'])
+    keys = ('Dari ' + label_from + ' ke ' + label_to).to_numpy()
+    for key in pd.unique(keys):
+        selected = delays[keys == key]
+        groups[(key, 'baris data')] = selected['delay_rows'].to_numpy(dtype=float)
+        seconds = selected['delay_seconds'].dropna().to_numpy(dtype=float)
+        if len(seconds):
+            groups[(key, 'detik')] = seconds
+    return groups
+
+
+def bootstrap_intervals(result, replicates=DEFAULT_REPLICATES, confidence=DEFAULT_CONFIDENCE, seed=DEFAULT_SEED, workers=None):
+    """
+    Tabel interval kepercayaan (persentil) untuk semua angka akurasi dan
+    waktu tunda hasil evaluate_dataset. Akurasi dalam persen, tunda dalam
+    satuannya. 'Jumlah Sampel' adalah jumlah file (akurasi) atau jumlah
+    kejadian transisi (tunda) yang di-resample.
+    """
+    counts, strata, scenarios, slices = trial_count_matrix(result)
+    groups = delay_groups(result)
+    totals, delays = bootstrap_replicates(counts, strata, groups, replicates, seed, workers)
+    point = accuracy_statistics(counts.sum(axis=0, keepdims=True), result, scenarios, slices)
+    replicated = accuracy_statistics(totals, result, scenarios, slices)
+
+    rows = []
+    for (group, name, metric), values in point.items():
+        if np.isnan(values[0]):
+            continue
+        value, lower, upper = _interval(values[0], replicated[(group, name, metric)], confidence)
+        if group == 'Per Skenario':
+            size = int(np.count_nonzero(strata == scenarios.index(name)))
+        else:
+            size = len(strata)
+        rows.append([group, name, metric, value * 100, lower * 100, upper * 100, size])
+    for (key, unit), values in groups.items():
+        for i, metric in enumerate(['Rata-rata', 'Minimum', 'Maksimum']):
+            point_value = [values.mean(), values.min(), values.max()][i]
+            rows.append([f"Waktu Tunda ({unit})", key, metric, *_interval(point_value, delays[(key, unit)][i], confidence), len(values)])
+    table = pd.DataFrame(rows, columns=INTERVAL_COLUMNS)
+    for column in ('Nilai', 'Batas Bawah', 'Batas Atas'):
+        table[column] = table[column].astype(float).round(3)
+    return table
+
+
+def write_intervals(result, folder, replicates=DEFAULT_REPLICATES, confidence=DEFAULT_CONFIDENCE, seed=DEFAULT_SEED, workers=None):
+    """Menghitung, mencetak dan menulis interval_kepercayaan.csv ke folder output dataset."""
+    print(f"\n--- Interval Kepercayaan Bootstrap {confidence * 100:g}% ({replicates} replikasi) ---")
+    table = bootstrap_intervals(result, replicates, confidence, seed, workers)
+    print(table.to_string(index=False))
+    os.makedirs(folder, exist_ok=True)
+    table.to_csv(os.path.join(folder, BOOTSTRAP_FILE), index=False)
+    print(f"\nLaporan '{BOOTSTRAP_FILE}' berhasil dibuat di folder '{folder}'!")
+    return table
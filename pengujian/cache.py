@@ -0,0 +1,198 @@
+"""
+Cache kolumnar untuk file CSV percobaan yang sudah di-parse.
+
+Setiap file CSV disimpan sebagai satu entri: satu file biner mentah per kolom
+(angka dengan dtype aslinya, Timestamp sebagai int64 nanodetik, kolom teks
+termasuk label sebagai kode int32 + daftar kategori) dan meta.json. Kunci entri
+adalah path absolut, ukuran dan mtime file sumber sehingga file yang berubah
+otomatis tidak cocok lagi. Run berikutnya membuka kolom dengan numpy.memmap
+tanpa mem-parse teks. Total ukuran cache dibatasi; entri yang paling lama tidak
+dipakai dihapus lebih dulu (LRU).
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CACHE_DIR = '.pengujian_cache'
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+CACHE_VERSION = 1
+META_FILE = 'meta.json'
+_EVICT_LOCK = threading.Lock()
+
+
+def _column_file(index):
+    return f"kolom_{index}.bin"
+
+
+class TrialCache:
+    """Cache kolumnar di folder directory dengan batas ukuran max_bytes."""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, path):
+        stat = os.stat(path)
+        source = f"{CACHE_VERSION}|{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+    def _entry_dir(self, key):
+        return os.path.join(self.directory, key)
+
+    def load(self, path):
+        """
+        Mengembalikan dict nama kolom -> array (memmap) untuk path, atau None jika
+        tidak ada entri yang cocok dengan ukuran dan mtime file saat ini.
+        """
+        entry = self._entry_dir(self.key(path))
+        meta_path = os.path.join(entry, META_FILE)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        os.utime(meta_path)
+
+        columns = {}
+        for i, col in enumerate(meta['columns']):
+            if meta['rows'] == 0:
+                data = np.empty(0, dtype=col['dtype'])
+            else:
+                data = np.memmap(os.path.join(entry, _column_file(i)), dtype=col['dtype'], mode='r', shape=(meta['rows'],))
+            if col['kind'] == 'datetime':
+                data = data.view('datetime64[ns]')
+            elif col['kind'] == 'category':
+                data = pd.Categorical.from_codes(data, categories=col['categories'], validate=False)
+            columns[col['name']] = data
+        return columns
+
+    def writer(self, path):
+        """CacheWriter untuk mengisi entri path potongan demi potongan."""
+        return CacheWriter(self, path)
+
+    def entries(self):
+        """Daftar (waktu terakhir dipakai, ukuran byte, folder) semua entri."""
+        result = []
+        if not os.path.isdir(self.directory):
+            return result
+        for name in os.listdir(self.directory):
+            entry = os.path.join(self.directory, name)
+            # Folder tmp_ masih ditulis (atau sedang di-rename) oleh pemuat lain.
+            if name.startswith('tmp_') or not os.path.isdir(entry):
+                continue
+            meta_path = os.path.join(entry, META_FILE)
+            try:
+                size = sum(os.path.getsize(os.path.join(entry, f)) for f in os.listdir(entry))
+                result.append((os.path.getmtime(meta_path), size, entry))
+            except FileNotFoundError:
+                # Belum di-commit, atau dihapus pemuat lain di tengah jalan.
+                continue
+        return result
+
+    def evict(self):
+        """Menghapus entri yang paling lama tidak dipakai sampai total <= max_bytes."""
+        # Entri bisa di-commit dari beberapa thread pemuat sekaligus.
+        with _EVICT_LOCK:
+            entries = sorted(self.entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry in entries:
+                if total <= self.max_bytes:
+                    break
+                shutil.rmtree(entry, ignore_errors=True)
+                total -= size
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class CacheWriter:
+    """
+    Menulis satu entri cache secara bertahap. Entri baru terlihat setelah
+    commit(); jika dtype kolom berubah di tengah file entri dibatalkan diam-diam.
+    """
+
+    def __init__(self, cache, path):
+        self.cache = cache
+        self.key = cache.key(path)
+        os.makedirs(cache.directory, exist_ok=True)
+        self.tmp_dir = tempfile.mkdtemp(prefix='tmp_', dir=cache.directory)
+        self.columns = None
+        self.files = []
+        self.rows = 0
+        self.failed = False
+
+    def append(self, columns):
+        if self.failed:
+            return
+        if self.columns is None:
+            self.columns = []
+            for i, (name, data) in enumerate(columns.items()):
+                if isinstance(data, pd.Categorical):
+                    col = {'name': name, 'kind': 'category', 'dtype': 'int32', 'categories': [], 'lookup': {}}
+                elif np.issubdtype(data.dtype, np.datetime64):
+                    col = {'name': name, 'kind': 'datetime', 'dtype': 'int64'}
+                else:
+                    col = {'name': name, 'kind': 'numeric', 'dtype': data.dtype.str}
+                self.columns.append(col)
+                self.files.append(open(os.path.join(self.tmp_dir, _column_file(i)), 'wb'))
+        if [col['name'] for col in self.columns] != list(columns):
+            self.abort()
+            return
+
+        for col, f, data in zip(self.columns, self.files, columns.values()):
+            if col['kind'] == 'category':
+                if not isinstance(data, pd.Categorical):
+                    self.abort()
+                    return
+                mapping = np.array([col['lookup'].setdefault(c, len(col['lookup'])) for c in data.categories] + [-1], dtype=np.int32)
+                # Kode -1 (nilai kosong) jatuh ke elemen terakhir mapping, yaitu -1.
+                f.write(mapping[data.codes].tobytes())
+            elif col['kind'] == 'datetime':
+                if data.dtype != np.dtype('datetime64[ns]'):
+                    self.abort()
+                    return
+                f.write(np.ascontiguousarray(data).view(np.int64).tobytes())
+            else:
+                if data.dtype.str != col['dtype']:
+                    self.abort()
+                    return
+                f.write(np.ascontiguousarray(data).tobytes())
+        self.rows += len(next(iter(columns.values()))) if columns else 0
+
+    def _close_files(self):
+        for f in self.files:
+            f.close()
+        self.files = []
+
+    def abort(self):
+        self.failed = True
+        self._close_files()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def commit(self):
+        if self.failed:
+            return
+        self._close_files()
+        columns = []
+        for col in self.columns or []:
+            col = dict(col)
+            if col['kind'] == 'category':
+                col['categories'] = list(col.pop('lookup'))
+            columns.append(col)
+        meta = {'version': CACHE_VERSION, 'rows': self.rows, 'columns': columns}
+        with open(os.path.join(self.tmp_dir, META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        entry = self.cache._entry_dir(self.key)
+        shutil.rmtree(entry, ignore_errors=True)
+        try:
+            os.replace(self.tmp_dir, entry)
+        except OSError:
+            shutil.rmtree(self.tmp_dir, ignore_errors=True)
+            return
+        self.cache.evict()
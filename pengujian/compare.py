@@ -0,0 +1,204 @@
+"""
+Perbandingan semua ukuran window dalam satu pemanggilan.
+
+Setiap root hasil_pengujian_* dievaluasi dengan evaluate_dataset yang sama,
+satu proses pekerja (spawn) per root, tanpa menulis laporan per dataset.
+Pekerja hanya mengembalikan ringkasan kecil: confusion matrix, nama kelas
+kanonik dan kejadian waktu tunda dalam dua satuan (detik dan sampel), sehingga
+10ws-25ws (skema sistem) dan 50ws (skema percobaan) dibandingkan dengan kolom
+yang sama. Hasilnya satu tabel dan satu grafik akurasi, F1 per kelas dan
+persentil waktu tunda terhadap ukuran window:
+
+    python -m pengujian --compare-windows
+"""
+import contextlib
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .config import load_config, select_datasets
+from .engine import evaluate_dataset
+from .metrics import classification_metrics, sorted_confusion
+from .render import FigureRenderer
+from .report import ORDERED_TRANSITIONS
+from .timing import stage
+
+COMPARISON_FOLDER = 'perbandingan_ukuran_window'
+COMPARISON_FILE = 'perbandingan_ukuran_window.csv'
+DELAY_COMPARISON_FILE = 'perbandingan_waktu_tunda.csv'
+COMPARISON_FIGURE = 'perbandingan_ukuran_window.png'
+DELAY_PERCENTILES = (50, 90, 95)
+DELAY_UNITS = {'detik': 'delay_seconds', 'sampel': 'delay_rows'}
+
+
+def summarize_result(result):
+    """
+    Ringkasan hasil evaluate_dataset untuk perbandingan: kelas dan transisi
+    memakai nama kanonik (LabelVocabulary.display_name/transition_key) agar
+    sama untuk semua skema. Kelas yang tidak pernah muncul dibuang.
+    """
+    vocabulary = result['vocabulary']
+    confusion, classes = sorted_confusion(result['confusion'], result['display_names'])
+    delays = result['delays']
+    keys = [vocabulary.transition_key(f, t) for f, t in zip(delays['code_from'], delays['code_to'])]
+    return {
+        'name': result['dataset']['name'],
+        'window': result['dataset']['window_size'],
+        'schema': result['dataset']['schema'],
+        'files': result['files'],
+        'classes': classes,
+        'confusion': confusion,
+        'delays': pd.DataFrame({
+            'transition': keys,
+            'delay_rows': delays['delay_rows'].to_numpy(dtype=float),
+            'delay_seconds': delays['delay_seconds'].to_numpy(dtype=float),
+        }),
+    }
+
+
+def summarize_window(dataset, base_dir='.', **options):
+    """
+    Mengevaluasi satu root dan mengembalikan (ringkasan atau None, keluaran
+    cetak evaluasi). Keluaran ditampung agar log pekerja paralel tidak saling
+    bertumpuk dan dicetak induk sesuai urutan dataset.
+    """
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        result = evaluate_dataset(dataset, base_dir, max_mismatch_rows=0, collect_rows=False, **options)
+    return (summarize_result(result) if result['files'] else None), log.getvalue()
+
+
+def _summarize_task(task):
+    try:
+        dataset, base_dir, options = task
+        return summarize_window(dataset, base_dir, **options), None
+    except Exception as e:
+        return None, e
+
+
+def _percentiles(values):
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return [np.nan] * len(DELAY_PERCENTILES)
+    return list(np.percentile(values, DELAY_PERCENTILES))
+
+
+def _delay_columns(delays):
+    row = {}
+    for unit, column in DELAY_UNITS.items():
+        values = delays[column].to_numpy(dtype=float)
+        for percentile, value in zip(DELAY_PERCENTILES, _percentiles(values)):
+            row[f"Tunda P{percentile} ({unit})"] = round(value, 3 if unit == 'detik' else 2)
+    return row
+
+
+def build_comparison_table(summaries):
+    """
+    Satu baris per ukuran window (urut naik): akurasi, F1 per kelas, macro F1
+    dan persentil waktu tunda semua transisi dalam detik dan sampel.
+    """
+    classes = list(dict.fromkeys(name for summary in summaries for name in sorted(summary['classes'])))
+    rows = []
+    for summary in sorted(summaries, key=lambda s: s['window']):
+        metrics = classification_metrics(summary['confusion'])
+        f1 = dict(zip(summary['classes'], metrics['f1-score']))
+        rows.append({
+            'Ukuran Window': summary['window'],
+            'Dataset': summary['name'],
+            'Jumlah File': summary['files'],
+            'Total Data': metrics['total'],
+            'Akurasi (%)': round(metrics['accuracy'] * 100, 2),
+            **{f"F1 {name}": round(f1[name], 4) if name in f1 else np.nan for name in classes},
+            'Macro F1': round(metrics['macro avg']['f1-score'], 4),
+            'Transisi Terdeteksi': len(summary['delays']),
+            **_delay_columns(summary['delays']),
+        })
+    return pd.DataFrame(rows)
+
+
+def build_delay_comparison_table(summaries):
+    """Persentil waktu tunda per ukuran window dan jenis transisi ('Arc ke Normal', ...)."""
+    rows = []
+    for summary in sorted(summaries, key=lambda s: s['window']):
+        delays = summary['delays']
+        known = [key for key in ORDERED_TRANSITIONS if key in set(delays['transition'])]
+        for key in known + sorted(set(delays['transition']) - set(known)):
+            selected = delays[delays['transition'] == key]
+            rows.append({
+                'Ukuran Window': summary['window'],
+                'Dataset': summary['name'],
+                'Jenis Transisi': key,
+                'Jumlah': len(selected),
+                **_delay_columns(selected),
+            })
+    return pd.DataFrame(rows)
+
+
+def compare_windows(datasets, base_dir='.', *, workers=None, manifest=None, **options):
+    """
+    Ringkasan semua dataset, satu proses pekerja per root jika workers > 1
+    (bawaan: jumlah CPU, paling banyak jumlah dataset). Manifest hanya dipakai
+    tanpa proses pekerja karena indeksnya ditulis oleh satu proses saja.
+    options diteruskan ke evaluate_dataset.
+    """
+    workers = min((os.cpu_count() or 1) if workers is None else workers, len(datasets))
+    if workers > 1:
+        tasks = [(dataset, base_dir, options) for dataset in datasets]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            outcomes = list(pool.map(_summarize_task, tasks))
+    else:
+        outcomes = [_summarize_task((dataset, base_dir, dict(options, manifest=manifest))) for dataset in datasets]
+
+    summaries = []
+    for dataset, (outcome, error) in zip(datasets, outcomes):
+        if error is not None:
+            print(f"Error saat mengevaluasi dataset '{dataset['name']}': {error}")
+            continue
+        summary, log = outcome
+        print(log, end='')
+        if summary is None:
+            print(f"\nTidak ada file yang diproses untuk {dataset['name']}.")
+            continue
+        summaries.append(summary)
+    return summaries
+
+
+def comparison_folder(base_dir='.', output_root=None):
+    """Folder laporan perbandingan: <output_root>/perbandingan_ukuran_window atau di base_dir."""
+    return os.path.join(base_dir if output_root is None else output_root, COMPARISON_FOLDER)
+
+
+def run_comparison(names=None, *, config_path=None, base_dir='.', output_root=None, workers=None, figures=True, **options):
+    """
+    Membandingkan semua dataset (atau yang dipilih lewat names): mencetak dan
+    menulis perbandingan_ukuran_window.csv, perbandingan_waktu_tunda.csv dan
+    grafiknya. options diteruskan ke compare_windows. Mengembalikan tabel
+    perbandingan per ukuran window.
+    """
+    datasets = select_datasets(load_config(config_path), names)
+    summaries = compare_windows(datasets, base_dir, workers=workers, **options)
+    if not summaries:
+        print("\nTidak ada dataset yang dapat dibandingkan.")
+        return pd.DataFrame()
+
+    with stage('report_build'):
+        table = build_comparison_table(summaries)
+        delay_table = build_delay_comparison_table(summaries)
+    folder = comparison_folder(base_dir, output_root)
+    os.makedirs(folder, exist_ok=True)
+    print(f"\n--- Perbandingan Ukuran Window: {', '.join(str(w) for w in table['Ukuran Window'])} ---")
+    print(table.to_string(index=False))
+    table.to_csv(os.path.join(folder, COMPARISON_FILE), index=False)
+    print(f"\nLaporan '{COMPARISON_FILE}' berhasil dibuat di folder '{folder}'!")
+    if not delay_table.empty:
+        print("\n--- Persentil Waktu Tunda per Jenis Transisi ---")
+        print(delay_table.to_string(index=False))
+        delay_table.to_csv(os.path.join(folder, DELAY_COMPARISON_FILE), index=False)
+        print(f"\nLaporan '{DELAY_COMPARISON_FILE}' berhasil dibuat di folder '{folder}'!")
+    with FigureRenderer(figures, workers=1) as renderer:
+        renderer.window_comparison(table, os.path.join(folder, COMPARISON_FIGURE), 'Perbandingan Ukuran Window')
+    return table
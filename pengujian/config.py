@@ -0,0 +1,170 @@
+import json
+import os
+
+# Skema kolom untuk setiap format file hasil pengujian.
+# 'sistem'    : file kebenaran (akurasi 100) dan file output sistem terpisah (10ws, 20ws, 25ws)
+# 'percobaan' : satu file berisi output aktual dan output yang diharapkan (50ws)
+SCHEMAS = {
+    'sistem': {
+        'truth_column': 'Hasil_Prediksi',
+        'pred_column': 'Hasil_Prediksi',
+        'time_column': 'Timestamp',
+        'paired_files': True,
+        # Kebenaran dan prediksi dipasangkan menurut waktu dengan toleransi ini
+        # (detik); baris yang hilang atau ganda di salah satu file tidak menggeser sisanya.
+        'align_tolerance': 0.05,
+        # Sinyal mentah dan ddof simpangan baku fitur rolling perangkat (sweep).
+        'voltage_column': 'Tegangan_V',
+        'current_column': 'Arus_A',
+        'std_ddof': 1,
+        # Fitur rolling yang dicatat perangkat (pengujian.integrity).
+        'feature_columns': {'mean_v': 'Mean_V', 'std_v': 'Std_Dev_V', 'mean_i': 'Mean_I', 'std_i': 'Std_Dev_I'},
+    },
+    'percobaan': {
+        'truth_column': 'Output Sistem yang Diharapkan',
+        'pred_column': 'Output Sistem Aktual',
+        'time_column': 'Waktu Relatif (detik)',
+        'paired_files': False,
+        'voltage_column': 'Tegangan (V)',
+        'current_column': 'Arus (A)',
+        'std_ddof': 0,
+        'feature_columns': {
+            'mean_v': 'Mean Tegangan (V)',
+            'std_v': 'Std Dev Tegangan (V)',
+            'mean_i': 'Mean Arus (A)',
+            'std_i': 'Std Dev Arus (A)',
+        },
+        'label_names': {
+            'NORMAL': 'Status: Normal',
+            'ARC FLASH': 'Status: Arc Flash',
+            'NO CONTACT': 'Status: Off Contact',
+        },
+    },
+}
+
+DATASETS = [
+    {
+        'name': '10ws',
+        'window_size': 10,
+        'root': 'hasil_pengujian_10ws',
+        'schema': 'sistem',
+        'scenarios': [
+            {
+                'truth_folder': 'akurasi 100 normal ke arc ke off dari sistem',
+                'truth_prefix': 'normal arc off dari sistem',
+                'pred_folder': 'normal ke arc ke off dari sistem',
+                'pred_prefix': 'normal arc off dari sistem',
+            },
+            {
+                'truth_folder': 'akurasi 100 off ke arc ke normal dari sistem',
+                'truth_prefix': 'off arc normal dari sistem',
+                'pred_folder': 'off ke arc ke normal dari sistem',
+                'pred_prefix': 'off arc normal dari sistem',
+            },
+        ],
+        'output': {'folder': 'output pengujian', 'format': 'laporan_lengkap'},
+    },
+    {
+        'name': '20ws',
+        'window_size': 20,
+        'root': 'hasil_pengujian_20ws',
+        'schema': 'sistem',
+        'scenarios': [
+            {
+                'truth_folder': 'akurasi 100 normal ke arc ke off dari sistem',
+                'truth_prefix': 'normal arc off dari sistem',
+                'pred_folder': 'normal ke arc ke off dari sistem',
+                'pred_prefix': 'normal arc off dari sistem',
+            },
+            {
+                'truth_folder': 'akurasi 100 off contact ke arc ke normal',
+                'truth_prefix': 'off arc normal dari sistem',
+                'pred_folder': 'off ke arc ke normal dari sistem',
+                'pred_prefix': 'off arc normal dari sistem',
+            },
+        ],
+        'output': {'folder': 'output pengujian', 'format': 'laporan_lengkap'},
+    },
+    {
+        'name': '25ws',
+        'window_size': 25,
+        'root': 'hasil_pengujian_25ws',
+        'schema': 'sistem',
+        'scenarios': [
+            {
+                'truth_folder': 'akurasi 100 normal ke arc flash ke off contact',
+                'truth_prefix': 'akurasi 100 normal ke arc flash ke off contact',
+                'pred_folder': 'normal ke arc flash ke off contact',
+                'pred_prefix': 'normal ke arc flash ke off contact',
+            },
+            {
+                'truth_folder': 'akurasi100 off contact ke arc ke normal',
+                'truth_prefix': 'akurasi100 off contact ke arc ke normal',
+                'pred_folder': 'mentah fix off contact ke arc ke normal',
+                'pred_prefix': 'mentah fix off contact ke arc ke normal',
+            },
+        ],
+        'output': {'folder': 'output pengujian', 'format': 'laporan_lengkap'},
+    },
+    {
+        'name': '50ws',
+        'window_size': 50,
+        'root': 'hasil_pengujian_50ws',
+        'schema': 'percobaan',
+        'scenarios': [
+            {'name': 'Arc_ke_Normal', 'folder': 'Arc_ke_Normal', 'prefix': 'percobaan_'},
+            {'name': 'Arc_ke_Off', 'folder': 'Arc_ke_Off', 'prefix': 'percobaan_'},
+            {'name': 'Normal_ke_Arc', 'folder': 'Normal_ke_Arc', 'prefix': 'percobaan_'},
+            {'name': 'Off_ke_Arc', 'folder': 'Off_ke_Arc', 'prefix': 'percobaan_'},
+        ],
+        'output': {'folder': 'output_pengujian', 'format': 'laporan_csv'},
+    },
+]
+
+
+# Classifier ambang untuk sweep ukuran window (pengujian.sweep) atas fitur
+# rolling mean_v, std_v, mean_i, std_i. Aturan dicek berurutan dan label aturan
+# pertama yang cocok dipakai; jika tidak ada yang cocok dipakai 'default'.
+# Ambang ini mereproduksi 91-97% prediksi perangkat pada data yang ada.
+THRESHOLD_CLASSIFIER = {
+    'rules': [
+        {'label': 'NO CONTACT', 'feature': 'mean_v', 'op': '<', 'value': 30.0},
+        {'label': 'ARC FLASH', 'feature': 'std_v', 'op': '>', 'value': 40.0},
+        {'label': 'ARC FLASH', 'feature': 'mean_i', 'op': '<', 'value': 0.05},
+    ],
+    'default': 'NORMAL',
+}
+
+
+def load_config(path=None):
+    """
+    Membaca daftar dataset dari file JSON berformat {"datasets": [...]}.
+    Tanpa path, konfigurasi bawaan (DATASETS) yang dipakai.
+    """
+    if path is None:
+        return [dict(ds) for ds in DATASETS]
+    with open(path, encoding='utf-8') as f:
+        config = json.load(f)
+    datasets = config['datasets'] if isinstance(config, dict) else config
+    for ds in datasets:
+        if ds.get('schema') not in SCHEMAS:
+            raise ValueError(f"Skema '{ds.get('schema')}' pada dataset '{ds.get('name')}' tidak dikenal.")
+    return datasets
+
+
+def select_datasets(datasets, names=None):
+    """Memilih dataset berdasarkan nama ('10ws', '50ws', ...); None berarti semua."""
+    if not names:
+        return list(datasets)
+    known = {ds['name']: ds for ds in datasets}
+    missing = [n for n in names if n not in known]
+    if missing:
+        raise ValueError(f"Dataset tidak dikenal: {', '.join(missing)}")
+    return [known[n] for n in names]
+
+
+def output_folder(dataset, base_dir='.', output_root=None):
+    """Folder output laporan untuk satu dataset."""
+    if output_root is not None:
+        return os.path.join(output_root, dataset['name'])
+    return os.path.join(base_dir, dataset['root'], dataset['output']['folder'])
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from .rle import delays_from_runs
+
+DELAY_COLUMNS = ['code_from', 'code_to', 'truth_index', 'pred_index', 'delay_rows', 'delay_seconds']
+
+
+def _seconds_between(later, earlier):
+    diff = later - earlier
+    if np.issubdtype(diff.dtype, np.timedelta64):
+        return diff / np.timedelta64(1, 's')
+    return diff.astype(float)
+
+
+def transition_delays(truth_runs, pred_runs, truth_time=None, pred_time=None):
+    """
+    Menghitung waktu tunda deteksi untuk setiap transisi label kebenaran: jarak
+    dari baris transisi ke baris pertama (di posisi yang sama atau sesudahnya)
+    yang prediksinya sudah sama dengan label tujuan. Pencarian dilakukan atas
+    run (lihat rle.delays_from_runs); label asal/tujuan berupa kode.
+
+    Mengembalikan DataFrame satu baris per transisi (kolom DELAY_COLUMNS); transisi
+    yang tidak pernah terdeteksi tidak dimasukkan. delay_seconds berisi NaN jika
+    kolom waktu tidak tersedia.
+    """
+    truth_run, starts, pred_index = delays_from_runs(truth_runs, pred_runs)
+    if truth_time is not None and pred_time is not None:
+        delay_seconds = _seconds_between(np.asarray(pred_time)[pred_index], np.asarray(truth_time)[starts])
+    else:
+        delay_seconds = np.full(len(starts), np.nan)
+
+    return pd.DataFrame({
+        'code_from': truth_runs.codes[truth_run - 1],
+        'code_to': truth_runs.codes[truth_run],
+        'truth_index': starts,
+        'pred_index': pred_index,
+        'delay_rows': pred_index - starts,
+        'delay_seconds': delay_seconds,
+    }, columns=DELAY_COLUMNS)
+
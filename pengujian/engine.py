@@ -0,0 +1,303 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from .bootstrap import write_intervals
+from .config import SCHEMAS, load_config, output_folder, select_datasets
+from .export import DEFAULT_EXCEL_ROWS, MismatchSpill
+from .delays import DELAY_COLUMNS
+from .labels import LabelVocabulary
+from .loader import (DEFAULT_IO_WORKERS, announce_scenario, discover_trials, iter_prefetched, iter_trial_chunks,
+                     load_trial_columns, report_orphans)
+from .render import FigureRenderer
+from .rle import transition_totals
+from .report import KOLOM_LAPORAN_KESALAHAN, MISMATCH_REPORT_FORMATS, REPORT_WRITERS, build_metrics_summary
+from .streaming import TrialAccumulator, grow_square
+from .timing import count_rows, stage
+
+ALIGNMENT_FILE = 'penyelarasan_waktu.csv'
+
+
+def transition_counts(tensor, vocabulary):
+    """Total dan prediksi benar per kunci transisi ('Arc ke Normal', ...) dari tensor confusion per transisi."""
+    totals, correct = transition_totals(tensor)
+    counts = {}
+    for code_from, code_to in zip(*np.nonzero(totals)):
+        key = vocabulary.transition_key(code_from, code_to)
+        entry = counts.setdefault(key, {'total': 0, 'benar': 0})
+        entry['total'] += int(totals[code_from, code_to])
+        entry['benar'] += int(correct[code_from, code_to])
+    return counts
+
+
+def merge_trial(result, scenario, source, partial, spill=None, max_rows=None, paths=None):
+    """
+    Menggabungkan hasil parsial satu percobaan ke hasil dataset. Baris mismatch
+    ditulis ke spill (export.MismatchSpill) jika ada; di memori hanya disimpan
+    max_rows baris pertama (None berarti semua). Segmen kesalahan dicatat
+    beserta paths (file kebenaran, file prediksi) untuk membaca baris mentahnya.
+    """
+    vocabulary = result['vocabulary']
+    n = len(vocabulary)
+    cm = grow_square(partial['confusion'], n)
+    result['confusion'] = grow_square(result['confusion'], n) + cm
+
+    counts = result['scenario_counts'].setdefault(scenario, {'total': 0, 'benar': 0})
+    counts['total'] += int(cm.sum())
+    counts['benar'] += int(np.trace(cm))
+
+    result['transition_confusion'] = grow_square(result['transition_confusion'], n) + grow_square(partial['transition_confusion'], n)
+    result['trials'].append({'scenario': scenario, 'source': source, 'confusion': cm,
+                             'transition_confusion': partial['transition_confusion']})
+
+    delays = partial['delays']
+    if not delays.empty:
+        delays = delays.copy()
+        delays.insert(0, 'source', source)
+        delays.insert(0, 'scenario', scenario)
+        result['delays'] = pd.concat([result['delays'], delays], ignore_index=True) if not result['delays'].empty else delays
+
+    segments = partial['mismatch_segments']
+    if not segments.empty:
+        truth_path, pred_path = paths or (source, source)
+        segments = segments.assign(source=source, truth_path=truth_path, pred_path=pred_path)
+        result['mismatch_segments'].append(segments)
+        result['mismatch_rows'] += int(segments['count'].sum())
+
+    names = vocabulary.output_names(SCHEMAS[result['dataset']['schema']])
+    for mismatched_data in partial['mismatches']:
+        mismatched_data['Label_Seharusnya'] = vocabulary.categorical(mismatched_data['Label_Seharusnya'], names)
+        mismatched_data['Prediksi_Model'] = vocabulary.categorical(mismatched_data['Prediksi_Model'], names)
+        mismatched_data['Sumber_File'] = source
+        if spill is not None:
+            with stage('mismatch_spill'):
+                spill.append(mismatched_data)
+                count_rows(len(mismatched_data))
+        kept = sum(len(df) for df in result['mismatches'])
+        if max_rows is None or kept + len(mismatched_data) <= max_rows:
+            result['mismatches'].append(mismatched_data)
+        elif kept < max_rows:
+            result['mismatches'].append(mismatched_data.iloc[:max_rows - kept])
+    result['rows'] += partial['rows']
+    result['invalid_time_rows'] += partial['invalid_time_rows']
+    result['files'] += 1
+
+
+def alignment_tolerance(dataset, align_tolerance=None, positional=False):
+    """
+    Toleransi penyelarasan waktu (detik) untuk dataset: align_tolerance jika
+    diberikan, selain itu bawaan skema; None (perbandingan per posisi baris)
+    untuk skema satu file atau jika positional.
+    """
+    schema = SCHEMAS[dataset['schema']]
+    if positional or not schema['paired_files']:
+        return None
+    return align_tolerance if align_tolerance is not None else schema.get('align_tolerance')
+
+
+def evaluate_dataset(dataset, base_dir='.', *, chunksize=None, cache=None, manifest=None, spill=None,
+                     max_mismatch_rows=None, collect_rows=True, align_tolerance=None, positional=False, io_workers=None):
+    """
+    Mengevaluasi semua percobaan satu dataset (satu ukuran window) dan
+    mengembalikan dict hasil yang dipakai bersama oleh semua format laporan.
+    chunksize membaca file bertahap (streaming); cache dan manifest melewatkan
+    parse CSV dan percobaan yang tidak berubah; spill menampung baris mismatch
+    di luar memori (hanya max_mismatch_rows baris pertama tetap di memori) dan
+    collect_rows=False hanya mencatat segmen kesalahan. align_tolerance dan
+    positional mengatur penyelarasan waktu, io_workers jumlah thread pemuat.
+    """
+    result = new_result(dataset, spill, alignment_tolerance(dataset, align_tolerance, positional))
+    tolerance = result['align_tolerance']
+    workers = DEFAULT_IO_WORKERS if io_workers is None else io_workers
+    prefetch = chunksize is None and workers > 1
+
+    def prepare(trial):
+        # Dijalankan di thread pemuat: hanya hash dan pembacaan file, tanpa
+        # menyentuh kosakata, agar kode label tetap mengikuti urutan percobaan.
+        _, truth_path, pred_path = trial
+        key = manifest.key(truth_path, pred_path, dataset['schema'], tolerance) if manifest is not None else None
+        if not prefetch or (manifest is not None and manifest.has(key, collect_rows)):
+            return key, None
+        return key, load_trial_columns(truth_path, pred_path, cache)
+
+    print(f"\n--- Memulai Pengujian Akurasi {dataset['name']} ({dataset['root']}) ---")
+    trials, orphans = discover_trials(dataset, base_dir)
+    report_orphans(orphans)
+    inputs = iter_prefetched(trials, prepare, workers) if prefetch else ((trial, None) for trial in trials)
+    current = None
+    for (scenario, truth_path, pred_path), future in inputs:
+        current = announce_scenario(scenario, current)
+        # Label baru dari file yang gagal tidak boleh masuk kosakata dataset.
+        vocabulary = result['vocabulary'].copy()
+        try:
+            with stage('trial', file=truth_path):
+                if future is None:
+                    key, preloaded = prepare((scenario, truth_path, pred_path))
+                else:
+                    with stage('load_wait'):
+                        key, preloaded = future.result()
+                partial = manifest.load(key, vocabulary, collect_rows) if manifest is not None else None
+                if partial is None:
+                    accumulator = TrialAccumulator(vocabulary, collect_rows)
+                    for chunk in iter_trial_chunks(truth_path, pred_path, dataset['schema'], vocabulary, chunksize, cache, tolerance,
+                                                   preloaded):
+                        accumulator.update(chunk)
+                    partial = accumulator.finish()
+                    if manifest is not None:
+                        manifest.store(key, partial, vocabulary, truth_path, pred_path, collect_rows)
+        except Exception as e:
+            print(f"Error saat memproses file '{truth_path}': {e}")
+            continue
+        if partial['invalid_time_rows']:
+            print(f"Peringatan: {partial['invalid_time_rows']} baris di '{truth_path}' memiliki waktu yang tidak dapat di-parse.")
+        if partial['unmatched_truth'] or partial['unmatched_pred']:
+            print(f"Peringatan: penyelarasan waktu '{truth_path}': {partial['unmatched_truth']} baris kebenaran dan "
+                  f"{partial['unmatched_pred']} baris prediksi tanpa pasangan (toleransi {tolerance} detik).")
+        if tolerance is not None:
+            result['alignment'].append({
+                'Skenario': scenario,
+                'Sumber_File': os.path.basename(truth_path),
+                'Baris Dievaluasi': partial['rows'],
+                'Kebenaran Tanpa Pasangan': partial['unmatched_truth'],
+                'Prediksi Tanpa Pasangan': partial['unmatched_pred'],
+            })
+        result['vocabulary'] = vocabulary
+        merge_trial(result, scenario, os.path.basename(truth_path), partial, spill, max_mismatch_rows, (truth_path, pred_path))
+    if manifest is not None:
+        manifest.flush()
+    if spill is not None:
+        spill.close()
+        if not spill.rows:
+            result['mismatch_spill'] = None
+
+    return finalize_result(result)
+
+
+def new_result(dataset, spill=None, align_tolerance=None, vocabulary=None):
+    """Hasil dataset kosong yang diisi merge_trial lalu ditutup finalize_result."""
+    return {
+        'dataset': dataset,
+        'vocabulary': LabelVocabulary() if vocabulary is None else vocabulary,
+        'confusion': np.zeros((0, 0), dtype=np.int64),
+        'scenario_counts': {},
+        'trials': [],
+        'transition_confusion': np.zeros((0, 0, 0), dtype=np.int64),
+        'delays': pd.DataFrame(columns=['scenario', 'source'] + DELAY_COLUMNS),
+        'mismatches': [],
+        'mismatch_segments': [],
+        'mismatch_rows': 0,
+        'mismatch_spill': spill.path if spill is not None else None,
+        'rows': 0,
+        'invalid_time_rows': 0,
+        'files': 0,
+        'align_tolerance': align_tolerance,
+        'alignment': [],
+    }
+
+
+def finalize_result(result):
+    """Melengkapi hasil dataset dengan nama label dan hitungan per transisi sesuai kosakata akhirnya."""
+    vocabulary = result['vocabulary']
+    result['label_names'] = vocabulary.output_names(SCHEMAS[result['dataset']['schema']])
+    result['display_names'] = [vocabulary.display_name(code) for code in range(len(vocabulary))]
+    result['confusion'] = grow_square(result['confusion'], len(vocabulary))
+    result['transition_confusion'] = grow_square(result['transition_confusion'], len(vocabulary))
+    result['transition_counts'] = transition_counts(result['transition_confusion'], vocabulary)
+    return result
+
+
+def write_reports(result, folder, renderer=None):
+    """
+    Menulis laporan sesuai format output yang dikonfigurasi untuk dataset.
+    Tanpa renderer, gambar PNG langsung dibuat sebelum fungsi ini kembali.
+    """
+    fmt = result['dataset']['output']['format']
+    if fmt not in REPORT_WRITERS:
+        raise ValueError(f"Format output '{fmt}' tidak dikenal.")
+    os.makedirs(folder, exist_ok=True)
+    if renderer is None:
+        with FigureRenderer() as renderer, stage('report_build'):
+            REPORT_WRITERS[fmt](result, folder, renderer)
+    else:
+        with stage('report_build'):
+            REPORT_WRITERS[fmt](result, folder, renderer)
+    if result['alignment']:
+        write_alignment_table(result, folder)
+
+
+def write_alignment_table(result, folder):
+    """Menulis penyelarasan_waktu.csv: jumlah baris yang dievaluasi dan tanpa pasangan per file."""
+    table = pd.DataFrame(result['alignment'])
+    table.to_csv(os.path.join(folder, ALIGNMENT_FILE), index=False)
+    unmatched = int(table['Kebenaran Tanpa Pasangan'].sum() + table['Prediksi Tanpa Pasangan'].sum())
+    print(f"\nLaporan '{ALIGNMENT_FILE}' ({unmatched} baris tanpa pasangan, toleransi {result['align_tolerance']} detik) "
+          f"berhasil dibuat di folder '{folder}'!")
+
+
+def open_spill(dataset, folder, fmt='csv'):
+    """
+    File spill detail kesalahan (detail_kesalahan.csv/.parquet) di folder output
+    untuk format laporan yang memuat detail kesalahan; None untuk format lain.
+    """
+    if dataset['output']['format'] not in MISMATCH_REPORT_FORMATS:
+        return None
+    return MismatchSpill(os.path.join(folder, f"detail_kesalahan.{fmt}"), fmt, KOLOM_LAPORAN_KESALAHAN)
+
+
+def run(names=None, *, config_path=None, base_dir='.', output_root=None, figures=True, render_workers=None,
+        spill_format='csv', excel_rows=DEFAULT_EXCEL_ROWS, collect_rows=True, bootstrap=None, **options):
+    """
+    Mengevaluasi dataset terpilih (semua jika names None) dan menulis laporannya;
+    PNG semua dataset digambar bersama di akhir, figures=False hanya menulis
+    CSV/Excel. excel_rows membatasi sheet 'Detail Kesalahan', sisanya ke file
+    spill berformat spill_format. bootstrap berisi argumen
+    bootstrap.write_intervals. options diteruskan ke evaluate_dataset.
+    Mengembalikan dict nama dataset -> hasil evaluasi.
+    """
+    datasets = select_datasets(load_config(config_path), names)
+    results = {}
+    with FigureRenderer(figures, render_workers) as renderer:
+        for dataset in datasets:
+            folder = output_folder(dataset, base_dir, output_root)
+            spill = open_spill(dataset, folder, spill_format)
+            if spill is not None and not collect_rows:
+                # Tanpa baris mentah tidak ada spill; file spill lama dihapus.
+                spill.close()
+                spill = None
+            result = evaluate_dataset(dataset, base_dir, spill=spill, max_mismatch_rows=excel_rows,
+                                      collect_rows=collect_rows, **options)
+            if result['files'] == 0:
+                print(f"\nTidak ada file yang diproses untuk {dataset['name']}.")
+                continue
+            write_reports(result, folder, renderer)
+            if bootstrap is not None:
+                with stage('bootstrap'):
+                    write_intervals(result, folder, **bootstrap)
+            results[dataset['name']] = result
+        if renderer.jobs:
+            print("\nMembuat gambar laporan...")
+    return results
+
+
+def run_metrics(names=None, *, config_path=None, base_dir='.', **options):
+    """
+    Mode cepat tanpa laporan: akurasi, metrik per kelas dan waktu tunda dicetak
+    tanpa memuat matplotlib, seaborn, sklearn maupun openpyxl. options diteruskan
+    ke evaluate_dataset. Mengembalikan dict nama dataset -> ringkasan.
+    """
+    datasets = select_datasets(load_config(config_path), names)
+    summaries = {}
+    for dataset in datasets:
+        result = evaluate_dataset(dataset, base_dir, max_mismatch_rows=0, collect_rows=False, **options)
+        if result['files'] == 0:
+            print(f"\nTidak ada file yang diproses untuk {dataset['name']}.")
+            continue
+        summary = build_metrics_summary(result)
+        print(f"\n--- Ringkasan Metrik {dataset['name']} ---")
+        print(f"Total data: {summary['rows']}, akurasi: {summary['accuracy'] * 100:.2f}%")
+        print(summary['classes'].to_string(index=False))
+        if not summary['delays'].empty:
+            print(summary['delays'].to_string(index=False))
+        summaries[dataset['name']] = summary
+    return summaries
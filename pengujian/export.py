@@ -0,0 +1,117 @@
+"""
+Ekspor laporan besar secara streaming.
+
+write_excel menulis workbook dengan openpyxl mode write-only: baris ditulis
+satu per satu ke file tanpa membangun model sel seluruh workbook di memori.
+MismatchSpill menulis baris mismatch ke CSV atau Parquet saat setiap file
+percobaan selesai diproses, sehingga laporan kesalahan lengkap tidak pernah
+perlu digabung di memori; sheet Excel 'Detail Kesalahan' cukup berisi
+sebagian baris pertama dan menunjuk ke file spill.
+"""
+import os
+
+import pandas as pd
+
+# Jumlah baris mismatch maksimum di sheet Excel 'Detail Kesalahan'.
+DEFAULT_EXCEL_ROWS = 10_000
+SPILL_FORMATS = ('csv', 'parquet')
+# Format tanggal yang dipakai pandas.to_excel untuk kolom datetime.
+DATETIME_FORMAT = 'YYYY-MM-DD HH:MM:SS.000'
+
+
+def _sheet_rows(df):
+    """Baris-baris df sebagai nilai Python (NaN/NaT menjadi sel kosong)."""
+    columns = [series.astype(object).where(series.notna(), None).tolist() for _, series in df.items()]
+    return zip(*columns)
+
+
+def _link_cell(sheet, value):
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    cell = WriteOnlyCell(sheet, value['value'])
+    cell.hyperlink = value['hyperlink']
+    cell.font = Font(color='0563C1', underline='single')
+    return cell
+
+
+def write_excel(path, sheets):
+    """
+    Menulis workbook write-only. sheets berisi (nama sheet, DataFrame) atau
+    (nama sheet, daftar baris) berurutan; DataFrame ditulis dengan header
+    kolom tanpa indeks seperti DataFrame.to_excel(index=False). Di daftar
+    baris, sel berupa dict {'value': ..., 'hyperlink': ...} menjadi tautan.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+
+    workbook = Workbook(write_only=True)
+    for name, data in sheets:
+        sheet = workbook.create_sheet(name)
+        if not isinstance(data, pd.DataFrame):
+            for row in data:
+                sheet.append([_link_cell(sheet, value) if isinstance(value, dict) else value for value in row])
+            continue
+        sheet.append([str(column) for column in data.columns])
+        dates = [pd.api.types.is_datetime64_any_dtype(dtype) for dtype in data.dtypes]
+        for values in _sheet_rows(data):
+            row = []
+            for value, is_date in zip(values, dates):
+                if is_date and value is not None:
+                    value = WriteOnlyCell(sheet, value)
+                    value.number_format = DATETIME_FORMAT
+                row.append(value)
+            sheet.append(row)
+    workbook.save(path)
+
+
+class MismatchSpill:
+    """
+    File spill baris mismatch satu dataset (CSV atau Parquet) yang ditambah
+    per percobaan. Kolom ditetapkan dari potongan pertama: kolom columns yang
+    ada (atau semua kolom jika columns None); label Categorical ditulis sebagai teks.
+    """
+
+    def __init__(self, path, fmt='csv', columns=None):
+        if fmt not in SPILL_FORMATS:
+            raise ValueError(f"Format spill '{fmt}' tidak dikenal.")
+        self.path = path
+        self.fmt = fmt
+        self.columns = columns
+        self.rows = 0
+        self._writer = None
+        self._started = False
+
+    def append(self, df):
+        if not self._started:
+            self.columns = [c for c in self.columns if c in df.columns] if self.columns is not None else list(df.columns)
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        df = df.reindex(columns=self.columns)
+        for name, series in df.items():
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                df[name] = series.astype(object)
+        if self.fmt == 'csv':
+            df.to_csv(self.path, mode='a' if self._started else 'w', header=not self._started, index=False)
+        else:
+            self._append_parquet(df)
+        self._started = True
+        self.rows += len(df)
+
+    def _append_parquet(self, df):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        else:
+            table = table.cast(self._writer.schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        """Menutup file spill; file spill lama dari run sebelumnya dihapus jika tidak ada mismatch."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if not self._started and os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,171 @@
+"""
+Cek integritas fitur rolling yang dicatat perangkat.
+
+Build firmware yang salah (window basi, pembagi simpangan baku keliru)
+mencatat Mean/Std Dev yang tidak cocok dengan sinyal mentahnya dan diam-diam
+membelokkan angka akurasi. Tahap ini menghitung ulang fitur rolling dari
+kolom tegangan dan arus untuk ukuran window dataset (sweep.rolling_mean_std,
+jumlah kumulatif, O(N) per file), membandingkannya dengan kolom fitur yang
+dicatat (SCHEMAS[...]['feature_columns']) dan melaporkan file serta rentang
+baris yang melewati toleransi. Untuk file yang gagal dicari ukuran window dan
+ddof yang paling cocok dengan catatan perangkat.
+
+Baris pertama (window - 1 sampel) tidak dicek karena isi buffer perangkat
+sebelum pencatatan dimulai tidak diketahui.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from .config import SCHEMAS, load_config, output_folder, select_datasets
+from .loader import iter_csv_columns, iter_trials
+from .rle import runs_from_codes
+from .sweep import rolling_features
+from .timing import count_rows, stage
+
+# Nilai tercatat dibulatkan 2 desimal; selisih sampai atol + rtol * |nilai| dianggap sama.
+DEFAULT_ATOL = 0.01
+DEFAULT_RTOL = 0.001
+MAX_RANGES_SHOWN = 10
+
+
+def out_of_tolerance(logged, recomputed, atol=DEFAULT_ATOL, rtol=DEFAULT_RTOL):
+    """Mask baris yang nilai tercatatnya menyimpang dari nilai hitung ulang (NaN dianggap menyimpang)."""
+    logged = np.asarray(logged, dtype=float)
+    with np.errstate(invalid='ignore'):
+        return ~(np.abs(logged - recomputed) <= atol + rtol * np.abs(logged))
+
+
+def violation_ranges(mask):
+    """Rentang baris [awal, akhir] (inklusif) tempat mask bernilai True."""
+    runs = runs_from_codes(np.asarray(mask, dtype=np.uint8))
+    bad = runs.codes == 1
+    return list(zip(runs.starts[bad].tolist(), (runs.starts[bad] + runs.lengths[bad] - 1).tolist()))
+
+
+def format_ranges(ranges, limit=MAX_RANGES_SHOWN):
+    text = ', '.join(f"{start}-{stop}" if stop > start else f"{start}" for start, stop in ranges[:limit])
+    if len(ranges) > limit:
+        text += f", ... (+{len(ranges) - limit})"
+    return text
+
+
+def feature_violations(voltage, current, logged, window, ddof, atol=DEFAULT_ATOL, rtol=DEFAULT_RTOL):
+    """
+    Membandingkan fitur tercatat (dict nama fitur -> array) dengan fitur hasil
+    hitung ulang. Mengembalikan (mask baris menyimpang, dict selisih maksimum
+    per fitur); baris pemanasan tidak pernah ditandai.
+    """
+    recomputed = rolling_features(voltage, current, window, ddof)
+    mask = np.zeros(len(voltage), dtype=bool)
+    max_error = {}
+    warmup = min(window - 1, len(voltage))
+    for feature, values in logged.items():
+        error = np.abs(np.asarray(values, dtype=float) - recomputed[feature])[warmup:]
+        max_error[feature] = float(np.nanmax(error)) if len(error) and not np.isnan(error).all() else np.nan
+        mask |= out_of_tolerance(values, recomputed[feature], atol, rtol)
+    mask[:warmup] = False
+    return mask, max_error
+
+
+def fit_window(voltage, current, logged, windows, atol=DEFAULT_ATOL, rtol=DEFAULT_RTOL):
+    """(ukuran window, ddof, fraksi baris cocok) yang paling cocok dengan fitur tercatat."""
+    best = (None, None, -1.0)
+    checked = max(len(voltage) - max(windows) + 1, 1)
+    for window in windows:
+        for ddof in (0, 1):
+            mask, _ = feature_violations(voltage, current, logged, window, ddof, atol, rtol)
+            # Bandingkan pada baris yang sama untuk semua kandidat (sesudah pemanasan terpanjang).
+            fraction = 1.0 - mask[-checked:].mean()
+            if fraction > best[2]:
+                best = (window, ddof, fraction)
+    return best
+
+
+def check_file(path, schema_name, window, cache=None, atol=DEFAULT_ATOL, rtol=DEFAULT_RTOL):
+    """
+    Cek satu file rekaman. Mengembalikan dict ringkasan (jumlah baris, baris
+    menyimpang, rentangnya, selisih maksimum per fitur dan window/ddof yang
+    paling cocok jika ada yang menyimpang).
+    """
+    schema = SCHEMAS[schema_name]
+    columns = next(iter_csv_columns(path, None, cache))
+    missing = [name for name in [schema['voltage_column'], schema['current_column'], *schema['feature_columns'].values()]
+               if name not in columns]
+    if missing:
+        raise ValueError(f"Kolom tidak ditemukan: {', '.join(missing)}")
+    voltage = np.asarray(columns[schema['voltage_column']], dtype=float)
+    current = np.asarray(columns[schema['current_column']], dtype=float)
+    logged = {feature: columns[name] for feature, name in schema['feature_columns'].items()}
+
+    mask, max_error = feature_violations(voltage, current, logged, window, schema['std_ddof'], atol, rtol)
+    summary = {
+        'path': path,
+        'rows': len(voltage),
+        'bad_rows': int(mask.sum()),
+        'ranges': violation_ranges(mask),
+        'max_error': max_error,
+        'fitted': None,
+    }
+    if summary['bad_rows']:
+        summary['fitted'] = fit_window(voltage, current, logged, range(1, 2 * window + 1), atol, rtol)
+    return summary
+
+
+def build_integrity_table(summaries, window, ddof):
+    rows = []
+    for summary in summaries:
+        fitted_window, fitted_ddof, fraction = summary['fitted'] or (None, None, None)
+        rows.append({
+            'File': summary['path'],
+            'Total Data': summary['rows'],
+            'Baris Menyimpang': summary['bad_rows'],
+            'Status': 'MENYIMPANG' if summary['bad_rows'] else 'OK',
+            **{f"Selisih Maks {feature}": round(error, 4) for feature, error in summary['max_error'].items()},
+            'Rentang Baris': format_ranges(summary['ranges']),
+            'Window/ddof Tercatat': (f"{fitted_window}/{fitted_ddof} ({fraction * 100:.1f}% cocok)"
+                                     if fitted_window is not None else f"{window}/{ddof}"),
+        })
+    return pd.DataFrame(rows)
+
+
+def check_dataset(dataset, base_dir='.', cache=None, atol=DEFAULT_ATOL, rtol=DEFAULT_RTOL):
+    """Cek semua file rekaman satu dataset (kebenaran dan prediksi). Mengembalikan tabel per file."""
+    paths = []
+    for _, truth_path, pred_path in iter_trials(dataset, base_dir):
+        paths.extend([truth_path, pred_path])
+    summaries = []
+    for path in dict.fromkeys(paths):
+        try:
+            with stage('feature_check', file=path):
+                summaries.append(check_file(path, dataset['schema'], dataset['window_size'], cache, atol, rtol))
+                count_rows(summaries[-1]['rows'])
+        except Exception as e:
+            print(f"Error saat memeriksa file '{path}': {e}")
+    return build_integrity_table(summaries, dataset['window_size'], SCHEMAS[dataset['schema']]['std_ddof'])
+
+
+def run_check(names=None, *, config_path=None, base_dir='.', output_root=None, cache=None, atol=DEFAULT_ATOL, rtol=DEFAULT_RTOL):
+    """
+    Cek integritas fitur untuk semua dataset (atau yang dipilih lewat names),
+    mencetak file yang menyimpang dan menulis cek_fitur.csv ke folder output
+    dataset. Mengembalikan jumlah file yang menyimpang.
+    """
+    failed = 0
+    for dataset in select_datasets(load_config(config_path), names):
+        print(f"\n--- Cek Integritas Fitur {dataset['name']} ({dataset['root']}), window {dataset['window_size']} ---")
+        table = check_dataset(dataset, base_dir, cache, atol, rtol)
+        if table.empty:
+            print(f"\nTidak ada file yang diperiksa untuk {dataset['name']}.")
+            continue
+        bad = table[table['Status'] != 'OK']
+        failed += len(bad)
+        print(f"\n{len(table) - len(bad)} dari {len(table)} file sesuai (toleransi {atol} + {rtol} x nilai).")
+        if not bad.empty:
+            print(bad[['File', 'Baris Menyimpang', 'Rentang Baris', 'Window/ddof Tercatat']].to_string(index=False))
+        folder = output_folder(dataset, base_dir, output_root)
+        os.makedirs(folder, exist_ok=True)
+        table.to_csv(os.path.join(folder, 'cek_fitur.csv'), index=False)
+        print(f"\nLaporan 'cek_fitur.csv' berhasil dibuat di folder '{folder}'!")
+    return failed
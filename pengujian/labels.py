@@ -0,0 +1,105 @@
+"""
+Kosakata label: setiap ejaan label yang dikenal dipetakan sekali ke kode
+integer kecil saat data dibaca. Setelah itu label hanya beredar sebagai array
+uint8; nama untuk laporan, kunci transisi dan nama tampilan diturunkan dari kode.
+"""
+import numpy as np
+import pandas as pd
+
+# Kelas kanonik; indeks list adalah kodenya.
+LABELS = ['NORMAL', 'ARC FLASH', 'NO CONTACT']
+
+# Semua ejaan yang muncul di kedua skema (setelah spasi di tepi dibuang).
+SPELLINGS = {
+    'NORMAL': 0,
+    'ARC FLASH': 1,
+    'ARC FLASH ⚠': 1,
+    'NO CONTACT': 2,
+    'Status: Normal': 0,
+    'Status: Arc Flash': 1,
+    'Status: Off Contact': 2,
+}
+
+# Nama pendek untuk kunci transisi ("Arc ke Normal", ...).
+KEY_NAMES = {'NORMAL': 'Normal', 'ARC FLASH': 'Arc', 'NO CONTACT': 'Off'}
+
+# Nama kelas yang ditampilkan di laporan metrik klasifikasi.
+DISPLAY_NAMES = {'NORMAL': 'Normal', 'ARC FLASH': 'Arc Flash', 'NO CONTACT': 'Off Contact'}
+
+MAX_LABELS = np.iinfo(np.uint8).max + 1
+
+
+class LabelVocabulary:
+    """
+    Pemetaan ejaan label -> kode uint8. Label yang tidak dikenal mendapat kode
+    baru (namanya ejaan yang sudah dibersihkan) sehingga tetap terhitung.
+    """
+
+    def __init__(self, names=None, spellings=None):
+        self.names = list(LABELS if names is None else names)
+        self._codes = dict(SPELLINGS if spellings is None else spellings)
+        for code, name in enumerate(self.names):
+            self._codes.setdefault(name, code)
+
+    def __len__(self):
+        return len(self.names)
+
+    def copy(self):
+        return LabelVocabulary(self.names, self._codes)
+
+    def code(self, label):
+        """Kode untuk satu ejaan label; label baru ditambahkan ke kosakata."""
+        code = self._codes.get(label)
+        if code is None:
+            clean = str(label).strip()
+            code = self._codes.get(clean)
+            if code is None:
+                code = self._codes.get(clean.replace(' ⚠', ''))
+            if code is None:
+                if len(self.names) >= MAX_LABELS:
+                    raise ValueError(f"Terlalu banyak label berbeda (maksimum {MAX_LABELS})")
+                code = len(self.names)
+                name = clean.replace(' ⚠', '')
+                self.names.append(name)
+                self._codes[name] = code
+            self._codes[label] = code
+        return code
+
+    def encode(self, values):
+        """
+        Mengubah deret label menjadi array kode uint8. Pekerjaan string hanya
+        dilakukan sekali per ejaan unik, bukan per sampel.
+        """
+        if isinstance(values, pd.Categorical):
+            # Kolom dari cache sudah berupa kode; cukup petakan kategorinya.
+            # Nilai kosong (kode -1) dipetakan seperti NaN dari factorize,
+            # hanya jika memang ada.
+            codes = values.codes
+            uniques = list(values.categories)
+            if len(codes) and codes.min() < 0:
+                uniques.append(np.nan)
+        else:
+            codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        mapping = np.fromiter((self.code(label) for label in uniques), dtype=np.uint8, count=len(uniques))
+        return mapping[codes]
+
+    def categorical(self, codes, names=None):
+        """Membungkus array kode sebagai pandas Categorical tanpa menyalin string."""
+        return pd.Categorical.from_codes(np.asarray(codes, dtype=np.int64), categories=list(names or self.names))
+
+    def output_names(self, schema):
+        """Nama label sesuai skema (misalnya 'Status: Normal' untuk 50ws)."""
+        mapping = schema.get('label_names', {})
+        return [mapping.get(name, name) for name in self.names]
+
+    def key_name(self, code):
+        name = self.names[code]
+        return KEY_NAMES.get(name, name)
+
+    def display_name(self, code):
+        name = self.names[code]
+        return DISPLAY_NAMES.get(name, name)
+
+    def transition_key(self, code_from, code_to):
+        """Kunci transisi pendek, misalnya 'Arc ke Normal'."""
+        return f"{self.key_name(code_from)} ke {self.key_name(code_to)}"
@@ -0,0 +1,570 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+from .config import SCHEMAS
+from .recording import RECORDING_SUFFIX, is_recording, read_recording
+from .timing import count_rows, stage
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+
+# Thread pemuat file paralel: pembacaan CSV pandas/pyarrow dan I/O melepas GIL.
+DEFAULT_IO_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Pola ketat TIMESTAMP_FORMAT; hanya teks yang cocok diserahkan ke parser Arrow.
+TIMESTAMP_PATTERN = r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{1,9}$'
+
+
+def parse_timestamps(values):
+    """
+    Mem-parse teks berformat TIMESTAMP_FORMAT menjadi datetime64[ns]. Jika pyarrow
+    tersedia, pola diperiksa dengan regex dan teks diubah oleh kernel cast
+    timestamp Arrow (C++, vektor) tanpa strptime per baris. Teks kosong atau tidak
+    sesuai format menjadi NaT. Tanpa pyarrow, atau jika ada tanggal yang lolos pola
+    tetapi tidak valid (misalnya 30 Februari), dipakai pd.to_datetime(errors='coerce').
+    """
+    if pa is not None:
+        text = pa.array(values, type=pa.large_string(), from_pandas=True)
+        well_formed = pc.fill_null(pc.match_substring_regex(text, TIMESTAMP_PATTERN), False)
+        try:
+            parsed = pc.cast(pc.if_else(well_formed, text, pa.scalar(None, pa.large_string())), pa.timestamp('ns'))
+        except pa.ArrowInvalid:
+            parsed = None
+        if parsed is not None:
+            return parsed.to_numpy(zero_copy_only=False).astype('datetime64[ns]', copy=False)
+    return pd.to_datetime(values, format=TIMESTAMP_FORMAT, errors='coerce').to_numpy(dtype='datetime64[ns]')
+
+
+def frame_to_columns(df):
+    """
+    Mengubah DataFrame hasil read_csv menjadi dict kolom bertipe: angka tetap,
+    Timestamp menjadi datetime64[ns], kolom teks lain menjadi Categorical.
+    """
+    columns = {}
+    for name, series in df.items():
+        name = name.strip()
+        if name == 'Timestamp':
+            with stage('timestamp_parse'):
+                columns[name] = parse_timestamps(series)
+                count_rows(len(series))
+        elif pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+            columns[name] = series.to_numpy()
+        else:
+            columns[name] = pd.Categorical(series)
+    return columns
+
+
+def _slice_columns(columns, start, stop):
+    return {name: data[start:stop] for name, data in columns.items()}
+
+
+def _column_length(columns):
+    return len(next(iter(columns.values()))) if columns else 0
+
+
+def iter_csv_columns(path, chunksize=None, cache=None):
+    """
+    Membaca satu file CSV sebagai potongan dict kolom (lihat frame_to_columns).
+    Jika cache berisi entri yang masih cocok, kolom dibuka lewat memmap tanpa
+    mem-parse teks; jika tidak, CSV di-parse dan hasilnya sekaligus ditulis ke cache.
+    Rekaman biner (.pgrec, lihat recording) langsung dibuka lewat memmap tanpa cache.
+    """
+    if is_recording(path):
+        with stage('recording_read'):
+            columns = read_recording(path)
+            count_rows(_column_length(columns))
+        n = _column_length(columns)
+        step = chunksize or max(n, 1)
+        for start in range(0, max(n, 1), step):
+            yield _slice_columns(columns, start, start + step)
+        return
+
+    if cache is not None:
+        with stage('cache_read'):
+            columns = cache.load(path)
+        if columns is not None:
+            n = _column_length(columns)
+            step = chunksize or max(n, 1)
+            for start in range(0, max(n, 1), step):
+                yield _slice_columns(columns, start, start + step)
+            return
+
+    writer = cache.writer(path) if cache is not None else None
+    try:
+        with stage('csv_read'):
+            if chunksize is None:
+                chunks = iter([pd.read_csv(path)])
+            else:
+                chunks = pd.read_csv(path, chunksize=chunksize)
+        while True:
+            with stage('csv_read'):
+                df = next(chunks, None)
+                if df is not None:
+                    count_rows(len(df))
+            if df is None:
+                break
+            with stage('column_convert'):
+                columns = frame_to_columns(df)
+                count_rows(len(df))
+            if writer is not None:
+                with stage('cache_write'):
+                    writer.append(columns)
+            yield columns
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        raise
+    if writer is not None:
+        writer.commit()
+
+
+def _trial_paths(dataset, scenario, index, base_dir):
+    root = os.path.join(base_dir, dataset['root'])
+    if SCHEMAS[dataset['schema']]['paired_files']:
+        truth_path = os.path.join(root, scenario['truth_folder'], f"{scenario['truth_prefix']}{index}.csv")
+        pred_path = os.path.join(root, scenario['pred_folder'], f"{scenario['pred_prefix']}{index}.csv")
+        return truth_path, pred_path
+    path = os.path.join(root, scenario['folder'], f"{scenario['prefix']}{index}.csv")
+    return path, path
+
+
+def scenario_name(scenario):
+    return scenario.get('name') or scenario.get('truth_folder') or scenario.get('folder')
+
+
+def time_values(data):
+    """
+    Kolom waktu sebagai array yang bisa dikurangkan: datetime64[ns] (Timestamp)
+    atau float detik (Waktu Relatif). Kolom waktu yang terbaca sebagai teks karena
+    ada nilai rusak di-parse sekali per nilai unik; nilai rusak menjadi NaN.
+    """
+    if data is None:
+        return None
+    if isinstance(data, pd.Categorical):
+        seconds = pd.to_numeric(pd.Series(data.categories), errors='coerce').to_numpy(dtype=float)
+        return np.append(seconds, np.nan)[data.codes]
+    if np.issubdtype(data.dtype, np.datetime64):
+        return data
+    return np.asarray(data, dtype=float)
+
+
+def invalid_time_mask(values):
+    """Baris dengan waktu kosong atau tidak dapat di-parse (NaT/NaN)."""
+    return np.isnat(values) if np.issubdtype(values.dtype, np.datetime64) else np.isnan(values)
+
+
+def _make_chunk(truth_columns, pred_columns, schema, vocabulary):
+    if schema['truth_column'] not in truth_columns:
+        raise KeyError(f"Kolom '{schema['truth_column']}' tidak ada")
+    if schema['pred_column'] not in pred_columns:
+        raise KeyError(f"Kolom '{schema['pred_column']}' tidak ada")
+    n_truth, n_pred = _column_length(truth_columns), _column_length(pred_columns)
+    if n_truth != n_pred:
+        raise ValueError(f"Jumlah baris berbeda: {n_truth} (kebenaran) vs {n_pred} (prediksi)")
+    truth_time = time_values(truth_columns.get(schema['time_column']))
+    pred_time = truth_time if pred_columns is truth_columns else time_values(pred_columns.get(schema['time_column']))
+    if truth_time is None or pred_time is None:
+        invalid_time = 0
+    else:
+        invalid_time = int(np.count_nonzero(invalid_time_mask(truth_time) | invalid_time_mask(pred_time)))
+    with stage('label_encode'):
+        y_true = vocabulary.encode(truth_columns[schema['truth_column']])
+        y_pred = vocabulary.encode(pred_columns[schema['pred_column']])
+        count_rows(n_truth)
+    return {
+        'columns': truth_columns,
+        'y_true': y_true,
+        'y_pred': y_pred,
+        'truth_time': truth_time,
+        'pred_time': pred_time,
+        'invalid_time': invalid_time,
+    }
+
+
+def _time_keys(values):
+    """Kunci waktu numerik untuk penyelarasan: (int64 ns atau float detik, mask baris yang waktunya valid)."""
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype('datetime64[ns]').view(np.int64), ~np.isnat(values)
+    return values, ~np.isnan(values)
+
+
+def _tolerance_key(values, tolerance):
+    return int(round(tolerance * 1e9)) if np.issubdtype(values.dtype, np.datetime64) else tolerance
+
+
+def equal_rank(keys, carry=None):
+    """
+    Urutan setiap nilai di antara nilai sama yang berderet (0, 1, ...). carry
+    (nilai, jumlah) melanjutkan deret dari potongan sebelumnya. Mengembalikan
+    (rank, carry untuk potongan berikutnya).
+    """
+    if len(keys) == 0:
+        return np.empty(0, dtype=np.int64), carry
+    starts = np.concatenate(([0], np.flatnonzero(keys[1:] != keys[:-1]) + 1))
+    rank = np.arange(len(keys)) - np.repeat(starts, np.diff(np.append(starts, len(keys))))
+    if carry is not None and keys[0] == carry[0]:
+        rank[:starts[1] if len(starts) > 1 else len(keys)] += carry[1]
+    return rank, (keys[-1], int(rank[-1]) + 1)
+
+
+def nearest_match(truth_keys, pred_keys, tolerance, rank=None):
+    """
+    Indeks baris prediksi dengan waktu terdekat untuk setiap waktu kebenaran,
+    atau -1 jika selisihnya lebih dari tolerance. pred_keys harus urut naik;
+    pencarian memakai searchsorted sekali untuk semua baris. Jika rank
+    diberikan (lihat equal_rank), waktu kebenaran yang sama dan berderet
+    dipasangkan berurutan dengan baris prediksi berwaktu sama (sampel ganda
+    tidak semuanya jatuh ke baris prediksi pertama).
+    """
+    if len(pred_keys) == 0:
+        return np.full(len(truth_keys), -1, dtype=np.int64)
+    right = np.searchsorted(pred_keys, truth_keys)
+    left = np.maximum(right - 1, 0)
+    right = np.minimum(right, len(pred_keys) - 1)
+    left_gap = np.abs(truth_keys - pred_keys[left])
+    right_gap = np.abs(pred_keys[right] - truth_keys)
+    match = np.where(right_gap < left_gap, right, left)
+    if rank is not None:
+        exact_end = np.searchsorted(pred_keys, truth_keys, side='right')
+        shifted = right + rank
+        match = np.where((right_gap == 0) & (shifted < exact_end), shifted, match)
+    return np.where(np.minimum(left_gap, right_gap) <= tolerance, match, -1).astype(np.int64)
+
+
+class _PredictionBuffer:
+    """Baris prediksi (kode label, waktu, nomor baris file) yang sudah dibaca tetapi mungkin masih cocok dengan baris kebenaran berikutnya."""
+
+    def __init__(self, chunks, schema, vocabulary):
+        self.chunks = iter(chunks)
+        self.schema = schema
+        self.vocabulary = vocabulary
+        self.codes = np.empty(0, dtype=np.uint8)
+        self.time = None
+        self.keys = None
+        self.rows = np.empty(0, dtype=np.int64)
+        self.row_count = 0
+        self.used = np.empty(0, dtype=bool)
+        self.exhausted = False
+        self.unmatched = 0
+        self.invalid = 0
+
+    def _time(self, columns):
+        """Waktu baris potongan prediksi sebagai (kunci, mask waktu valid, waktu)."""
+        time = time_values(columns.get(self.schema['time_column']))
+        if time is None:
+            raise KeyError(f"Kolom '{self.schema['time_column']}' tidak ada")
+        keys, valid = _time_keys(time)
+        # Baris prediksi tanpa waktu valid tidak dapat dipasangkan; dihitung terpisah.
+        self.invalid += int(np.count_nonzero(~valid))
+        return keys, valid, time
+
+    def fill(self, until):
+        """Membaca potongan prediksi sampai waktu terakhir di buffer melewati until (atau file habis)."""
+        while not self.exhausted and (self.keys is None or not len(self.keys) or self.keys[-1] <= until):
+            columns = next(self.chunks, None)
+            if columns is None:
+                self.exhausted = True
+                break
+            self.append(columns)
+
+    def append(self, columns):
+        """Menambahkan satu potongan kolom prediksi ke buffer."""
+        if self.schema['pred_column'] not in columns:
+            raise KeyError(f"Kolom '{self.schema['pred_column']}' tidak ada")
+        keys, valid, time = self._time(columns)
+        with stage('label_encode'):
+            codes = self.vocabulary.encode(columns[self.schema['pred_column']])[valid]
+            count_rows(len(codes))
+        keys, time = keys[valid], time[valid]
+        rows = self.row_count + np.flatnonzero(valid)
+        self.row_count += len(valid)
+        if len(keys) and (np.any(keys[1:] < keys[:-1]) or (self.keys is not None and len(self.keys) and keys[0] < self.keys[-1])):
+            raise ValueError("Waktu file prediksi tidak urut naik; penyelarasan waktu membutuhkan data urut.")
+        self.codes = np.concatenate((self.codes, codes))
+        self.time = time if self.time is None else np.concatenate((self.time, time))
+        self.keys = keys if self.keys is None else np.concatenate((self.keys, keys))
+        self.rows = np.concatenate((self.rows, rows))
+        self.used = np.concatenate((self.used, np.zeros(len(keys), dtype=bool)))
+
+    def drop_before(self, key):
+        """Membuang baris dengan waktu sebelum key; yang tidak pernah dipakai dihitung tanpa pasangan."""
+        cut = int(np.searchsorted(self.keys, key, side='left')) if self.keys is not None else 0
+        self.unmatched += int(np.count_nonzero(~self.used[:cut]))
+        self.codes, self.time, self.keys = self.codes[cut:], self.time[cut:], self.keys[cut:]
+        self.rows, self.used = self.rows[cut:], self.used[cut:]
+
+    def finish(self):
+        """
+        Jumlah akhir baris prediksi tanpa pasangan (termasuk sisa file yang
+        belum dibaca); baris sisa yang waktunya tidak valid masuk ke invalid.
+        """
+        for columns in self.chunks:
+            _, valid, _ = self._time(columns)
+            self.unmatched += int(np.count_nonzero(valid))
+        return self.unmatched + int(np.count_nonzero(~self.used))
+
+
+class TimeAligner:
+    """
+    Penyelarasan baris kebenaran dan prediksi berdasarkan kolom waktu (as-of
+    join ke waktu terdekat dalam tolerance detik), potongan kebenaran demi
+    potongan kebenaran. Baris prediksi ditarik dari pred_chunks secukupnya,
+    atau ditambahkan langsung lewat add_predictions (mode pantau, lihat watch).
+    Baris tanpa pasangan tidak dievaluasi dan dihitung di
+    'unmatched_truth'/'unmatched_pred'; baris yang waktunya tidak dapat
+    di-parse (di kedua file) dihitung terpisah di 'invalid_time'.
+    'truth_rows' dan 'pred_rows' berisi nomor baris file kebenaran dan file
+    prediksi untuk setiap baris yang dievaluasi.
+    """
+
+    def __init__(self, schema, vocabulary, tolerance, pred_chunks=()):
+        self.schema = schema
+        self.vocabulary = vocabulary
+        self.tolerance = tolerance
+        self.buffer = _PredictionBuffer(pred_chunks, schema, vocabulary)
+        self.row_offset = 0
+        self.last_key = None
+        self._carry = None
+
+    def add_predictions(self, columns):
+        self.buffer.append(columns)
+
+    def align(self, truth_columns):
+        """Potongan evaluasi (lihat _make_chunk) untuk satu potongan kolom kebenaran."""
+        schema, buffer = self.schema, self.buffer
+        if schema['truth_column'] not in truth_columns:
+            raise KeyError(f"Kolom '{schema['truth_column']}' tidak ada")
+        n_truth = _column_length(truth_columns)
+        truth_time = time_values(truth_columns.get(schema['time_column']))
+        if truth_time is None:
+            raise KeyError(f"Kolom '{schema['time_column']}' tidak ada")
+        with stage('label_encode'):
+            y_true = self.vocabulary.encode(truth_columns[schema['truth_column']])
+            count_rows(n_truth)
+        with stage('time_align'):
+            keys, valid = _time_keys(truth_time)
+            tolerance_key = _tolerance_key(truth_time, self.tolerance)
+            if valid.any():
+                self.last_key = keys[valid].max()
+                buffer.fill(self.last_key + tolerance_key)
+            match = np.full(n_truth, -1, dtype=np.int64)
+            rank, self._carry = equal_rank(keys[valid], self._carry)
+            if buffer.keys is not None:
+                match[valid] = nearest_match(keys[valid], buffer.keys, tolerance_key, rank)
+            matched = match >= 0
+            pred_index = match[matched]
+            buffer.used[pred_index] = True
+            invalid = int(np.count_nonzero(~valid))
+            chunk = {
+                'columns': {name: data[matched] for name, data in truth_columns.items()},
+                'y_true': y_true[matched],
+                'y_pred': buffer.codes[pred_index],
+                'truth_time': truth_time[matched],
+                'pred_time': buffer.time[pred_index] if buffer.time is not None else None,
+                'invalid_time': invalid,
+                'truth_rows': self.row_offset + np.flatnonzero(matched),
+                'pred_rows': buffer.rows[pred_index],
+                'unmatched_truth': int(n_truth - np.count_nonzero(matched)) - invalid,
+                'unmatched_pred': 0,
+            }
+            if self.last_key is not None and buffer.keys is not None:
+                buffer.drop_before(self.last_key - tolerance_key)
+            count_rows(n_truth)
+        self.row_offset += n_truth
+        return chunk
+
+    def finish(self):
+        """Potongan kosong terakhir yang membawa jumlah baris prediksi yang tidak pernah dipasangkan."""
+        empty = np.empty(0, dtype=np.uint8)
+        unmatched_pred = self.buffer.finish()
+        return {'columns': {}, 'y_true': empty, 'y_pred': empty, 'truth_time': None, 'pred_time': None,
+                'invalid_time': self.buffer.invalid, 'truth_rows': np.empty(0, dtype=np.int64),
+                'pred_rows': np.empty(0, dtype=np.int64),
+                'unmatched_truth': 0, 'unmatched_pred': unmatched_pred}
+
+
+def _aligned_chunks(truth_chunks, pred_chunks, schema, vocabulary, tolerance):
+    """
+    Menyelaraskan kedua file berdasarkan waktu (lihat TimeAligner). Kedua file
+    dibaca bertahap: buffer prediksi hanya berisi baris di sekitar waktu
+    potongan kebenaran yang sedang diproses.
+    """
+    aligner = TimeAligner(schema, vocabulary, tolerance, pred_chunks)
+    for truth_columns in truth_chunks:
+        yield aligner.align(truth_columns)
+    yield aligner.finish()
+
+
+def load_trial_columns(truth_path, pred_path, cache=None):
+    """
+    Seluruh kolom file kebenaran dan prediksi satu percobaan sebagai
+    (daftar potongan kebenaran, daftar potongan prediksi) untuk
+    iter_trial_chunks(preloaded=...). Aman dijalankan di thread pemuat:
+    pengkodean label (yang mengubah kosakata) tetap dilakukan pemanggil.
+    """
+    with stage('trial_load', file=truth_path):
+        truth = list(iter_csv_columns(truth_path, None, cache))
+        pred = truth if pred_path == truth_path else list(iter_csv_columns(pred_path, None, cache))
+    return truth, pred
+
+
+def iter_prefetched(items, load, workers=DEFAULT_IO_WORKERS):
+    """
+    Menjalankan load(item) di thread pool berukuran workers dan menghasilkan
+    (item, future) sesuai urutan items. Paling banyak 2 x workers item dimuat
+    lebih dulu, sehingga memori terbatas meskipun konsumen lebih lambat.
+    """
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pemuat') as pool:
+        pending = deque()
+        for item in items:
+            pending.append((item, pool.submit(load, item)))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            yield pending.popleft()
+            item = next(items, None)
+            if item is not None:
+                pending.append((item, pool.submit(load, item)))
+
+
+def iter_trial_chunks(truth_path, pred_path, schema_name, vocabulary, chunksize=None, cache=None, align_tolerance=None,
+                      preloaded=None):
+    """
+    Membaca satu percobaan (pasangan kebenaran/prediksi) sebagai potongan-potongan
+    berisi kode label uint8 (lihat labels.LabelVocabulary), kolom waktu yang
+    sudah di-parse (beserta jumlah baris yang waktunya tidak valid) dan kolom
+    file kebenaran.
+    Tanpa chunksize seluruh file dibaca sebagai satu potongan; dengan chunksize
+    kedua file dibaca berpasangan sehingga memori terbatas pada ukuran potongan.
+    Dengan align_tolerance (detik), file kebenaran dan prediksi yang terpisah
+    dipasangkan berdasarkan waktu (lihat _aligned_chunks), bukan posisi baris.
+    preloaded berisi hasil load_trial_columns jika file sudah dimuat lebih dulu.
+    """
+    schema = SCHEMAS[schema_name]
+    if preloaded is not None:
+        truth_chunks, pred_chunks = preloaded
+    else:
+        truth_chunks = iter_csv_columns(truth_path, chunksize, cache)
+    if pred_path == truth_path:
+        for columns in truth_chunks:
+            yield _make_chunk(columns, columns, schema, vocabulary)
+        return
+    if preloaded is None:
+        pred_chunks = iter_csv_columns(pred_path, chunksize, cache)
+    if align_tolerance is not None:
+        yield from _aligned_chunks(truth_chunks, pred_chunks, schema, vocabulary, align_tolerance)
+        return
+    for truth_columns, pred_columns in zip_longest(truth_chunks, pred_chunks):
+        if truth_columns is None or pred_columns is None:
+            raise ValueError("Jumlah baris file kebenaran dan prediksi berbeda")
+        yield _make_chunk(truth_columns, pred_columns, schema, vocabulary)
+
+
+def normalized_trial_name(filename, prefix=''):
+    """
+    Nama pembeda satu file percobaan di folder skenario: nama file tanpa
+    ekstensi dan prefix skenario, huruf kecil, '_' dan spasi berlebih
+    dirapikan. Misalnya 'normal arc off dari sistem3.csv' -> '3'.
+    """
+    stem = os.path.splitext(os.path.basename(filename))[0].strip()
+    if prefix and stem.lower().startswith(prefix.lower()):
+        stem = stem[len(prefix):]
+    return ' '.join(stem.lower().replace('_', ' ').split())
+
+
+def _trial_order(name):
+    """Urutan alami: tanpa nomor lebih dulu, lalu nomor menaik (2 sebelum 10), lalu nama lain."""
+    if not name:
+        return (0, 0, '')
+    if name.isdigit():
+        return (1, int(name), '')
+    return (2, 0, name)
+
+
+def _scan_folder(folder, prefix):
+    """
+    Dict nama ternormalisasi -> path untuk semua file CSV dan rekaman biner di
+    folder; jika keduanya ada untuk satu percobaan, rekaman biner yang dipakai.
+    """
+    try:
+        names = sorted(os.listdir(folder), key=lambda name: (is_recording(name), name))
+    except FileNotFoundError:
+        return None
+    return {normalized_trial_name(name, prefix): os.path.join(folder, name)
+            for name in names if name.lower().endswith(('.csv', RECORDING_SUFFIX))}
+
+
+def discover_trials(dataset, base_dir='.'):
+    """
+    Mencari file percobaan setiap skenario dengan membaca isi folder skenario.
+    File kebenaran dan prediksi dipasangkan menurut nama ternormalisasi
+    (normalized_trial_name). Mengembalikan (daftar (nama_skenario, path
+    kebenaran, path prediksi), daftar file tanpa pasangan atau folder yang hilang).
+    Dataset dengan 'file_indices' memakai daftar nomor file itu saja.
+    """
+    trials, orphans = [], []
+    root = os.path.join(base_dir, dataset['root'])
+    for scenario in dataset['scenarios']:
+        name = scenario_name(scenario)
+        if 'file_indices' in dataset:
+            for i in dataset['file_indices']:
+                truth_path, pred_path = _trial_paths(dataset, scenario, i, base_dir)
+                if os.path.exists(truth_path) and os.path.exists(pred_path):
+                    trials.append((name, truth_path, pred_path))
+                else:
+                    orphans.append(truth_path if pred_path == truth_path else f"{truth_path} atau {pred_path}")
+            continue
+        if SCHEMAS[dataset['schema']]['paired_files']:
+            truth_folder = os.path.join(root, scenario['truth_folder'])
+            pred_folder = os.path.join(root, scenario['pred_folder'])
+            truth = _scan_folder(truth_folder, scenario.get('truth_prefix', ''))
+            pred = _scan_folder(pred_folder, scenario.get('pred_prefix', ''))
+        else:
+            truth_folder = pred_folder = os.path.join(root, scenario['folder'])
+            truth = pred = _scan_folder(truth_folder, scenario.get('prefix', ''))
+        if truth is None or pred is None:
+            orphans.extend(dict.fromkeys(folder for folder, files in ((truth_folder, truth), (pred_folder, pred)) if files is None))
+            continue
+        for key in sorted(truth.keys() | pred.keys(), key=_trial_order):
+            if key in truth and key in pred:
+                trials.append((name, truth[key], pred[key]))
+            else:
+                orphans.append(truth.get(key) or pred.get(key))
+    return trials, orphans
+
+
+def iter_trials(dataset, base_dir='.'):
+    """
+    Menghasilkan (nama_skenario, path kebenaran, path prediksi) untuk setiap file
+    percobaan yang ditemukan (lihat discover_trials). File tanpa pasangan dan
+    folder yang hilang dilaporkan lalu dilewati.
+    """
+    trials, orphans = discover_trials(dataset, base_dir)
+    report_orphans(orphans)
+    current = None
+    for name, truth_path, pred_path in trials:
+        current = announce_scenario(name, current)
+        yield name, truth_path, pred_path
+
+
+def report_orphans(orphans):
+    for path in orphans:
+        print(f"File tanpa pasangan atau tidak ditemukan: {path}")
+
+
+def announce_scenario(name, current):
+    """Mencetak judul skenario saat skenario berganti; mengembalikan skenario yang sedang berjalan."""
+    if name != current:
+        print(f"\nMenguji Skenario: '{name}'\n" + "-"*60)
+    return name
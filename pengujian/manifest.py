@@ -0,0 +1,151 @@
+"""
+Manifest hasil parsial per percobaan untuk evaluasi ulang inkremental.
+
+Hasil TrialAccumulator.finish() setiap pasangan file kebenaran/prediksi
+(confusion matrix, tensor confusion per transisi, daftar waktu tunda, segmen dan baris mismatch)
+disimpan dengan kunci hash isi kedua file. Run berikutnya hanya memproses
+pasangan yang isinya berubah atau baru; sisanya diambil dari manifest lalu
+digabung seperti biasa. Label disimpan dengan namanya sehingga kode dapat
+dipetakan ulang ke kosakata run yang sedang berjalan.
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from .streaming import grow_square
+
+MANIFEST_VERSION = 5
+MANIFEST_FILE = 'manifest.json'
+HASH_BLOCK = 1024 * 1024
+
+
+def content_hash(paths, schema_name):
+    """Hash sha1 isi file-file paths (berurutan) beserta skema dan versi manifest."""
+    digest = hashlib.sha1(f"{MANIFEST_VERSION}|{schema_name}".encode('utf-8'))
+    for path in paths:
+        digest.update(b'\0')
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+class ResultManifest:
+    """
+    Manifest di folder directory: manifest.json memetakan kunci hash ke path
+    sumbernya, dan setiap hasil parsial disimpan sebagai <kunci>.pkl. store()
+    hanya mengubah indeks di memori; flush() menulisnya sekali per run.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.index = self._read_index()
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def _read_index(self):
+        try:
+            with open(os.path.join(self.directory, MANIFEST_FILE), encoding='utf-8') as f:
+                index = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        if index.get('version') != MANIFEST_VERSION:
+            return {}
+        return index.get('entries', {})
+
+    def _write_index(self):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = os.path.join(self.directory, MANIFEST_FILE + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'entries': self.index}, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, os.path.join(self.directory, MANIFEST_FILE))
+
+    def _entry_path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def key(self, truth_path, pred_path, schema_name, align_tolerance=None):
+        paths = [truth_path] if pred_path == truth_path else [truth_path, pred_path]
+        return content_hash(paths, schema_name if align_tolerance is None else f"{schema_name}|{align_tolerance!r}")
+
+    def has(self, key, collect_rows=True):
+        """True jika load(key, ..., collect_rows) dapat memakai entri manifest."""
+        return key in self.index and (not collect_rows or self.index[key].get('rows_collected', True))
+
+    def load(self, key, vocabulary, collect_rows=True):
+        """
+        Hasil parsial untuk key dengan kode label dipetakan ke vocabulary
+        (label yang belum dikenal ditambahkan), atau None jika belum ada.
+        Entri yang disimpan tanpa baris mismatch mentah tidak dipakai jika
+        collect_rows meminta baris tersebut.
+        """
+        if not self.has(key, collect_rows):
+            self.misses += 1
+            return None
+        try:
+            stored = pd.read_pickle(self._entry_path(key))
+        except (OSError, ValueError, EOFError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return remap_partial(stored['partial'], stored['labels'], vocabulary)
+
+    def store(self, key, partial, vocabulary, truth_path, pred_path, collect_rows=True):
+        """
+        Menyimpan hasil parsial satu percobaan. Entri lama untuk pasangan path
+        yang sama (isi file sebelum berubah) dihapus.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        pd.to_pickle({'labels': list(vocabulary.names), 'partial': partial}, self._entry_path(key))
+        sources = [os.path.abspath(truth_path), os.path.abspath(pred_path)]
+        for old_key, entry in list(self.index.items()):
+            if old_key != key and entry['sources'] == sources:
+                del self.index[old_key]
+                try:
+                    os.remove(self._entry_path(old_key))
+                except FileNotFoundError:
+                    pass
+        self.index[key] = {
+            'sources': sources,
+            'rows': int(partial['rows']),
+            'mismatch_rows': int(partial['mismatch_segments']['count'].sum()),
+            'rows_collected': collect_rows,
+        }
+        self.dirty = True
+
+    def flush(self):
+        """Menulis manifest.json jika ada entri yang berubah sejak flush terakhir."""
+        if self.dirty:
+            self._write_index()
+            self.dirty = False
+
+
+def remap_partial(partial, labels, vocabulary):
+    """Memetakan kode label hasil parsial (berdasarkan daftar nama labels) ke vocabulary."""
+    mapping = np.array([vocabulary.code(name) for name in labels], dtype=np.int64)
+    if np.array_equal(mapping, np.arange(len(labels))):
+        partial['confusion'] = grow_square(partial['confusion'], len(vocabulary))
+        partial['transition_confusion'] = grow_square(partial['transition_confusion'], len(vocabulary))
+        return partial
+
+    confusion = np.zeros((len(vocabulary), len(vocabulary)), dtype=partial['confusion'].dtype)
+    confusion[np.ix_(mapping, mapping)] = partial['confusion']
+    partial['confusion'] = confusion
+    tensor = np.zeros((len(vocabulary),) * 3, dtype=partial['transition_confusion'].dtype)
+    tensor[np.ix_(mapping, mapping, mapping)] = partial['transition_confusion']
+    partial['transition_confusion'] = tensor
+    delays = partial['delays']
+    if not delays.empty:
+        delays['code_from'] = mapping[delays['code_from'].to_numpy(dtype=np.int64)]
+        delays['code_to'] = mapping[delays['code_to'].to_numpy(dtype=np.int64)]
+    for mismatched_data in partial['mismatches']:
+        for column in ('Label_Seharusnya', 'Prediksi_Model'):
+            mismatched_data[column] = mapping[mismatched_data[column].to_numpy(dtype=np.int64)].astype(np.uint8)
+    segments = partial['mismatch_segments']
+    if not segments.empty:
+        segments['code_expected'] = mapping[segments['code_expected'].to_numpy(dtype=np.int64)]
+        segments['code_predicted'] = mapping[segments['code_predicted'].to_numpy(dtype=np.int64)]
+    return partial
@@ -0,0 +1,107 @@
+"""
+Kernel metrik klasifikasi berbasis numpy.
+
+Confusion matrix dibangun dengan satu np.bincount atas pasangan kode integer
+(kebenaran * n_label + prediksi). Semua metrik lain (precision, recall,
+f1-score, support, akurasi per kelas dan keseluruhan, macro/weighted avg)
+diturunkan dari matriks itu. Karena fungsi metrik menerima matriks yang sudah
+teragregasi, hasil banyak file cukup dijumlahkan matriksnya lalu dihitung sekali.
+"""
+import numpy as np
+
+AVERAGES = ['macro avg', 'weighted avg']
+
+
+def confusion_matrix(true_codes, pred_codes, n_labels, weights=None):
+    """
+    Confusion matrix n_labels x n_labels (baris = kebenaran, kolom = prediksi)
+    dengan satu np.bincount. weights memberi bobot per pasangan, misalnya
+    panjang irisan run (lihat rle.confusion_from_runs).
+    """
+    pairs = np.asarray(true_codes, dtype=np.int64) * n_labels + np.asarray(pred_codes, dtype=np.int64)
+    counts = np.bincount(pairs, weights=weights, minlength=n_labels * n_labels)
+    if weights is not None:
+        counts = np.rint(counts)
+    return counts.astype(np.int64).reshape(n_labels, n_labels)
+
+
+def classification_metrics(confusion):
+    """
+    Semua metrik dari satu confusion matrix (boleh jumlah matriks banyak file).
+    Per kelas: precision, recall, f1-score, support, benar dan akurasi kelas
+    (benar / support); keseluruhan: accuracy, total, macro avg dan weighted avg.
+    Pembagian nol menghasilkan 0 seperti zero_division=0 di sklearn.
+    """
+    confusion = np.asarray(confusion, dtype=np.int64)
+    correct = np.diag(confusion)
+    support = confusion.sum(axis=1)
+    predicted = confusion.sum(axis=0)
+    total = int(support.sum())
+    with np.errstate(divide='ignore', invalid='ignore'):
+        precision = np.where(predicted > 0, correct / predicted, 0.0)
+        recall = np.where(support > 0, correct / support, 0.0)
+        f1 = np.where(support + predicted > 0, 2 * correct / (support + predicted), 0.0)
+    metrics = {
+        'precision': precision,
+        'recall': recall,
+        'f1-score': f1,
+        'support': support,
+        'correct': correct,
+        'class accuracy': recall,
+        'accuracy': correct.sum() / total if total else 0.0,
+        'total': total,
+    }
+    for average, weights in (('macro avg', None), ('weighted avg', support)):
+        metrics[average] = {name: float(np.average(metrics[name], weights=weights)) if total else 0.0
+                            for name in ('precision', 'recall', 'f1-score')}
+        metrics[average]['support'] = total
+    return metrics
+
+
+def class_report(confusion, labels):
+    """
+    Laporan klasifikasi (dict berformat output_dict classification_report dan
+    teksnya) dari confusion matrix terakumulasi, untuk label yang muncul saja.
+    """
+    cm, labels = sorted_confusion(confusion, labels)
+    metrics = classification_metrics(cm)
+    report_dict = {}
+    for i, label in enumerate(labels):
+        report_dict[label] = {
+            'precision': float(metrics['precision'][i]),
+            'recall': float(metrics['recall'][i]),
+            'f1-score': float(metrics['f1-score'][i]),
+            'support': int(metrics['support'][i]),
+        }
+    report_dict['accuracy'] = float(metrics['accuracy'])
+    for average in AVERAGES:
+        report_dict[average] = metrics[average]
+    return report_dict, format_class_report(report_dict, labels)
+
+
+def format_class_report(report_dict, labels, digits=2):
+    """Teks laporan berformat classification_report dengan support bilangan bulat."""
+    width = max(len(name) for name in list(labels) + AVERAGES)
+    headers = ['precision', 'recall', 'f1-score', 'support']
+    lines = [f"{'':>{width}s} " + ''.join(f" {h:>9}" for h in headers), '']
+    for name in list(labels) + [None] + AVERAGES:
+        if name is None:
+            lines.append('')
+            accuracy = report_dict['accuracy']
+            support = int(round(report_dict['weighted avg']['support']))
+            lines.append(f"{'accuracy':>{width}s} " + f" {'':>9}" * 2 + f" {accuracy:>9.{digits}f}" + f" {support:>9}")
+            continue
+        row = report_dict[name]
+        lines.append(f"{name:>{width}s} " + ''.join(f" {row[k]:>9.{digits}f}" for k in headers[:3]) + f" {int(round(row['support'])):>9}")
+    return '\n'.join(lines) + '\n'
+
+
+def sorted_confusion(confusion, labels):
+    """
+    Confusion matrix dengan baris/kolom diurutkan menurut nama label; label yang
+    tidak pernah muncul (baik sebagai kebenaran maupun prediksi) dibuang.
+    """
+    labels = list(labels)
+    present = (confusion.sum(axis=0) + confusion.sum(axis=1)) > 0
+    order = sorted(np.flatnonzero(present), key=labels.__getitem__)
+    return confusion[np.ix_(order, order)], [labels[i] for i in order]
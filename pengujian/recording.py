@@ -0,0 +1,267 @@
+"""
+Format rekaman biner berlebar tetap (.pgrec) untuk file percobaan.
+
+File CSV percobaan menyimpan arus dengan 8 desimal dan Timestamp lengkap di
+setiap baris, sehingga ukurannya beberapa kali lipat data yang dikandungnya
+dan parsing teks mendominasi waktu pemuatan. Rekaman biner menyimpan setiap
+baris sebagai satu record numpy terstruktur (packed) dengan lebar tetap:
+
+- Timestamp: int64 nanodetik (NaT = nilai int64 terkecil);
+- kolom angka (tegangan, arus, fitur): float32 jika setiap nilai kembali ke
+  teks CSV yang sama, selain itu float64; kolom bilangan bulat memakai int
+  terkecil yang cukup; kolom waktu relatif selalu float64;
+- kolom label dan teks lain: kode uint8 ke daftar kategori di header (255 =
+  kosong, paling banyak 127 kategori); teks angka yang tidak kembali utuh
+  dari int/float (misalnya '007') juga disimpan sebagai kode dan dibaca
+  sebagai float64.
+
+Header kecil (MAGIC, panjang, JSON) mencatat skema, ukuran window, nama,
+jenis, dtype dan jumlah desimal setiap kolom. Jumlah baris dihitung dari
+ukuran file sehingga perekam dapat terus menambahkan record di akhir file.
+
+Konversi dari kedua skema CSV lossless: csv_to_recording menolak kolom yang
+tidak dapat dikembalikan ke teks aslinya, dan recording_to_csv menghasilkan
+ulang CSV yang sama byte demi byte. read_recording membuka record lewat
+numpy.memmap dan mengembalikan kolom berformat loader.frame_to_columns tanpa
+menyalin data; loader dan discover_trials membaca .pgrec seperti CSV.
+
+    python -m pengujian --to-recording <folder> 25ws
+    python -m pengujian --base-dir <folder> 25ws
+"""
+import json
+import os
+import re
+import struct
+
+import numpy as np
+import pandas as pd
+
+from .config import SCHEMAS
+
+RECORDING_SUFFIX = '.pgrec'
+RECORDING_VERSION = 1
+MAGIC = b'PGREC\x00\x00\x01'
+MISSING_CODE = 255
+MAX_CATEGORIES = 127
+TIMESTAMP_TEXT_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+_INTEGER = re.compile(r'^-?\d+$')
+_INT_TYPES = [np.int8, np.int16, np.int32, np.int64]
+
+
+def is_recording(path):
+    return os.fspath(path).lower().endswith(RECORDING_SUFFIX)
+
+
+def _decimals(text):
+    """Jumlah desimal yang sama untuk semua teks angka, atau None jika berbeda-beda."""
+    digits = {len(value) - value.index('.') - 1 if '.' in value else 0 for value in pd.unique(text)}
+    return digits.pop() if len(digits) == 1 else None
+
+
+def _format_numbers(values, decimals):
+    if decimals is None:
+        return np.array([repr(float(v)) for v in values], dtype=object)
+    return np.char.mod(f'%.{decimals}f', values.astype(np.float64)).astype(object)
+
+
+def _encode_time(name, text):
+    present = text != ''
+    parsed = pd.to_datetime(text.where(present), format=TIMESTAMP_TEXT_FORMAT, errors='coerce')
+    if parsed[present].isna().any():
+        raise ValueError(f"Kolom '{name}' berisi waktu yang tidak dapat dikonversi tanpa kehilangan")
+    decimals = _decimals(text[present]) if present.any() else 3
+    column = {'name': name, 'kind': 'datetime', 'dtype': '<i8', 'decimals': decimals}
+    data = parsed.to_numpy(dtype='datetime64[ns]')
+    if not np.array_equal(_time_text(data, decimals), text.to_numpy(dtype=object)):
+        raise ValueError(f"Kolom '{name}' tidak dapat dikonversi tanpa kehilangan")
+    return column, data.view(np.int64)
+
+
+def _time_text(data, decimals):
+    text = pd.Series(data).dt.strftime(TIMESTAMP_TEXT_FORMAT)
+    if decimals == 0:
+        text = text.str[:-7]
+    elif decimals < 6:
+        text = text.str[:decimals - 6]
+    return text.fillna('').to_numpy(dtype=object)
+
+
+def _encode_number(name, text, time_column=False):
+    """(kolom header, array) untuk kolom angka, atau None jika kolom bukan angka."""
+    present = text != ''
+    try:
+        values = pd.to_numeric(text.where(present)).to_numpy(dtype=np.float64)
+    except (ValueError, TypeError):
+        return None
+    original = text.to_numpy(dtype=object)
+    if not time_column and present.all() and text.map(_INTEGER.match).notna().all():
+        ints = text.astype(np.int64).to_numpy()
+        # '007' atau '-0' tidak kembali ke teks yang sama; simpan sebagai float/kategori.
+        if np.array_equal(ints.astype(str).astype(object), original):
+            dtype = next(t for t in _INT_TYPES if ints.min(initial=0) >= np.iinfo(t).min and ints.max(initial=0) <= np.iinfo(t).max)
+            return {'name': name, 'kind': 'integer', 'dtype': np.dtype(dtype).str, 'decimals': 0}, ints.astype(dtype)
+    decimals = _decimals(text[present]) if present.any() else None
+    candidates = [np.float64] if time_column else [np.float32, np.float64]
+    for dtype in candidates:
+        data = values.astype(dtype)
+        formatted = _format_numbers(data, decimals)
+        formatted[~present.to_numpy()] = ''
+        if np.array_equal(formatted, original):
+            return {'name': name, 'kind': 'float', 'dtype': np.dtype(dtype).str, 'decimals': decimals}, data
+    if time_column:
+        raise ValueError(f"Kolom '{name}' tidak dapat dikonversi tanpa kehilangan")
+    # Teks angka yang tidak kembali utuh ('007', '+5') disimpan sebagai kode
+    # kategori, tetapi tetap dibaca sebagai angka.
+    column, codes = _encode_category(name, text)
+    return {**column, 'kind': 'number_category'}, codes
+
+
+def _encode_category(name, text):
+    present = text != ''
+    codes, categories = pd.factorize(text.where(present))
+    if len(categories) > MAX_CATEGORIES:
+        raise ValueError(f"Kolom '{name}' memiliki lebih dari {MAX_CATEGORIES} nilai berbeda")
+    codes = np.where(codes < 0, MISSING_CODE, codes).astype(np.uint8)
+    return {'name': name, 'kind': 'category', 'dtype': '|u1', 'categories': [str(c) for c in categories]}, codes
+
+
+def record_dtype(columns):
+    """dtype record terstruktur (packed) untuk daftar kolom header; field ke-i bernama c<i>."""
+    return np.dtype([(f"c{i}", col['dtype']) for i, col in enumerate(columns)])
+
+
+def _header_bytes(header):
+    body = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    body += b' ' * (-(len(MAGIC) + 4 + len(body)) % 8)
+    return MAGIC + struct.pack('<I', len(body)) + body
+
+
+def csv_to_recording(csv_path, out_path, schema_name, window_size=None):
+    """
+    Mengonversi satu CSV percobaan (skema 'sistem' atau 'percobaan') ke
+    rekaman biner out_path. Mengembalikan header rekaman. ValueError jika ada
+    kolom yang tidak dapat dikembalikan persis ke teks CSV-nya.
+    """
+    time_column = SCHEMAS[schema_name]['time_column']
+    text = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+    columns, arrays = [], []
+    for name in text.columns:
+        values = text[name]
+        if name.strip() == time_column and time_column == 'Timestamp':
+            encoded = _encode_time(name, values)
+        else:
+            encoded = _encode_number(name, values, name.strip() == time_column) or _encode_category(name, values)
+        columns.append(encoded[0])
+        arrays.append(encoded[1])
+    header = {'version': RECORDING_VERSION, 'schema': schema_name, 'window_size': window_size,
+              'source': os.path.basename(csv_path), 'columns': columns}
+    records = np.empty(len(text), dtype=record_dtype(columns))
+    for i, data in enumerate(arrays):
+        records[f"c{i}"] = data
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    tmp_path = out_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_header_bytes(header))
+        f.write(records.tobytes())
+    os.replace(tmp_path, out_path)
+    return header
+
+
+def read_header(f):
+    """(header, offset data) dari file rekaman yang terbuka dalam mode biner."""
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"'{f.name}' bukan rekaman biner pengujian")
+    (length,) = struct.unpack('<I', f.read(4))
+    header = json.loads(f.read(length).decode('utf-8'))
+    if header.get('version') != RECORDING_VERSION:
+        raise ValueError(f"Versi rekaman '{f.name}' tidak didukung: {header.get('version')}")
+    return header, len(MAGIC) + 4 + length
+
+
+def open_recording(path):
+    """(header, memmap record) untuk satu rekaman; record parsial di akhir file (sedang ditulis) diabaikan."""
+    with open(path, 'rb') as f:
+        header, offset = read_header(f)
+    dtype = record_dtype(header['columns'])
+    rows = (os.path.getsize(path) - offset) // dtype.itemsize
+    if rows == 0:
+        return header, np.empty(0, dtype=dtype)
+    return header, np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(rows,))
+
+
+def decode_records(header, records):
+    """
+    Kolom berformat loader.frame_to_columns dari record: view tanpa salinan
+    (datetime64[ns] untuk Timestamp, Categorical di atas kode untuk label).
+    """
+    columns = {}
+    for i, col in enumerate(header['columns']):
+        data = records[f"c{i}"]
+        if col['kind'] == 'datetime':
+            data = data.view('datetime64[ns]')
+        elif col['kind'] == 'category':
+            # Kode 255 dibaca sebagai int8 -1, yaitu nilai kosong Categorical.
+            data = pd.Categorical.from_codes(data.view(np.int8), categories=col['categories'], validate=False)
+        elif col['kind'] == 'number_category':
+            values = np.append(pd.to_numeric(pd.Series(col['categories'])).to_numpy(dtype=np.float64), np.nan)
+            data = values[data.view(np.int8)]
+        columns[col['name'].strip()] = data
+    return columns
+
+
+def read_recording(path):
+    """Kolom satu rekaman (lihat decode_records) yang dibuka lewat numpy.memmap."""
+    header, records = open_recording(path)
+    return decode_records(header, records)
+
+
+def recording_to_csv(path, csv_path):
+    """Menulis ulang rekaman sebagai CSV dengan teks yang sama seperti CSV sumbernya."""
+    header, records = open_recording(path)
+    text = {}
+    for i, col in enumerate(header['columns']):
+        data = np.asarray(records[f"c{i}"])
+        if col['kind'] == 'datetime':
+            text[col['name']] = _time_text(data.view('datetime64[ns]'), col['decimals'])
+        elif col['kind'] in ('category', 'number_category'):
+            names = np.array(col['categories'] + [''] * (MISSING_CODE + 1 - len(col['categories'])), dtype=object)
+            text[col['name']] = names[data]
+        elif col['kind'] == 'integer':
+            text[col['name']] = data.astype(str).astype(object)
+        else:
+            formatted = _format_numbers(data, col['decimals'])
+            formatted[np.isnan(data)] = ''
+            text[col['name']] = formatted
+    pd.DataFrame(text).to_csv(csv_path, index=False, lineterminator='\n')
+
+
+def convert_datasets(names=None, *, config_path=None, base_dir='.', output_root='.'):
+    """
+    Mengonversi semua file percobaan dataset (atau yang dipilih lewat names)
+    ke rekaman biner di output_root dengan susunan folder yang sama, sehingga
+    output_root dapat dipakai sebagai --base-dir. Mengembalikan jumlah file.
+    """
+    from .config import load_config, select_datasets
+    from .loader import discover_trials
+
+    converted = 0
+    for dataset in select_datasets(load_config(config_path), names):
+        trials, _ = discover_trials(dataset, base_dir)
+        paths = dict.fromkeys(path for _, truth_path, pred_path in trials for path in (truth_path, pred_path))
+        source_bytes = target_bytes = 0
+        for path in paths:
+            if is_recording(path):
+                continue
+            out_path = os.path.join(output_root, os.path.splitext(os.path.relpath(path, base_dir))[0] + RECORDING_SUFFIX)
+            try:
+                csv_to_recording(path, out_path, dataset['schema'], dataset.get('window_size'))
+            except Exception as e:
+                print(f"Gagal mengonversi '{path}': {e}")
+                continue
+            converted += 1
+            source_bytes += os.path.getsize(path)
+            target_bytes += os.path.getsize(out_path)
+        if source_bytes:
+            print(f"{dataset['name']}: {len(paths)} file, {source_bytes / 2**20:.2f} MB CSV -> "
+                  f"{target_bytes / 2**20:.2f} MB rekaman biner ({target_bytes / source_bytes * 100:.0f}%).")
+    return converted
@@ -0,0 +1,217 @@
+"""
+Pembuatan gambar PNG laporan (tabel, confusion matrix dan grafik perbandingan).
+
+Writer laporan tidak menggambar langsung, tetapi mendaftarkan gambar ke
+FigureRenderer. Setiap gambar diberi sidik jari dari isi masukannya; gambar
+yang sidik jarinya sama dengan run sebelumnya dan file PNG-nya masih ada tidak
+digambar ulang. Gambar sisanya digambar dengan backend Agg, paralel di proses
+pekerja jika ada lebih dari satu CPU. Dengan enabled=False tidak ada PNG yang
+dibuat sama sekali (hanya keluaran yang dapat dibaca mesin).
+
+matplotlib dan seaborn baru diimpor saat gambar pertama benar-benar digambar.
+"""
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .timing import stage
+
+RENDER_VERSION = 1
+FINGERPRINT_FILE = '.sidik_jari_gambar.json'
+
+
+def _pyplot():
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def draw_table(output_path, df, title, footer_text=None):
+    plt = _pyplot()
+    fig_height = 2 + len(df) * 0.5 + (1 if footer_text else 0)
+    fig, ax = plt.subplots(figsize=(max(10, 1.6 * len(df.columns)), fig_height), dpi=200)
+    ax.axis('tight')
+    ax.axis('off')
+
+    table = ax.table(cellText=df.values, colLabels=df.columns, cellLoc='center', loc='center')
+    table.auto_set_font_size(False)
+    table.set_fontsize(10)
+    table.scale(1.2, 1.2)
+
+    for (i, j), cell in table.get_celld().items():
+        if i == 0:
+            cell.set_text_props(weight='bold', color='white')
+            cell.set_facecolor('#40466e')
+
+    plt.title(title, fontsize=16, pad=20, weight='bold')
+
+    if footer_text:
+        plt.figtext(0.5, 0.05, footer_text, ha="center", fontsize=12, weight='bold')
+
+    plt.tight_layout(pad=1)
+    plt.savefig(output_path, bbox_inches='tight', pad_inches=0.5)
+    plt.close(fig)
+
+
+def draw_confusion_matrix(output_path, cm, labels, title, ylabel, xlabel, figsize=(12, 9)):
+    plt = _pyplot()
+    import seaborn as sns
+    plt.figure(figsize=figsize)
+    sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', xticklabels=labels, yticklabels=labels, annot_kws={"size": 14})
+    plt.title(title, fontsize=16)
+    plt.ylabel(ylabel, fontsize=12)
+    plt.xlabel(xlabel, fontsize=12)
+    plt.xticks(rotation=45, ha="right")
+    plt.yticks(rotation=0)
+    plt.tight_layout()
+    plt.savefig(output_path)
+    plt.close()
+
+
+def draw_window_comparison(output_path, table, title):
+    """
+    Grafik perbandingan ukuran window (compare.build_comparison_table):
+    akurasi dan F1 per kelas, lalu persentil waktu tunda dalam detik dan sampel.
+    """
+    plt = _pyplot()
+    windows = table['Ukuran Window'].to_numpy()
+    panels = [
+        ('Akurasi dan F1 (%)', [c for c in table.columns if c == 'Akurasi (%)' or c.startswith('F1 ')]),
+        ('Waktu Tunda (detik)', [c for c in table.columns if c.startswith('Tunda') and c.endswith('(detik)')]),
+        ('Waktu Tunda (sampel)', [c for c in table.columns if c.startswith('Tunda') and c.endswith('(sampel)')]),
+    ]
+    fig, axes = plt.subplots(1, len(panels), figsize=(6 * len(panels), 5), dpi=150)
+    for ax, (ylabel, columns) in zip(axes, panels):
+        for column in columns:
+            values = table[column].to_numpy(dtype=float)
+            if column.startswith('F1 '):
+                values = values * 100
+            ax.plot(windows, values, marker='o', label=column.split(' (')[0])
+        ax.set_xlabel('Ukuran Window', fontsize=12)
+        ax.set_ylabel(ylabel, fontsize=12)
+        ax.set_xticks(windows)
+        ax.grid(True, alpha=0.3)
+        ax.legend(fontsize=9)
+    fig.suptitle(title, fontsize=16, weight='bold')
+    fig.tight_layout()
+    fig.savefig(output_path, bbox_inches='tight')
+    plt.close(fig)
+
+
+DRAWERS = {
+    'tabel': (draw_table, "-> Gambar Tabel '{path}' berhasil disimpan.", "Gagal membuat gambar tabel '{name}': {error}"),
+    'confusion_matrix': (draw_confusion_matrix, "-> Gambar Confusion Matrix '{path}' berhasil disimpan.", "Gagal membuat gambar Confusion Matrix: {error}"),
+    'perbandingan_window': (draw_window_comparison, "-> Grafik Perbandingan '{path}' berhasil disimpan.", "Gagal membuat grafik perbandingan '{name}': {error}"),
+}
+
+
+def _draw(kind, output_path, args, kwargs):
+    DRAWERS[kind][0](output_path, *args, **kwargs)
+
+
+def fingerprint(kind, args, kwargs):
+    """Sidik jari sha1 dari jenis gambar dan semua masukannya."""
+    digest = hashlib.sha1(f"{RENDER_VERSION}|{kind}".encode('utf-8'))
+    for value in list(args) + sorted(kwargs.items()):
+        if isinstance(value, pd.DataFrame):
+            value = value.to_csv(index=False)
+        elif isinstance(value, np.ndarray):
+            value = f"{value.dtype}|{value.shape}|{value.tobytes().hex()}"
+        digest.update(b'\0' + repr(value).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class FigureRenderer:
+    """
+    Antrean gambar laporan. submit() hanya mencatat gambar; close() menggambar
+    semuanya (paralel jika workers > 1) dan menyimpan sidik jarinya.
+    """
+
+    def __init__(self, enabled=True, workers=None):
+        self.enabled = enabled
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.jobs = []
+        self.skipped = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def table(self, df, output_folder, filename, title, footer_text=None):
+        self.submit('tabel', os.path.join(output_folder, filename), df, title, footer_text=footer_text)
+
+    def confusion_matrix(self, cm, labels, output_path, title, ylabel, xlabel, figsize=(12, 9)):
+        self.submit('confusion_matrix', output_path, cm, labels, title, ylabel, xlabel, figsize=figsize)
+
+    def window_comparison(self, table, output_path, title):
+        self.submit('perbandingan_window', output_path, table, title)
+
+    def submit(self, kind, output_path, *args, **kwargs):
+        if self.enabled:
+            self.jobs.append((kind, output_path, args, kwargs, fingerprint(kind, args, kwargs)))
+
+    def close(self):
+        """Menggambar semua gambar yang berubah lalu mengosongkan antrean."""
+        jobs, self.jobs = self.jobs, []
+        stored = {}
+        pending = []
+        for job in jobs:
+            kind, output_path, _, _, digest = job
+            folder, name = os.path.split(output_path)
+            if folder not in stored:
+                stored[folder] = _read_fingerprints(folder)
+            if stored[folder].get(name) == digest and os.path.exists(output_path):
+                print(f"-> Gambar '{output_path}' tidak berubah, dilewati.")
+                self.skipped += 1
+            else:
+                pending.append(job)
+
+        workers = min(self.workers, len(pending))
+        with stage('png_render'):
+            if workers > 1:
+                # spawn: proses pekerja tidak mewarisi thread pool (pyarrow, BLAS) milik induk.
+                with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+                    futures = [pool.submit(_draw, kind, path, args, kwargs) for kind, path, args, kwargs, _ in pending]
+                    outcomes = [_outcome(future.result) for future in futures]
+            else:
+                outcomes = [_outcome(_draw, kind, path, args, kwargs) for kind, path, args, kwargs, _ in pending]
+
+        for (kind, output_path, _, _, digest), error in zip(pending, outcomes):
+            folder, name = os.path.split(output_path)
+            if error is None:
+                print(DRAWERS[kind][1].format(path=output_path))
+                stored[folder][name] = digest
+            else:
+                print(DRAWERS[kind][2].format(name=name, error=error))
+                stored[folder].pop(name, None)
+        for folder, fingerprints in stored.items():
+            _write_fingerprints(folder, fingerprints)
+
+
+def _outcome(func, *args):
+    try:
+        func(*args)
+    except Exception as e:
+        return e
+    return None
+
+
+def _read_fingerprints(folder):
+    try:
+        with open(os.path.join(folder, FINGERPRINT_FILE), encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _write_fingerprints(folder, fingerprints):
+    with open(os.path.join(folder, FINGERPRINT_FILE), 'w', encoding='utf-8') as f:
+        json.dump(fingerprints, f, ensure_ascii=False, indent=1)
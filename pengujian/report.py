@@ -0,0 +1,325 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from .export import write_excel
+from .metrics import class_report, classification_metrics, sorted_confusion
+from .segments import SEGMENT_FILE, build_segment_table
+from .timing import stage
+
+ORDERED_TRANSITIONS = ['Arc ke Normal', 'Arc ke Off', 'Normal ke Arc', 'Off ke Arc']
+DELAY_TRANSITIONS = ['NORMAL ke ARC FLASH', 'ARC FLASH ke NO CONTACT', 'NO CONTACT ke ARC FLASH', 'ARC FLASH ke NORMAL']
+KOLOM_LAPORAN_KESALAHAN = ['Sumber_File', 'Timestamp', 'Tegangan_V', 'Arus_A', 'Mean_V', 'Std_Dev_V', 'Mean_I', 'Std_Dev_I', 'Label_Seharusnya', 'Prediksi_Model', 'Label_Numerik']
+
+
+def delay_label_names(delays, names):
+    """Nama label asal dan tujuan setiap baris tunda (diturunkan dari kode)."""
+    names = np.asarray(names, dtype=object)
+    return (pd.Series(names[delays['code_from'].to_numpy(dtype=np.int64)], index=delays.index),
+            pd.Series(names[delays['code_to'].to_numpy(dtype=np.int64)], index=delays.index))
+
+
+def delay_statistics(delays, keys, order=None):
+    """
+    Statistik waktu tunda per jenis transisi dalam dua satuan: sampel (baris
+    data, delay_rows) dan detik (delay_seconds; baris tanpa waktu valid
+    diabaikan). keys sejajar dengan delays; order menentukan urutan dan jenis
+    transisi yang dilaporkan (bawaan: urutan kemunculan). Setiap nilai berupa
+    (rata-rata, minimum, maksimum) atau None jika tidak ada data.
+    """
+    keys = pd.Series(np.asarray(keys, dtype=object), index=delays.index)
+    if order is None:
+        order = list(pd.unique(keys))
+    stats = {}
+    for key in order:
+        selected = delays[keys == key]
+        rows = selected['delay_rows'].to_numpy(dtype=float)
+        seconds = selected['delay_seconds'].dropna().to_numpy(dtype=float)
+        stats[key] = {
+            'sampel': (rows.mean(), rows.min(), rows.max()) if len(rows) else None,
+            'detik': (seconds.mean(), seconds.min(), seconds.max()) if len(seconds) else None,
+        }
+    return stats
+
+
+def build_delay_table(delays, names):
+    """Tabel waktu tunda per jenis transisi ('Dari ... ke ...') dalam baris data dan detik."""
+    label_from, label_to = delay_label_names(delays, names)
+    delay_summary = []
+    for key, stats in delay_statistics(delays, 'Dari ' + label_from + ' ke ' + label_to).items():
+        avg_rows, min_rows, max_rows = stats['sampel']
+        avg_seconds, min_seconds, max_seconds = stats['detik'] or (np.nan, np.nan, np.nan)
+        delay_summary.append({
+            "Jenis Transisi": key,
+            "Rata-rata (baris data)": round(avg_rows, 2),
+            "Minimum (baris data)": int(min_rows),
+            "Maksimum (baris data)": int(max_rows),
+            "Rata-rata (detik)": round(avg_seconds, 3),
+            "Minimum (detik)": round(min_seconds, 3),
+            "Maksimum (detik)": round(max_seconds, 3)
+        })
+    return pd.DataFrame(delay_summary)
+
+
+def tests_per_transition(delays, vocabulary):
+    """Jumlah file (percobaan) yang memuat setiap jenis transisi."""
+    if delays.empty:
+        return {}
+    keys = [vocabulary.transition_key(f, t) for f, t in zip(delays['code_from'], delays['code_to'])]
+    return delays.assign(key=keys).groupby('key')[['scenario', 'source']].apply(lambda g: len(g.drop_duplicates())).to_dict()
+
+
+def _format_persen_koma(value):
+    return f"{value*100:,.2f}".replace('.', ',')
+
+
+def build_transition_table(transition_counts, delays, vocabulary):
+    num_tests = tests_per_transition(delays, vocabulary)
+
+    transition_summary = []
+    for key in ORDERED_TRANSITIONS:
+        if key in transition_counts:
+            total_data, benar = transition_counts[key]['total'], transition_counts[key]['benar']
+            salah = total_data - benar
+            akurasi = benar / total_data if total_data else 0
+            transition_summary.append({'Nama Kondisi': key, 'Jumlah Pengujian': num_tests.get(key, 0), 'Total Data': total_data, 'Prediksi Benar': benar, 'Prediksi Salah': salah, 'Akurasi (%)': _format_persen_koma(akurasi)})
+
+    df_transition = pd.DataFrame()
+    if transition_summary:
+        df_transition = pd.DataFrame(transition_summary)
+        total_row = df_transition[['Total Data', 'Prediksi Benar', 'Prediksi Salah']].sum()
+        total_row['Nama Kondisi'] = 'Total'
+        total_row['Jumlah Pengujian'] = df_transition['Jumlah Pengujian'].sum()
+        total_row['Akurasi (%)'] = _format_persen_koma(total_row['Prediksi Benar'] / total_row['Total Data'])
+        df_transition = pd.concat([df_transition, pd.DataFrame(total_row).T], ignore_index=True)
+    return df_transition
+
+
+def build_class_report_table(confusion, labels, display_names):
+    report_dict, _ = class_report(confusion, labels)
+    df_report = pd.DataFrame(report_dict).transpose()
+    df_report.rename(columns={'precision': 'Precision', 'recall': 'Recall', 'f1-score': 'F1-Score', 'support': 'Support'}, inplace=True)
+    df_report['Support'] = df_report['Support'].fillna(confusion.sum()).astype(int).astype(str)
+    df_report.loc['accuracy', 'Support'] = ''
+    df_report.index.name = 'Kelas'
+    df_report.reset_index(inplace=True)
+    df_report['Kelas'] = df_report['Kelas'].replace(dict(zip(labels, display_names)))
+    return df_report
+
+
+def build_class_summary_table(confusion, labels):
+    cm_all, labels = sorted_confusion(confusion, labels)
+    metrics = classification_metrics(cm_all)
+    summary_data = []
+    for i, label in enumerate(labels):
+        total_data = metrics['support'][i]
+        if total_data == 0:
+            continue
+        benar = metrics['correct'][i]
+        summary_data.append({'Kondisi': label, 'Total Data': total_data, 'Prediksi Benar': benar, 'Prediksi Salah': total_data - benar,
+                             'Akurasi (%)': f"{metrics['class accuracy'][i] * 100:.2f}%"})
+
+    df_summary = pd.DataFrame(summary_data)
+    total_row_summary = df_summary[['Total Data', 'Prediksi Benar', 'Prediksi Salah']].sum()
+    total_row_summary['Kondisi'] = 'TOTAL KESELURUHAN'
+    total_row_summary['Akurasi (%)'] = f"{metrics['accuracy'] * 100:.2f}%"
+    return pd.concat([df_summary, pd.DataFrame(total_row_summary).T], ignore_index=True)
+
+
+def build_metrics_summary(result):
+    """
+    Ringkasan untuk mode metrik saja: akurasi keseluruhan, metrik per kelas
+    (metrics.classification_metrics) dan tabel waktu tunda.
+    """
+    cm, labels = sorted_confusion(result['confusion'], result['label_names'])
+    metrics = classification_metrics(cm)
+    classes = pd.DataFrame({
+        'Kelas': labels,
+        'Precision': metrics['precision'].round(4),
+        'Recall': metrics['recall'].round(4),
+        'F1-Score': metrics['f1-score'].round(4),
+        'Support': metrics['support'],
+    })
+    return {
+        'rows': metrics['total'],
+        'accuracy': metrics['accuracy'],
+        'classes': classes,
+        'delays': build_delay_table(result['delays'], result['label_names']),
+    }
+
+
+def mismatch_info_rows(result, output_folder, shown):
+    """Isi sheet 'Info Kesalahan' saat sheet 'Detail Kesalahan' dipotong: jumlah baris dan tautan ke file spill."""
+    link = os.path.relpath(result['mismatch_spill'], output_folder)
+    return [
+        ['Keterangan', 'Nilai'],
+        ['Total baris kesalahan', result['mismatch_rows']],
+        ['Baris di sheet Detail Kesalahan', shown],
+        ['File detail kesalahan lengkap', {'value': link, 'hyperlink': link}],
+    ]
+
+
+def write_segment_table(result, output_folder):
+    """
+    Menulis segmen_kesalahan.csv (satu baris per deretan mismatch berurutan,
+    lihat segments) dan mengembalikan tabelnya; None jika tidak ada kesalahan.
+    """
+    if not result['mismatch_segments']:
+        return None
+    table = build_segment_table(pd.concat(result['mismatch_segments'], ignore_index=True), result['label_names'])
+    table.to_csv(os.path.join(output_folder, SEGMENT_FILE), index=False)
+    print(f"\nLaporan '{SEGMENT_FILE}' ({len(table)} segmen, {result['mismatch_rows']} baris) berhasil dibuat di folder '{output_folder}'!")
+    return table
+
+
+def write_laporan_lengkap(result, output_folder, renderer):
+    """
+    Format laporan 10ws/20ws/25ws: tabel PNG, workbook Excel lengkap dan
+    confusion matrix gabungan. Gambar PNG didaftarkan ke renderer
+    (render.FigureRenderer) dan digambar saat renderer ditutup.
+    """
+    print("\n\n" + "="*50)
+    print(f"---                  HASIL AKHIR PENGUJIAN {result['dataset']['name']}                  ---")
+    print("="*50)
+
+    print("\n--- Hasil Akurasi per Skenario Transisi ---")
+    df_transition = build_transition_table(result['transition_counts'], result['delays'], result['vocabulary'])
+    if not df_transition.empty:
+        print(df_transition.to_string(index=False))
+        renderer.table(df_transition, output_folder, 'hasil_akurasi_per_transisi.png', 'Tabel 4.9 Hasil Akurasi per Skenario Transisi')
+
+    print("\n--- Laporan Metrik Klasifikasi per Kelas ---")
+    df_report = build_class_report_table(result['confusion'], result['label_names'], result['display_names'])
+    print(df_report.to_string(index=False))
+    renderer.table(df_report, output_folder, 'laporan_metrik_klasifikasi.png', 'Tabel 4.10 Laporan Metrik Klasifikasi per Kelas')
+
+    print("\n--- Ringkasan Gabungan dari Semua Skenario ---")
+    df_summary = build_class_summary_table(result['confusion'], result['label_names'])
+    print(df_summary.to_string(index=False))
+    renderer.table(df_summary, output_folder, 'ringkasan_hasil_akhir.png', 'Ringkasan Hasil Akhir Pengujian')
+
+    print("\n--- Analisis Waktu Tunda Deteksi ---")
+    print(f"{'Jenis Transisi':<25} | {'Rata-rata (detik)':<20} | {'Minimum (detik)':<20} | {'Maksimum (detik)':<20} | {'Rata-rata (sampel)':<20} | {'Minimum (sampel)':<18} | {'Maksimum (sampel)':<18}")
+    print("-" * 158)
+    delays = result['delays']
+    label_from, label_to = delay_label_names(delays, result['label_names'])
+    delay_stats = delay_statistics(delays, label_from + ' ke ' + label_to, DELAY_TRANSITIONS)
+
+    delay_summary_list = []
+    for transition, stats in delay_stats.items():
+        row = {'Jenis Transisi': transition}
+        if stats['detik'] is not None:
+            avg_delay, min_delay, max_delay = stats['detik']
+            row.update({'Rata-rata (detik)': f"{avg_delay:.3f}", 'Minimum (detik)': f"{min_delay:.3f}", 'Maksimum (detik)': f"{max_delay:.3f}"})
+        else:
+            row.update({'Rata-rata (detik)': '(tidak ada data)', 'Minimum (detik)': '(tidak ada data)', 'Maksimum (detik)': '(tidak ada data)'})
+        if stats['sampel'] is not None:
+            avg_delay, min_delay, max_delay = stats['sampel']
+            row.update({'Rata-rata (sampel)': f"{avg_delay:.2f}", 'Minimum (sampel)': f"{min_delay:.0f}", 'Maksimum (sampel)': f"{max_delay:.0f}"})
+        else:
+            row.update({'Rata-rata (sampel)': '(tidak ada data)', 'Minimum (sampel)': '(tidak ada data)', 'Maksimum (sampel)': '(tidak ada data)'})
+        print(f"{transition:<25} | {row['Rata-rata (detik)']:<20} | {row['Minimum (detik)']:<20} | {row['Maksimum (detik)']:<20} | "
+              f"{row['Rata-rata (sampel)']:<20} | {row['Minimum (sampel)']:<18} | {row['Maksimum (sampel)']:<18}")
+        delay_summary_list.append(row)
+    print("-" * 158)
+    if result['invalid_time_rows']:
+        print(f"Catatan: {result['invalid_time_rows']} baris dengan waktu tidak valid diabaikan dalam waktu tunda (detik).")
+    df_delay_summary = pd.DataFrame(delay_summary_list)
+    renderer.table(df_delay_summary, output_folder, 'analisis_waktu_tunda_deteksi.png', 'Tabel Hasil Analisis Waktu Tunda Deteksi')
+
+    df_segments = write_segment_table(result, output_folder)
+
+    output_excel_path = os.path.join(output_folder, 'laporan_pengujian_lengkap.xlsx')
+    print(f"\nMenyimpan semua laporan ke file Excel: {output_excel_path}")
+    sheets = [(name, df) for name, df in [('Akurasi per Transisi', df_transition), ('Metrik Klasifikasi', df_report),
+                                          ('Ringkasan Gabungan', df_summary), ('Waktu Tunda Deteksi', df_delay_summary)]
+              if not df.empty]
+    if df_segments is not None:
+        sheets.append(('Segmen Kesalahan', df_segments.drop(columns=['Path Kebenaran', 'Path Prediksi'])))
+    if result['mismatches']:
+        full_error_report = pd.concat(result['mismatches'], ignore_index=True)
+        kolom_laporan = [k for k in KOLOM_LAPORAN_KESALAHAN if k in full_error_report.columns]
+        sheets.append(('Detail Kesalahan', full_error_report[kolom_laporan]))
+        if result['mismatch_rows'] > len(full_error_report) and result['mismatch_spill']:
+            sheets.append(('Info Kesalahan', mismatch_info_rows(result, output_folder, len(full_error_report))))
+    try:
+        with stage('excel_write'):
+            write_excel(output_excel_path, sheets)
+        print("-> Berhasil menyimpan file Excel.")
+    except Exception as e:
+        print(f"Gagal menyimpan file Excel: {e}")
+    if result['mismatch_spill']:
+        print(f"-> Detail kesalahan lengkap ({result['mismatch_rows']} baris) ada di '{result['mismatch_spill']}'.")
+
+    print("\nMembuat Confusion Matrix...")
+    cm, labels = sorted_confusion(result['confusion'], result['label_names'])
+    renderer.confusion_matrix(cm, labels, os.path.join(output_folder, 'confusion_matrix_gabungan.png'),
+                              'Confusion Matrix Gabungan dari Semua Data',
+                              'Label Aktual (Seharusnya)', 'Label Prediksi (Hasil Model)')
+
+
+def write_laporan_csv(result, output_folder, renderer):
+    """
+    Format laporan 50ws: laporan_akurasi.csv, laporan_metrik_lengkap.csv,
+    analisis_waktu_tunda.csv (tunda dalam baris data dan detik) dan confusion_matrix.png.
+    """
+    hasil_analisis = []
+    for nama_kondisi, counts in result['scenario_counts'].items():
+        akurasi_persen = (counts['benar'] / counts['total'] * 100) if counts['total'] > 0 else 0
+        hasil_analisis.append({
+            "Nama Kondisi": nama_kondisi,
+            "Total Data": counts['total'],
+            "Prediksi Benar (Sesuai)": counts['benar'],
+            "Prediksi Salah (Tidak Sesuai)": counts['total'] - counts['benar'],
+            "Akurasi (%)": round(akurasi_persen, 2)
+        })
+
+    laporan_df = pd.DataFrame(hasil_analisis)
+    total_data_keseluruhan = laporan_df['Total Data'].sum()
+    total_benar_keseluruhan = laporan_df['Prediksi Benar (Sesuai)'].sum()
+    total_salah_keseluruhan = laporan_df['Prediksi Salah (Tidak Sesuai)'].sum()
+    akurasi_total_gabungan = (total_benar_keseluruhan / total_data_keseluruhan * 100) if total_data_keseluruhan > 0 else 0
+    summary_row = pd.DataFrame([{"Nama Kondisi": "--- TOTAL KESELURUHAN ---", "Total Data": total_data_keseluruhan,
+                                 "Prediksi Benar (Sesuai)": total_benar_keseluruhan, "Prediksi Salah (Tidak Sesuai)": total_salah_keseluruhan,
+                                 "Akurasi (%)": round(akurasi_total_gabungan, 2)}])
+    laporan_sederhana_df = pd.concat([laporan_df, summary_row], ignore_index=True)
+    laporan_sederhana_df.to_csv(os.path.join(output_folder, "laporan_akurasi.csv"), index=False)
+    print("\n\n--- Laporan Akurasi Sederhana ---")
+    print(laporan_sederhana_df.to_string())
+    print(f"\nLaporan 'laporan_akurasi.csv' berhasil dibuat di folder '{output_folder}'!")
+
+    print("\n--- Laporan Klasifikasi Lengkap (per Kelas) ---")
+    report_dict, report_string = class_report(result['confusion'], result['label_names'])
+    print(report_string)
+    report_df = pd.DataFrame(report_dict).transpose()
+    report_df.reset_index(inplace=True)
+    report_df = report_df.rename(columns={'index': 'Kelas'})
+    report_df.to_csv(os.path.join(output_folder, "laporan_metrik_lengkap.csv"), index=False)
+    print(f"Laporan 'laporan_metrik_lengkap.csv' berhasil dibuat di folder '{output_folder}'!")
+
+    cm, labels = sorted_confusion(result['confusion'], result['label_names'])
+    renderer.confusion_matrix(cm, labels, os.path.join(output_folder, "confusion_matrix.png"),
+                              'Confusion Matrix Gabungan dari Semua Kondisi',
+                              'Output yang Diharapkan (Label Sebenarnya)', 'Output Aktual (Prediksi Sistem)',
+                              figsize=(10, 8))
+
+    print("\n--- Ringkasan Analisis Waktu Tunda ---")
+    delay_df = build_delay_table(result['delays'], result['label_names'])
+    if not delay_df.empty:
+        print(delay_df.to_string(index=False))
+        delay_df.to_csv(os.path.join(output_folder, "analisis_waktu_tunda.csv"), index=False)
+        print(f"\nLaporan 'analisis_waktu_tunda.csv' berhasil dibuat di folder '{output_folder}'!")
+    else:
+        print("Tidak ada data transisi untuk dianalisis.")
+
+    write_segment_table(result, output_folder)
+
+
+REPORT_WRITERS = {
+    'laporan_lengkap': write_laporan_lengkap,
+    'laporan_csv': write_laporan_csv,
+}
+
+# Format laporan yang memuat detail kesalahan (dan karena itu file spill mismatch).
+MISMATCH_REPORT_FORMATS = {'laporan_lengkap'}
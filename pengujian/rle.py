@@ -0,0 +1,138 @@
+"""
+Representasi run-length dari deret label.
+
+Label arc/normal/off sangat "berderet": ribuan sampel identik di antara
+beberapa transisi. Deret kebenaran dan prediksi diubah sekali menjadi
+LabelRuns (indeks awal, panjang, kode integer), lalu confusion matrix,
+akurasi per transisi dan waktu tunda dihitung dari irisan run dalam
+O(jumlah run), bukan O(jumlah sampel).
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from .metrics import confusion_matrix
+
+LabelRuns = namedtuple('LabelRuns', ['starts', 'lengths', 'codes'])
+
+
+def runs_from_codes(codes):
+    """Mengompres deret kode menjadi LabelRuns."""
+    codes = np.asarray(codes)
+    n = len(codes)
+    if n == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return LabelRuns(empty, empty, empty)
+    starts = np.concatenate(([0], np.flatnonzero(codes[1:] != codes[:-1]) + 1))
+    lengths = np.diff(np.append(starts, n))
+    return LabelRuns(starts, lengths, codes[starts].astype(np.int64))
+
+
+def total_length(runs):
+    return int(runs.lengths.sum()) if len(runs.lengths) else 0
+
+
+def run_ends(runs):
+    return runs.starts + runs.lengths
+
+
+def intersect_runs(truth, pred):
+    """
+    Memotong kedua deret run pada gabungan batasnya. Mengembalikan
+    (panjang segmen, indeks run kebenaran, indeks run prediksi) per segmen.
+    Kedua deret harus mencakup jumlah sampel yang sama.
+    """
+    n = total_length(truth)
+    if n != total_length(pred):
+        raise ValueError(f"Panjang deret berbeda: {n} (kebenaran) vs {total_length(pred)} (prediksi)")
+    if n == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty
+    bounds = np.union1d(truth.starts, pred.starts)
+    lengths = np.diff(np.append(bounds, n))
+    truth_run = np.searchsorted(truth.starts, bounds, side='right') - 1
+    pred_run = np.searchsorted(pred.starts, bounds, side='right') - 1
+    return lengths, truth_run, pred_run
+
+
+def confusion_from_runs(truth, pred, n_labels):
+    """Confusion matrix (baris = kebenaran, kolom = prediksi) dari irisan run."""
+    lengths, truth_run, pred_run = intersect_runs(truth, pred)
+    return confusion_matrix(truth.codes[truth_run], pred.codes[pred_run], n_labels, weights=lengths)
+
+
+def mismatch_segments_from_runs(truth, pred):
+    """
+    Segmen mismatch berurutan dari irisan run: setiap irisan yang kode
+    kebenaran dan prediksinya berbeda adalah satu segmen. Mengembalikan
+    (indeks awal, panjang, kode kebenaran, kode prediksi) per segmen.
+    """
+    lengths, truth_run, pred_run = intersect_runs(truth, pred)
+    starts = np.cumsum(lengths) - lengths
+    expected = truth.codes[truth_run]
+    predicted = pred.codes[pred_run]
+    bad = expected != predicted
+    return starts[bad], lengths[bad], expected[bad], predicted[bad]
+
+
+def predictions_per_truth_run(truth, pred, n_labels):
+    """
+    Jumlah sampel per kode prediksi untuk setiap run kebenaran: matriks
+    (jumlah run kebenaran, n_labels), dibangun dengan satu bincount atas irisan run.
+    """
+    lengths, truth_run, pred_run = intersect_runs(truth, pred)
+    flat = truth_run * n_labels + pred.codes[pred_run]
+    counts = np.bincount(flat, weights=lengths, minlength=len(truth.starts) * n_labels)
+    return counts.astype(np.int64).reshape(len(truth.starts), n_labels)
+
+
+def add_transition_runs(tensor, code_from, code_to, predicted):
+    """
+    Menambahkan run transisi ke tensor confusion per transisi berindeks
+    (kode asal, kode tujuan, kode prediksi). predicted berisi baris distribusi
+    prediksi setiap run (lihat predictions_per_truth_run). Kode kebenaran di
+    dalam run transisi selalu sama dengan kode tujuan, jadi sumbu kebenaran
+    tidak perlu disimpan terpisah: benar = tensor[asal, tujuan, tujuan].
+    """
+    np.add.at(tensor, (np.asarray(code_from, dtype=np.int64), np.asarray(code_to, dtype=np.int64)), predicted)
+
+
+def transition_totals(tensor):
+    """(total sampel, prediksi benar) per pasangan (kode asal, kode tujuan) dari tensor confusion per transisi."""
+    n = tensor.shape[0]
+    return tensor.sum(axis=2), tensor[:, np.arange(n), np.arange(n)]
+
+
+def first_match_in_runs(runs, targets, starts):
+    """
+    Untuk setiap pasangan (targets[k], starts[k]) mencari indeks sampel terkecil
+    i >= starts[k] dengan kode targets[k]; -1 jika tidak ada. Run diurutkan per
+    kode (dalam satu kode, akhir run sudah menaik) lalu semua kueri dijawab
+    sekaligus dengan searchsorted.
+    """
+    targets = np.asarray(targets, dtype=np.int64)
+    starts = np.asarray(starts, dtype=np.int64)
+    if len(targets) == 0 or len(runs.starts) == 0:
+        return np.full(len(targets), -1, dtype=np.int64)
+    n = total_length(runs)
+    order = np.argsort(runs.codes, kind='stable')
+    sorted_keys = runs.codes[order] * (n + 1) + run_ends(runs)[order]
+    pos = np.searchsorted(sorted_keys, targets * (n + 1) + starts, side='right')
+    found = pos < len(order)
+    pos = np.where(found, pos, 0)
+    found &= runs.codes[order[pos]] == targets
+    return np.where(found, np.maximum(runs.starts[order[pos]], starts), -1)
+
+
+def delays_from_runs(truth, pred):
+    """
+    Waktu tunda deteksi dari run: untuk setiap awal run kebenaran (kecuali yang
+    pertama) dicari sampel prediksi pertama berkode sama di posisi itu atau
+    sesudahnya. Mengembalikan (indeks run kebenaran, indeks transisi, indeks
+    prediksi) untuk transisi yang terdeteksi.
+    """
+    truth_run = np.arange(1, len(truth.starts))
+    starts = truth.starts[truth_run]
+    pred_index = first_match_in_runs(pred, truth.codes[truth_run], starts)
+    found = pred_index >= 0
+    return truth_run[found], starts[found], pred_index[found]
@@ -0,0 +1,260 @@
+"""
+Segmen mismatch: deretan baris berurutan yang label kebenaran dan prediksinya
+sama-sama tetap tetapi berbeda satu sama lain.
+
+Kesalahan prediksi datang berkelompok tepat setelah transisi, sehingga satu
+record (file, awal, akhir, durasi, label seharusnya, prediksi, jumlah baris)
+per segmen jauh lebih ringkas daripada menyalin setiap baris. Segmen dihitung
+dari tepi irisan run (rle.mismatch_segments_from_runs) per potongan lalu
+disambung di batas potongan. Baris mentah satu segmen baru dibaca saat
+diminta (segment_rows): dari cache kolumnar jika ada, atau dari CSV sumber
+dengan seek ke offset byte barisnya (RowIndex, disimpan di samping tabel
+segmen sehingga file yang sama cukup dipindai sekali).
+
+    python -m pengujian --segment-rows <output>/segmen_kesalahan.csv 0
+"""
+import hashlib
+import os
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from .loader import _column_length, frame_to_columns, time_values
+from .recording import is_recording, read_recording
+from .rle import mismatch_segments_from_runs
+
+SEGMENT_COLUMNS = ['start', 'end', 'pred_start', 'pred_end', 'count', 'code_expected', 'code_predicted', 'start_time',
+                   'end_time']
+SEGMENT_FILE = 'segmen_kesalahan.csv'
+ROW_INDEX_SUFFIX = '_indeks_baris.npz'
+
+
+def empty_segments():
+    return pd.DataFrame(columns=SEGMENT_COLUMNS)
+
+
+def split_at_gaps(starts, lengths, rows, pred_rows):
+    """
+    Memecah segmen (indeks awal, panjang dalam potongan) di posisi yang nomor
+    baris file kebenaran atau prediksinya tidak bersambung, sehingga setiap
+    segmen mencakup baris berurutan di kedua file. Mengembalikan (indeks awal,
+    panjang, indeks segmen asal) per segmen baru.
+    """
+    if len(starts) == 0:
+        return starts, lengths, np.empty(0, dtype=np.int64)
+    ends = starts + lengths - 1
+    gaps = np.flatnonzero((np.diff(rows) != 1) | (np.diff(pred_rows) != 1)) + 1
+    owner = np.searchsorted(starts, gaps, side='right') - 1
+    inside = (owner >= 0) & (gaps <= ends[np.maximum(owner, 0)]) & (gaps != starts[np.maximum(owner, 0)])
+    new_starts = np.sort(np.concatenate((starts, gaps[inside])))
+    source = np.searchsorted(starts, new_starts, side='right') - 1
+    new_ends = ends[source]
+    same = source[1:] == source[:-1]
+    new_ends[:-1][same] = new_starts[1:][same] - 1
+    return new_starts, new_ends - new_starts + 1, source
+
+
+def chunk_segments(truth_runs, pred_runs, truth_time=None, offset=0, rows=None, pred_rows=None):
+    """
+    Segmen mismatch satu potongan; indeks baris digeser offset (indeks global
+    file). Jika baris potongan sudah diselaraskan (loader._aligned_chunks),
+    rows dan pred_rows memetakan indeks potongan ke nomor baris file
+    kebenaran dan prediksi; segmen dipecah di baris yang tidak bersambung.
+    """
+    starts, lengths, expected, predicted = mismatch_segments_from_runs(truth_runs, pred_runs)
+    if rows is not None:
+        pred_rows = rows if pred_rows is None else pred_rows
+        starts, lengths, source = split_at_gaps(starts, lengths, rows, pred_rows)
+        expected, predicted = expected[source], predicted[source]
+    ends = starts + lengths - 1
+    if truth_time is not None:
+        start_time = np.asarray(truth_time)[starts]
+        end_time = np.asarray(truth_time)[ends]
+    else:
+        start_time = end_time = np.full(len(starts), np.nan)
+    if rows is not None:
+        first, last, pred_first, pred_last = rows[starts], rows[ends], pred_rows[starts], pred_rows[ends]
+    else:
+        first, last = starts + offset, ends + offset
+        pred_first, pred_last = first, last
+    return pd.DataFrame({
+        'start': first,
+        'end': last,
+        'pred_start': pred_first,
+        'pred_end': pred_last,
+        'count': lengths,
+        'code_expected': expected,
+        'code_predicted': predicted,
+        'start_time': start_time,
+        'end_time': end_time,
+    }, columns=SEGMENT_COLUMNS)
+
+
+def merge_segments(frames):
+    """
+    Menggabungkan segmen dari potongan-potongan berurutan: segmen yang tepat
+    bersambung di batas potongan (di kedua file) dengan label yang sama
+    menjadi satu segmen.
+    """
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return empty_segments()
+    segments = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0].reset_index(drop=True)
+    start = segments['start'].to_numpy(dtype=np.int64)
+    end = segments['end'].to_numpy(dtype=np.int64)
+    pred_start = segments['pred_start'].to_numpy(dtype=np.int64)
+    pred_end = segments['pred_end'].to_numpy(dtype=np.int64)
+    expected = segments['code_expected'].to_numpy(dtype=np.int64)
+    predicted = segments['code_predicted'].to_numpy(dtype=np.int64)
+    new = np.ones(len(segments), dtype=bool)
+    new[1:] = (start[1:] != end[:-1] + 1) | (pred_start[1:] != pred_end[:-1] + 1) | (expected[1:] != expected[:-1]) | (predicted[1:] != predicted[:-1])
+    if new.all():
+        return segments
+    first = np.flatnonzero(new)
+    last = np.append(first[1:], len(segments)) - 1
+    return pd.DataFrame({
+        'start': start[first],
+        'end': end[last],
+        'pred_start': pred_start[first],
+        'pred_end': pred_end[last],
+        'count': np.add.reduceat(segments['count'].to_numpy(dtype=np.int64), first),
+        'code_expected': expected[first],
+        'code_predicted': predicted[first],
+        'start_time': segments['start_time'].to_numpy()[first],
+        'end_time': segments['end_time'].to_numpy()[last],
+    }, columns=SEGMENT_COLUMNS)
+
+
+def _duration_seconds(segments):
+    start_time = time_values(segments['start_time'].to_numpy())
+    end_time = time_values(segments['end_time'].to_numpy())
+    if start_time.dtype == object:
+        start_time = pd.to_datetime(start_time).to_numpy()
+        end_time = pd.to_datetime(end_time).to_numpy()
+    diff = end_time - start_time
+    if np.issubdtype(diff.dtype, np.timedelta64):
+        return diff / np.timedelta64(1, 's')
+    return diff.astype(float)
+
+
+def build_segment_table(segments, names):
+    """Tabel laporan segmen (kolom segments: SEGMENT_COLUMNS + source, truth_path, pred_path)."""
+    names = np.asarray(names, dtype=object)
+    return pd.DataFrame({
+        'Sumber_File': segments['source'].to_numpy(),
+        'Baris Awal': segments['start'].to_numpy(dtype=np.int64),
+        'Baris Akhir': segments['end'].to_numpy(dtype=np.int64),
+        'Baris Awal Prediksi': segments['pred_start'].to_numpy(dtype=np.int64),
+        'Baris Akhir Prediksi': segments['pred_end'].to_numpy(dtype=np.int64),
+        'Jumlah Baris': segments['count'].to_numpy(dtype=np.int64),
+        'Durasi (detik)': np.round(_duration_seconds(segments), 3),
+        'Label_Seharusnya': names[segments['code_expected'].to_numpy(dtype=np.int64)],
+        'Prediksi_Model': names[segments['code_predicted'].to_numpy(dtype=np.int64)],
+        'Path Kebenaran': segments['truth_path'].to_numpy(),
+        'Path Prediksi': segments['pred_path'].to_numpy(),
+    })
+
+
+def row_offsets(path):
+    """
+    Offset byte awal setiap baris data CSV (tanpa header) ditambah offset
+    akhir file: baris i menempati offsets[i]:offsets[i + 1]. Dipindai dari
+    posisi '\\n' sehingga nilai berkutip yang memuat baris baru tidak didukung.
+    """
+    if os.path.getsize(path) == 0:
+        return np.zeros(1, dtype=np.int64)
+    data = np.memmap(path, dtype=np.uint8, mode='r')
+    offsets = np.flatnonzero(data == ord('\n')).astype(np.int64) + 1
+    if not len(offsets) or offsets[-1] != len(data):
+        offsets = np.append(offsets, len(data))
+    return offsets
+
+
+class RowIndex:
+    """
+    Indeks baris -> offset byte (row_offsets) beberapa file CSV dalam satu file
+    .npz. Kunci per file memuat path absolut, ukuran dan mtime seperti
+    cache.TrialCache, sehingga file yang berubah dipindai ulang.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._offsets = None
+
+    @staticmethod
+    def key(path):
+        stat = os.stat(path)
+        source = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        return 'f' + hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+    def offsets(self, path):
+        if self._offsets is None:
+            try:
+                with np.load(self.path) as stored:
+                    self._offsets = dict(stored)
+            except (FileNotFoundError, ValueError, OSError):
+                self._offsets = {}
+        key = self.key(path)
+        if key not in self._offsets:
+            self._offsets[key] = row_offsets(path)
+            try:
+                np.savez(self.path, **self._offsets)
+            except OSError:
+                pass
+        return self._offsets[key]
+
+
+def read_rows(path, start, end, cache=None, index=None):
+    """
+    Baris start..end (inklusif, indeks baris data) dari satu file CSV. Dengan
+    cache berisi entri yang cocok, kolom dibuka lewat memmap dan hanya irisannya
+    yang dibaca; tanpa itu hanya byte baris start..end yang dibaca dari CSV
+    lewat offset dari index (RowIndex) atau dari pemindaian file. Rekaman
+    biner (.pgrec) selalu dibuka lewat memmap.
+    """
+    columns = read_recording(path) if is_recording(path) else cache.load(path) if cache is not None else None
+    if columns is not None:
+        rows = {name: np.asarray(data[start:end + 1]) for name, data in columns.items()}
+        return pd.DataFrame(rows, index=pd.RangeIndex(start, start + _column_length(rows)))
+    offsets = index.offsets(path) if index is not None else row_offsets(path)
+    start = min(start, len(offsets) - 1)
+    end = min(end + 1, len(offsets) - 1)
+    with open(path, 'rb') as f:
+        header = f.readline()
+        f.seek(offsets[start])
+        body = f.read(offsets[end] - offsets[start])
+    df = pd.read_csv(BytesIO(header + body), encoding='utf-8')
+    df.index = pd.RangeIndex(start, start + len(df))
+    return pd.DataFrame(frame_to_columns(df), index=df.index)
+
+
+def segment_rows(segment, truth_column=None, pred_column=None, cache=None, index=None):
+    """
+    Baris mentah satu segmen (baris tabel segmen_kesalahan) dari file
+    kebenarannya. Untuk skema dengan file prediksi terpisah, kolom prediksi
+    dari baris pasangannya di file prediksi (Baris Awal/Akhir Prediksi)
+    ditambahkan sebagai Prediksi_Model.
+    """
+    start, end = int(segment['Baris Awal']), int(segment['Baris Akhir'])
+    rows = read_rows(segment['Path Kebenaran'], start, end, cache, index)
+    if pred_column is not None and segment['Path Prediksi'] != segment['Path Kebenaran']:
+        pred_start = int(segment.get('Baris Awal Prediksi', start))
+        pred_end = int(segment.get('Baris Akhir Prediksi', end))
+        rows['Prediksi_Model'] = read_rows(segment['Path Prediksi'], pred_start, pred_end, cache, index)[pred_column].to_numpy()
+    return rows
+
+
+def print_segment(table_path, index, schema_name='sistem', cache=None):
+    """
+    Mencetak baris mentah segmen nomor index dari file segmen_kesalahan.csv.
+    Indeks offset baris file sumber disimpan di samping tabel (ROW_INDEX_SUFFIX).
+    """
+    from .config import SCHEMAS
+
+    segment = pd.read_csv(table_path).iloc[index]
+    row_index = RowIndex(os.path.splitext(table_path)[0] + ROW_INDEX_SUFFIX)
+    rows = segment_rows(segment, pred_column=SCHEMAS[schema_name]['pred_column'], cache=cache, index=row_index)
+    print(f"Segmen {index}: {segment['Sumber_File']} baris {segment['Baris Awal']}-{segment['Baris Akhir']}, "
+          f"{segment['Label_Seharusnya']} diprediksi {segment['Prediksi_Model']}")
+    print(rows.to_string())
@@ -0,0 +1,219 @@
+"""
+Evaluasi bertahap per potongan (chunk) data.
+
+TrialAccumulator menerima potongan-potongan berurutan dari satu percobaan dan
+menyimpan hanya ringkasan: confusion matrix integer, tensor confusion per
+transisi (asal, tujuan, prediksi), run kebenaran yang masih terbuka di batas
+potongan dan transisi yang belum terdeteksi. Memori sebanding dengan ukuran potongan, bukan jumlah sampel.
+Mode non-streaming memakai jalur yang sama dengan satu potongan per file.
+Kesalahan prediksi juga dicatat sebagai segmen (lihat segments); salinan baris
+mismatch mentah dapat dimatikan dengan collect_rows=False.
+"""
+import numpy as np
+import pandas as pd
+
+from .delays import DELAY_COLUMNS, _seconds_between
+from .rle import add_transition_runs, confusion_from_runs, first_match_in_runs, predictions_per_truth_run, runs_from_codes
+from .segments import chunk_segments, merge_segments
+from .timing import count_rows, stage
+
+
+def grow_square(matrix, n):
+    """Memperbesar matriks persegi (atau tensor kubus) menjadi n x n (x n); label baru diisi nol."""
+    if matrix.shape[0] == n:
+        return matrix
+    grown = np.zeros((n,) * matrix.ndim, dtype=matrix.dtype)
+    grown[tuple(slice(0, size) for size in matrix.shape)] = matrix
+    return grown
+
+
+class TrialAccumulator:
+    """Akumulator metrik satu percobaan yang diisi potongan demi potongan."""
+
+    def __init__(self, vocabulary, collect_rows=True):
+        self.vocabulary = vocabulary
+        self.collect_rows = collect_rows
+        self.rows = 0
+        self.invalid_time_rows = 0
+        self.unmatched_truth = 0
+        self.unmatched_pred = 0
+        self.confusion = np.zeros((0, 0), dtype=np.int64)
+        self.transition_confusion = np.zeros((0, 0, 0), dtype=np.int64)
+        self.mismatches = []
+        self._segment_frames = []
+        self._delay_frames = []
+        # Run kebenaran terakhir yang mungkin berlanjut ke potongan berikutnya:
+        # (kode, kode sebelumnya atau -1, panjang, jumlah sampel per kode prediksi)
+        self._open_run = None
+        # Transisi yang belum terdeteksi: kode asal, kode tujuan, indeks, nomor baris file kebenaran, waktu
+        self._pending = (np.empty(0, np.int64),) * 4 + (np.empty(0),)
+
+    def _count_runs(self, prev_codes, codes, lengths, predicted):
+        """Menambahkan run kebenaran yang sudah selesai (selain run pertama, panjang > 1) ke tensor per transisi."""
+        keep = (prev_codes >= 0) & (lengths > 1)
+        if not keep.any():
+            return
+        rows = np.zeros((int(keep.sum()), self.transition_confusion.shape[0]), dtype=np.int64)
+        rows[:, :predicted.shape[1]] = predicted[keep]
+        add_transition_runs(self.transition_confusion, prev_codes[keep], codes[keep], rows)
+
+    def update(self, chunk):
+        """Memproses satu potongan (dict dari loader.iter_trial_chunks)."""
+        offset = self.rows
+        y_true, y_pred = chunk['y_true'], chunk['y_pred']
+        n = len(y_true)
+        self.unmatched_truth += chunk.get('unmatched_truth', 0)
+        self.unmatched_pred += chunk.get('unmatched_pred', 0)
+        self.invalid_time_rows += chunk['invalid_time']
+        if n == 0:
+            return
+        with stage('transition_grouping'):
+            truth_runs = runs_from_codes(y_true)
+            pred_runs = runs_from_codes(y_pred)
+            count_rows(n)
+
+        with stage('confusion'):
+            n_labels = len(self.vocabulary)
+            cm = confusion_from_runs(truth_runs, pred_runs, n_labels)
+            self.confusion = grow_square(self.confusion, n_labels) + cm
+            count_rows(n)
+
+        with stage('transition_grouping'):
+            self.transition_confusion = grow_square(self.transition_confusion, n_labels)
+            codes = truth_runs.codes
+            lengths = truth_runs.lengths.copy()
+            predicted = predictions_per_truth_run(truth_runs, pred_runs, n_labels)
+            prev_codes = np.concatenate(([-1], codes[:-1]))
+            new_transition = np.ones(len(codes), dtype=bool)
+            if self._open_run is None:
+                new_transition[0] = False
+            else:
+                code, prev, length, open_predicted = self._open_run
+                if codes[0] == code:
+                    lengths[0] += length
+                    predicted[0, :len(open_predicted)] += open_predicted
+                    prev_codes[0] = prev
+                    new_transition[0] = False
+                else:
+                    self._count_runs(np.array([prev]), np.array([code]), np.array([length]), open_predicted[None])
+                    prev_codes[0] = code
+            self._count_runs(prev_codes[:-1], codes[:-1], lengths[:-1], predicted[:-1])
+            self._open_run = (codes[-1], prev_codes[-1], lengths[-1], predicted[-1])
+
+        with stage('delay_search'):
+            self._resolve_delays(chunk, truth_runs, pred_runs, prev_codes, new_transition, offset)
+            count_rows(n)
+
+        with stage('mismatch_segments'):
+            self._segment_frames.append(chunk_segments(truth_runs, pred_runs, chunk['truth_time'], offset,
+                                                       chunk.get('truth_rows'), chunk.get('pred_rows')))
+            count_rows(n)
+
+        if self.collect_rows:
+            self._collect_mismatches(chunk, offset)
+        self.rows += n
+
+    def _collect_mismatches(self, chunk, offset):
+        y_true, y_pred = chunk['y_true'], chunk['y_pred']
+        with stage('mismatch_collect'):
+            mismatch_mask = y_true != y_pred
+            count_rows(len(y_true))
+            if mismatch_mask.any():
+                rows = chunk.get('truth_rows')
+                index = rows[mismatch_mask] if rows is not None else offset + np.flatnonzero(mismatch_mask)
+                mismatched_data = pd.DataFrame({name: data[mismatch_mask] for name, data in chunk['columns'].items()}, index=index)
+                mismatched_data['Label_Seharusnya'] = y_true[mismatch_mask]
+                mismatched_data['Prediksi_Model'] = y_pred[mismatch_mask]
+                self.mismatches.append(mismatched_data)
+
+    def _resolve_delays(self, chunk, truth_runs, pred_runs, prev_codes, new_transition, offset):
+        """
+        Mencari deteksi transisi potongan ini dan transisi yang masih tertunda.
+        truth_index/pred_index adalah nomor baris file kebenaran/prediksi;
+        delay_rows dihitung dalam baris yang dievaluasi (setelah penyelarasan).
+        """
+        truth_time = chunk['truth_time']
+        starts_local = truth_runs.starts[new_transition]
+        if truth_time is not None:
+            times = np.asarray(truth_time)[starts_local]
+        else:
+            times = np.full(len(starts_local), np.nan)
+
+        rows = chunk.get('truth_rows')
+        file_rows = rows[starts_local] if rows is not None else starts_local + offset
+        pend_from, pend_to, pend_start, pend_row, pend_time = self._pending
+        if len(pend_time) and len(times) and pend_time.dtype != times.dtype:
+            pend_time = pend_time.astype(times.dtype)
+        code_from = np.concatenate((pend_from, prev_codes[new_transition]))
+        code_to = np.concatenate((pend_to, truth_runs.codes[new_transition]))
+        start = np.concatenate((pend_start, starts_local + offset))
+        truth_row = np.concatenate((pend_row, file_rows))
+        time = np.concatenate((pend_time, times)) if len(pend_time) else times
+
+        local = first_match_in_runs(pred_runs, code_to, np.maximum(start - offset, 0))
+        found = local >= 0
+        self._pending = (code_from[~found], code_to[~found], start[~found], truth_row[~found], time[~found])
+        if not found.any():
+            return
+
+        pred_time = chunk['pred_time']
+        if truth_time is not None and pred_time is not None:
+            delay_seconds = _seconds_between(np.asarray(pred_time)[local[found]], time[found])
+        else:
+            delay_seconds = np.full(int(found.sum()), np.nan)
+        pred_rows = chunk.get('pred_rows')
+        pred_index = pred_rows[local[found]] if pred_rows is not None else local[found] + offset
+        self._delay_frames.append(pd.DataFrame({
+            'code_from': code_from[found],
+            'code_to': code_to[found],
+            'truth_index': truth_row[found],
+            'pred_index': pred_index,
+            'delay_rows': local[found] + offset - start[found],
+            'delay_seconds': delay_seconds,
+        }, columns=DELAY_COLUMNS))
+
+    def snapshot(self):
+        """
+        Hasil parsial sementara (format sama dengan finish) tanpa menutup
+        percobaan: run yang masih terbuka ikut dihitung pada salinan tensor,
+        transisi yang belum terdeteksi belum masuk waktu tunda. Dipakai mode
+        pantau (watch) untuk ringkasan berjalan.
+        """
+        tensor = grow_square(self.transition_confusion, len(self.vocabulary)).copy()
+        if self._open_run is not None:
+            code, prev, length, open_predicted = self._open_run
+            if prev >= 0 and length > 1:
+                row = np.zeros(len(self.vocabulary), dtype=np.int64)
+                row[:len(open_predicted)] = open_predicted
+                add_transition_runs(tensor, np.array([prev]), np.array([code]), row[None])
+        return self._partial(tensor)
+
+    def finish(self):
+        """
+        Menutup percobaan: run terakhir dihitung dan transisi yang tidak pernah
+        terdeteksi dibuang. Mengembalikan hasil parsial percobaan sebagai dict;
+        label di dalamnya (delays, kolom label mismatch dan segmen) masih berupa kode.
+        """
+        self.transition_confusion = grow_square(self.transition_confusion, len(self.vocabulary))
+        if self._open_run is not None:
+            code, prev, length, open_predicted = self._open_run
+            self._count_runs(np.array([prev]), np.array([code]), np.array([length]), open_predicted[None])
+            self._open_run = None
+        return self._partial(self.transition_confusion)
+
+    def _partial(self, transition_confusion):
+        if self._delay_frames:
+            delays = pd.concat(self._delay_frames, ignore_index=True).sort_values('truth_index', kind='stable', ignore_index=True)
+        else:
+            delays = pd.DataFrame(columns=DELAY_COLUMNS)
+        return {
+            'rows': self.rows,
+            'invalid_time_rows': self.invalid_time_rows,
+            'unmatched_truth': self.unmatched_truth,
+            'unmatched_pred': self.unmatched_pred,
+            'confusion': grow_square(self.confusion, len(self.vocabulary)),
+            'transition_confusion': transition_confusion,
+            'delays': delays,
+            'mismatches': self.mismatches,
+            'mismatch_segments': merge_segments(self._segment_frames),
+        }
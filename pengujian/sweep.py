@@ -0,0 +1,188 @@
+"""
+Sweep ukuran window secara offline dari rekaman yang sudah ada.
+
+Fitur Mean_V, Std_Dev_V, Mean_I dan Std_Dev_I dihitung perangkat dengan satu
+ukuran window saja. Sinyal mentah (tegangan dan arus) tersimpan di setiap CSV,
+sehingga fitur rolling untuk ukuran window lain dapat dihitung ulang: mean dan
+simpangan baku trailing window dihitung dari selisih jumlah kumulatif (O(N) per
+ukuran window, tanpa loop Python per window). Classifier ambang
+(config.THRESHOLD_CLASSIFIER) lalu diterapkan ulang dan akurasi serta waktu
+tunda deteksi dilaporkan per ukuran window. Setiap rekaman diproses di proses
+pekerja terpisah.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .config import SCHEMAS, THRESHOLD_CLASSIFIER, load_config, output_folder, select_datasets
+from .delays import transition_delays
+from .labels import LabelVocabulary
+from .loader import iter_csv_columns, iter_trials, time_values
+from .metrics import classification_metrics
+from .rle import confusion_from_runs, runs_from_codes
+
+OPERATORS = {'<': np.less, '<=': np.less_equal, '>': np.greater, '>=': np.greater_equal}
+
+
+def rolling_mean_std(values, window, ddof=0):
+    """
+    Mean dan simpangan baku trailing window (sampel ke-i memakai sampel
+    i-window+1..i; di awal rekaman window berisi sampel yang ada saja).
+    Dihitung dari jumlah kumulatif nilai dan kuadratnya setelah digeser ke
+    median agar tidak kehilangan presisi; NaN diisi nilai valid sebelumnya.
+    """
+    values = pd.Series(values, dtype=float).ffill().fillna(0.0).to_numpy()
+    n = len(values)
+    if n == 0:
+        return np.empty(0), np.empty(0)
+    reference = np.median(values)
+    shifted = values - reference
+    sums = np.concatenate(([0.0], np.cumsum(shifted)))
+    squares = np.concatenate(([0.0], np.cumsum(shifted * shifted)))
+    stop = np.arange(1, n + 1)
+    start = np.maximum(stop - window, 0)
+    count = stop - start
+    window_sum = sums[stop] - sums[start]
+    window_squares = squares[stop] - squares[start]
+    mean = window_sum / count + reference
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variance = (window_squares - window_sum * window_sum / count) / (count - ddof)
+    std = np.sqrt(np.where(count > ddof, np.maximum(variance, 0.0), 0.0))
+    return mean, std
+
+
+def rolling_features(voltage, current, window, ddof=0):
+    """Fitur rolling perangkat (mean_v, std_v, mean_i, std_i) untuk satu ukuran window."""
+    mean_v, std_v = rolling_mean_std(voltage, window, ddof)
+    mean_i, std_i = rolling_mean_std(current, window, ddof)
+    return {'mean_v': mean_v, 'std_v': std_v, 'mean_i': mean_i, 'std_i': std_i}
+
+
+def classify(features, vocabulary, classifier=THRESHOLD_CLASSIFIER):
+    """Menerapkan classifier ambang ke fitur rolling; hasilnya kode label uint8."""
+    conditions = [OPERATORS[rule['op']](features[rule['feature']], rule['value']) for rule in classifier['rules']]
+    choices = [vocabulary.code(rule['label']) for rule in classifier['rules']]
+    return np.select(conditions, choices, default=vocabulary.code(classifier['default'])).astype(np.uint8)
+
+
+def _read_columns(path, cache):
+    return next(iter_csv_columns(path, None, cache))
+
+
+def sweep_trial(truth_path, pred_path, schema_name, windows, classifier=THRESHOLD_CLASSIFIER, cache=None):
+    """
+    Sweep satu rekaman: label kebenaran dari truth_path, sinyal mentah dari
+    pred_path (rekaman perangkat). Mengembalikan (baris ringkasan per ukuran
+    window, DataFrame waktu tunda semua window dengan label berupa nama).
+    """
+    schema = SCHEMAS[schema_name]
+    pred_columns = _read_columns(pred_path, cache)
+    truth_columns = pred_columns if pred_path == truth_path else _read_columns(truth_path, cache)
+    vocabulary = LabelVocabulary()
+    y_true = vocabulary.encode(truth_columns[schema['truth_column']])
+    truth_runs = runs_from_codes(y_true)
+    truth_time = time_values(truth_columns.get(schema['time_column']))
+    pred_time = time_values(pred_columns.get(schema['time_column']))
+    voltage = np.asarray(pred_columns[schema['voltage_column']], dtype=float)
+    current = np.asarray(pred_columns[schema['current_column']], dtype=float)
+    if len(voltage) != len(y_true):
+        raise ValueError(f"Jumlah baris berbeda: {len(y_true)} (kebenaran) vs {len(voltage)} (prediksi)")
+
+    rows, delay_frames = [], []
+    for window in windows:
+        y_pred = classify(rolling_features(voltage, current, window, schema['std_ddof']), vocabulary, classifier)
+        pred_runs = runs_from_codes(y_pred)
+        metrics = classification_metrics(confusion_from_runs(truth_runs, pred_runs, len(vocabulary)))
+        delays = transition_delays(truth_runs, pred_runs, truth_time, pred_time)
+        rows.append({
+            'window': window,
+            'total': metrics['total'],
+            'benar': int(metrics['correct'].sum()),
+            'transisi': len(truth_runs.starts) - 1,
+            'terdeteksi': len(delays),
+            'tunda_sampel': delays['delay_rows'].sum(),
+            'tunda_detik': delays['delay_seconds'].sum(),
+            'n_tunda_detik': int(delays['delay_seconds'].notna().sum()),
+        })
+        names = np.asarray(vocabulary.names, dtype=object)
+        delay_frames.append(delays.assign(
+            window=window,
+            label_from=names[delays['code_from'].to_numpy(dtype=np.int64)],
+            label_to=names[delays['code_to'].to_numpy(dtype=np.int64)],
+        ))
+    return rows, pd.concat(delay_frames, ignore_index=True)
+
+
+def _sweep_task(task):
+    truth_path, pred_path, schema_name, windows, classifier, cache = task
+    try:
+        return sweep_trial(truth_path, pred_path, schema_name, windows, classifier, cache), None
+    except Exception as e:
+        return None, e
+
+
+def build_sweep_table(rows):
+    """Tabel akurasi dan waktu tunda rata-rata per ukuran window dari baris semua rekaman."""
+    totals = pd.DataFrame(rows).groupby('window', sort=True).sum(numeric_only=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return pd.DataFrame({
+            'Ukuran Window': totals.index,
+            'Total Data': totals['total'].to_numpy(),
+            'Prediksi Benar': totals['benar'].to_numpy(),
+            'Akurasi (%)': (totals['benar'] / totals['total'] * 100).round(2).to_numpy(),
+            'Transisi Terdeteksi': (totals['terdeteksi'].astype(str) + '/' + totals['transisi'].astype(str)).to_numpy(),
+            'Rata-rata Tunda (sampel)': (totals['tunda_sampel'] / totals['terdeteksi']).round(2).to_numpy(),
+            'Rata-rata Tunda (detik)': (totals['tunda_detik'] / totals['n_tunda_detik']).round(3).to_numpy(),
+        })
+
+
+def sweep_dataset(dataset, windows, base_dir='.', classifier=THRESHOLD_CLASSIFIER, cache=None, workers=None):
+    """
+    Sweep semua rekaman satu dataset. Rekaman dibagi ke proses pekerja (spawn)
+    jika workers > 1. Mengembalikan (tabel per ukuran window, DataFrame waktu tunda).
+    """
+    tasks = [(truth_path, pred_path, dataset['schema'], list(windows), classifier, cache)
+             for _, truth_path, pred_path in iter_trials(dataset, base_dir)]
+    workers = min((os.cpu_count() or 1) if workers is None else workers, len(tasks))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            outcomes = list(pool.map(_sweep_task, tasks))
+    else:
+        outcomes = [_sweep_task(task) for task in tasks]
+
+    rows, delay_frames = [], []
+    for (truth_path, *_), (outcome, error) in zip(tasks, outcomes):
+        if error is not None:
+            print(f"Error saat memproses file '{truth_path}': {error}")
+            continue
+        trial_rows, delays = outcome
+        rows.extend(trial_rows)
+        delay_frames.append(delays.assign(source=os.path.basename(truth_path)))
+    if not rows:
+        return pd.DataFrame(), pd.DataFrame()
+    return build_sweep_table(rows), pd.concat(delay_frames, ignore_index=True)
+
+
+def run_sweep(windows, names=None, *, config_path=None, base_dir='.', output_root=None, cache=None, workers=None):
+    """
+    Sweep ukuran window untuk semua dataset (atau yang dipilih lewat names),
+    mencetak tabelnya dan menulis sweep_ukuran_window.csv ke folder output
+    dataset. Mengembalikan dict nama dataset -> tabel sweep.
+    """
+    tables = {}
+    for dataset in select_datasets(load_config(config_path), names):
+        print(f"\n--- Sweep Ukuran Window {dataset['name']} ({dataset['root']}): {', '.join(map(str, windows))} ---")
+        table, _ = sweep_dataset(dataset, windows, base_dir, cache=cache, workers=workers)
+        if table.empty:
+            print(f"\nTidak ada file yang diproses untuk {dataset['name']}.")
+            continue
+        print(table.to_string(index=False))
+        folder = output_folder(dataset, base_dir, output_root)
+        os.makedirs(folder, exist_ok=True)
+        table.to_csv(os.path.join(folder, 'sweep_ukuran_window.csv'), index=False)
+        print(f"\nLaporan 'sweep_ukuran_window.csv' berhasil dibuat di folder '{folder}'!")
+        tables[dataset['name']] = table
+    return tables
@@ -0,0 +1,254 @@
+"""
+Instrumentasi per tahap pipeline evaluasi.
+
+Bagian pipeline dibungkus stage('nama'); selama ada pencatat aktif (collect())
+setiap tahap mencatat waktu dinding, waktu CPU, jumlah baris yang diproses
+(count_rows) dan, jika diminta, puncak alokasi memori Python (tracemalloc).
+Total per tahap memakai waktu tahap itu sendiri: waktu tahap yang bersarang di
+dalamnya tidak dihitung dua kali, sehingga jumlah semua tahap sama dengan
+waktu yang tercakup. Tahap dengan argumen file=... (satu percobaan) membuat
+semua tahap di dalamnya juga dijumlahkan per file.
+
+Hasilnya dapat ditulis sebagai trace JSON terstruktur (write_json) atau format
+trace-event Chrome (write_chrome_trace, dibuka di chrome://tracing atau
+Perfetto). Tanpa pencatat aktif stage() dan count_rows() hampir tanpa biaya.
+Tahap boleh berjalan di beberapa thread (misalnya pemuatan file paralel):
+setiap thread punya tumpukan tahapnya sendiri dan tampil sebagai jalur
+terpisah di trace Chrome. Waktu tahap di thread lain tumpang tindih dengan
+thread utama, sehingga juga dijumlahkan terpisah (StageTimes.background) dan
+total thread utama (main_seconds) tetap tidak melebihi waktu dinding.
+"""
+import json
+import os
+import sys
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter, thread_time
+
+_active = None
+
+
+def peak_rss_mb():
+    """Puncak RSS proses sejauh ini (MB), atau None jika tidak tersedia."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss dalam KiB di Linux, byte di macOS.
+    return round(peak / (2**20 if sys.platform == 'darwin' else 2**10), 1)
+
+
+class _Frame:
+    __slots__ = ('name', 'file', 'wall', 'cpu', 'child_wall', 'child_cpu', 'rows', 'mem_peak')
+
+    def __init__(self, name, file):
+        self.name = name
+        self.file = file
+        self.wall = perf_counter()
+        self.cpu = thread_time()
+        self.child_wall = 0.0
+        self.child_cpu = 0.0
+        self.rows = 0
+        self.mem_peak = 0
+
+
+class _Totals:
+    """Total per tahap: detik dinding dan CPU, jumlah pemanggilan, baris dan puncak memori."""
+
+    def __init__(self):
+        self.seconds = {}
+        self.cpu_seconds = {}
+        self.calls = {}
+        self.rows = {}
+        self.mem_peak = {}
+
+    def add(self, name, wall, cpu, rows, mem_peak):
+        self.seconds[name] = self.seconds.get(name, 0.0) + wall
+        self.cpu_seconds[name] = self.cpu_seconds.get(name, 0.0) + cpu
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.rows[name] = self.rows.get(name, 0) + rows
+        self.mem_peak[name] = max(self.mem_peak.get(name, 0), mem_peak)
+
+
+class StageTimes(_Totals):
+    """
+    Pencatat aktif. seconds, cpu_seconds, calls, rows dan mem_peak berisi total
+    per tahap (semua thread); background berisi total yang sama untuk tahap di
+    thread selain thread pembuat pencatat; files berisi total per file; events
+    berisi setiap pemanggilan tahap (waktu inklusif) untuk trace.
+    """
+
+    def __init__(self, memory=False):
+        super().__init__()
+        self.memory = memory
+        self.files = {}
+        self.background = _Totals()
+        self.events = []
+        self.started = perf_counter()
+        self.finished = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Nomor urut thread untuk trace; thread pembuat pencatat bernomor 0.
+        self._threads = {threading.get_ident(): 0}
+
+    @property
+    def _stack(self):
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def _enter(self, name, file):
+        if file is None and self._stack:
+            file = self._stack[-1].file
+        if self.memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            if self._stack:
+                self._stack[-1].mem_peak = max(self._stack[-1].mem_peak, peak)
+            tracemalloc.reset_peak()
+        self._stack.append(_Frame(name, file))
+
+    def _exit(self):
+        frame = self._stack.pop()
+        wall = perf_counter() - frame.wall
+        cpu = thread_time() - frame.cpu
+        own_wall, own_cpu = wall - frame.child_wall, cpu - frame.child_cpu
+        if self.memory:
+            frame.mem_peak = max(frame.mem_peak, tracemalloc.get_traced_memory()[1])
+        with self._lock:
+            self._record(frame, wall, cpu, own_wall, own_cpu)
+        if self._stack:
+            parent = self._stack[-1]
+            parent.child_wall += wall
+            parent.child_cpu += cpu
+            parent.mem_peak = max(parent.mem_peak, frame.mem_peak)
+
+    def _record(self, frame, wall, cpu, own_wall, own_cpu):
+        thread = self._threads.setdefault(threading.get_ident(), len(self._threads))
+        self.add(frame.name, own_wall, own_cpu, frame.rows, frame.mem_peak)
+        if thread:
+            self.background.add(frame.name, own_wall, own_cpu, frame.rows, frame.mem_peak)
+        if frame.file is not None:
+            self.files.setdefault(frame.file, _Totals()).add(frame.name, own_wall, own_cpu, frame.rows, frame.mem_peak)
+        self.events.append({
+            'name': frame.name,
+            'file': frame.file,
+            'start': frame.wall - self.started,
+            'wall': wall,
+            'cpu': cpu,
+            'rows': frame.rows,
+            'mem_peak': frame.mem_peak if self.memory else None,
+            'depth': len(self._stack),
+            'thread': thread,
+        })
+
+    def total(self):
+        return sum(self.seconds.values())
+
+    def main_seconds(self):
+        """Detik per tahap di thread utama saja (tanpa tahap thread lain yang berjalan bersamaan)."""
+        return {name: seconds - self.background.seconds.get(name, 0.0) for name, seconds in self.seconds.items()
+                if self.calls[name] > self.background.calls.get(name, 0)}
+
+    def summary(self):
+        """Ringkasan per tahap dan per file (dict siap JSON)."""
+        return {
+            'wall_seconds': round((self.finished or perf_counter()) - self.started, 6),
+            'peak_rss_mb': peak_rss_mb(),
+            'stages': _stage_table(self),
+            'background_stages': _stage_table(self.background),
+            'files': {file: _stage_table(totals) for file, totals in self.files.items()},
+        }
+
+
+def _stage_table(totals):
+    table = {}
+    for name in sorted(totals.seconds, key=lambda name: -totals.seconds[name]):
+        row = {
+            'wall_seconds': round(totals.seconds[name], 6),
+            'cpu_seconds': round(totals.cpu_seconds[name], 6),
+            'calls': totals.calls[name],
+            'rows': totals.rows[name],
+        }
+        if totals.mem_peak[name]:
+            row['mem_peak_mb'] = round(totals.mem_peak[name] / 2**20, 2)
+        table[name] = row
+    return table
+
+
+@contextmanager
+def stage(name, file=None):
+    """Mencatat blok sebagai tahap name (dan milik file, jika diberikan) pada pencatat aktif."""
+    timer = _active
+    if timer is None:
+        yield
+        return
+    timer._enter(name, file)
+    try:
+        yield
+    finally:
+        timer._exit()
+
+
+def count_rows(n):
+    """Menambahkan n baris yang diproses ke tahap yang sedang berjalan."""
+    timer = _active
+    if timer is not None and timer._stack:
+        timer._stack[-1].rows += int(n)
+
+
+@contextmanager
+def collect(memory=False):
+    """
+    Mengaktifkan pencatat baru selama blok berjalan; menghasilkan StageTimes-nya.
+    memory=True menyalakan tracemalloc (memperlambat alokasi Python).
+    """
+    global _active
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    previous, _active = _active, StageTimes(memory)
+    try:
+        yield _active
+    finally:
+        _active.finished = perf_counter()
+        _active = previous
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def write_json(times, path):
+    """Trace JSON terstruktur: ringkasan per tahap, per file dan daftar semua kejadian."""
+    trace = times.summary()
+    trace['events'] = [{key: (round(value, 6) if isinstance(value, float) else value) for key, value in event.items()}
+                       for event in times.events]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(trace, f, ensure_ascii=False, indent=1)
+
+
+def write_chrome_trace(times, path):
+    """Trace dalam format trace-event Chrome (kejadian 'X' dengan waktu dalam mikrodetik)."""
+    pid = os.getpid()
+    events = []
+    for event in times.events:
+        args = {'cpu_ms': round(event['cpu'] * 1e3, 3), 'rows': event['rows']}
+        if event['file'] is not None:
+            args['file'] = event['file']
+        if event['mem_peak'] is not None:
+            args['mem_peak_mb'] = round(event['mem_peak'] / 2**20, 2)
+        events.append({
+            'name': event['name'],
+            'cat': 'pengujian',
+            'ph': 'X',
+            'ts': round(event['start'] * 1e6, 1),
+            'dur': round(event['wall'] * 1e6, 1),
+            'pid': pid,
+            'tid': event['thread'],
+            'args': args,
+        })
+    events.sort(key=lambda event: (event['ts'], -event['dur']))
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
@@ -0,0 +1,434 @@
+"""
+Mode pantau: evaluasi langsung selama kampanye pengujian.
+
+Rig akuisisi menulis file percobaan satu per satu ke folder skenario
+hasil_pengujian_*/. Watcher memindai folder dataset secara berkala
+(loader.discover_trials) dan mengikuti ekor setiap file CSV (atau rekaman
+biner .pgrec) yang baru dibuat atau masih bertambah: hanya byte setelah posisi
+terakhir yang dibaca dan baris (atau record) terakhir yang belum lengkap
+ditunda sampai lengkap, sehingga tidak ada data yang dibaca dua kali. Baris baru langsung masuk
+TrialAccumulator. Untuk file kebenaran/prediksi terpisah, baris kebenaran
+ditahan hanya sampai file prediksi melewati waktunya ditambah toleransi
+penyelarasan (loader.TimeAligner). Latensi per baris dibatasi interval
+pemindaian ditambah toleransi tersebut; setiap pemindaian membaca paling
+banyak MAX_READ_BYTES per file agar satu file besar tidak menahan file lain.
+
+Pembacaan file berjalan di thread (asyncio.to_thread); pengkodean label dan
+akumulasi tetap di loop utama sehingga kosakata dataset tidak diubah
+bersamaan. Ringkasan berjalan (akurasi, confusion matrix, akurasi per transisi
+dan waktu tunda) dicetak setiap refresh detik jika ada baris baru dan dapat
+diambil sebagai JSON lewat HTTP. Percobaan ditutup setelah kedua filenya
+tidak bertambah selama idle detik.
+
+    python -m pengujian --watch 10ws --watch-port 8765
+"""
+import asyncio
+import io
+import json
+import os
+import struct
+import time
+from collections import deque
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .config import SCHEMAS, load_config, select_datasets
+from .engine import alignment_tolerance, finalize_result, merge_trial, new_result
+from .labels import LabelVocabulary
+from .loader import (TimeAligner, _column_length, _make_chunk, _slice_columns, _time_keys, _tolerance_key, discover_trials,
+                     frame_to_columns, time_values)
+from .metrics import sorted_confusion
+from .recording import decode_records, is_recording, read_header, record_dtype
+from .report import build_metrics_summary, build_transition_table
+from .streaming import TrialAccumulator
+
+DEFAULT_INTERVAL = 0.5
+DEFAULT_REFRESH = 5.0
+DEFAULT_IDLE = 30.0
+MAX_READ_BYTES = 8 * 1024 * 1024
+
+
+class CsvTail:
+    """Pembaca ekor satu file CSV yang masih ditulis; read() hanya mengembalikan baris lengkap yang baru."""
+
+    def __init__(self, path, max_bytes=MAX_READ_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.offset = 0
+        self.header = None
+        self.rows = 0
+        self.last_growth = time.monotonic()
+
+    def read(self):
+        """Kolom (loader.frame_to_columns) baris lengkap yang ditulis sejak read() sebelumnya, atau None."""
+        size = os.path.getsize(self.path)
+        if size < self.offset:
+            raise ValueError(f"File '{self.path}' menyusut; baris yang sudah dievaluasi tidak dibaca ulang.")
+        if size == self.offset:
+            return None
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            data = f.read(self.max_bytes)
+        end = data.rfind(b'\n')
+        if end < 0:
+            return None
+        data = data[:end + 1]
+        self.offset += len(data)
+        self.last_growth = time.monotonic()
+        if self.header is None:
+            header, _, data = data.partition(b'\n')
+            self.header = header + b'\n'
+            if not data:
+                return None
+        df = pd.read_csv(io.BytesIO(self.header + data))
+        self.rows += len(df)
+        return frame_to_columns(df)
+
+
+class RecordingTail:
+    """Pembaca ekor rekaman biner (.pgrec) yang masih ditulis: hanya record lengkap yang baru."""
+
+    def __init__(self, path, max_bytes=MAX_READ_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.offset = None
+        self.header = None
+        self.dtype = None
+        self.rows = 0
+        self.last_growth = time.monotonic()
+
+    def read(self):
+        """Kolom (recording.decode_records) record lengkap yang ditulis sejak read() sebelumnya, atau None."""
+        with open(self.path, 'rb') as f:
+            if self.header is None:
+                try:
+                    self.header, self.offset = read_header(f)
+                except (ValueError, struct.error):
+                    # Header belum selesai ditulis.
+                    return None
+                self.dtype = record_dtype(self.header['columns'])
+            size = os.path.getsize(self.path)
+            if size < self.offset:
+                raise ValueError(f"File '{self.path}' menyusut; baris yang sudah dievaluasi tidak dibaca ulang.")
+            count = min(size - self.offset, self.max_bytes) // self.dtype.itemsize
+            if count == 0:
+                return None
+            f.seek(self.offset)
+            records = np.frombuffer(f.read(count * self.dtype.itemsize), dtype=self.dtype)
+        self.offset += count * self.dtype.itemsize
+        self.rows += count
+        self.last_growth = time.monotonic()
+        return decode_records(self.header, records)
+
+
+def open_tail(path):
+    """CsvTail atau RecordingTail sesuai jenis file."""
+    return RecordingTail(path) if is_recording(path) else CsvTail(path)
+
+
+class LiveTrial:
+    """Satu percobaan yang sedang ditulis: ekor file kebenaran/prediksi dan akumulatornya."""
+
+    def __init__(self, scenario, truth_path, pred_path, schema_name, vocabulary, tolerance=None):
+        self.scenario = scenario
+        self.source = os.path.basename(truth_path)
+        self.paths = (truth_path, pred_path)
+        self.schema = SCHEMAS[schema_name]
+        self.vocabulary = vocabulary
+        self.truth = open_tail(truth_path)
+        self.pred = self.truth if pred_path == truth_path else open_tail(pred_path)
+        self.accumulator = TrialAccumulator(vocabulary, collect_rows=False)
+        self.aligner = None
+        if tolerance is not None and self.pred is not self.truth:
+            self.aligner = TimeAligner(self.schema, vocabulary, tolerance)
+        self.tolerance = tolerance
+        self._truth_pending = deque()
+        self._pred_pending = deque()
+        self._pred_last = None
+        self.partial = None
+
+    @property
+    def closed(self):
+        return self.partial is not None
+
+    def idle_seconds(self):
+        return time.monotonic() - max(self.truth.last_growth, self.pred.last_growth)
+
+    def read(self):
+        """Potongan baru (kebenaran, prediksi); hanya I/O dan parse, aman dijalankan di thread."""
+        truth = self.truth.read()
+        pred = None if self.pred is self.truth else self.pred.read()
+        return truth, pred
+
+    def consume(self, truth, pred):
+        """Mengevaluasi baris baru yang sudah dapat dipasangkan; mengembalikan jumlah baris yang dievaluasi."""
+        if truth is not None:
+            self._truth_pending.append(truth)
+        if pred is not None:
+            if self.aligner is None:
+                self._pred_pending.append(pred)
+            else:
+                keys, valid = _time_keys(time_values(pred.get(self.schema['time_column'])))
+                if valid.any():
+                    self._pred_last = keys[valid].max()
+                self.aligner.add_predictions(pred)
+        return self._evaluate(final=False)
+
+    def _ready_rows(self, columns):
+        """Jumlah baris awal potongan kebenaran yang pasangan prediksinya tidak mungkin berubah lagi."""
+        truth_time = time_values(columns.get(self.schema['time_column']))
+        if truth_time is None:
+            return _column_length(columns)
+        keys, valid = _time_keys(truth_time)
+        if self._pred_last is None:
+            waiting = valid
+        else:
+            waiting = valid & (keys + _tolerance_key(truth_time, self.tolerance) >= self._pred_last)
+        first = np.flatnonzero(waiting)
+        return int(first[0]) if len(first) else len(keys)
+
+    def _evaluate(self, final):
+        rows = 0
+        if self.pred is self.truth:
+            while self._truth_pending:
+                columns = self._truth_pending.popleft()
+                self.accumulator.update(_make_chunk(columns, columns, self.schema, self.vocabulary))
+                rows += _column_length(columns)
+        elif self.aligner is None:
+            while self._truth_pending and self._pred_pending:
+                truth, pred = self._truth_pending[0], self._pred_pending[0]
+                n_truth, n_pred = _column_length(truth), _column_length(pred)
+                n = min(n_truth, n_pred)
+                self.accumulator.update(_make_chunk(_slice_columns(truth, 0, n), _slice_columns(pred, 0, n),
+                                                    self.schema, self.vocabulary))
+                rows += n
+                for pending, columns, length in ((self._truth_pending, truth, n_truth), (self._pred_pending, pred, n_pred)):
+                    if length > n:
+                        pending[0] = _slice_columns(columns, n, length)
+                    else:
+                        pending.popleft()
+        else:
+            while self._truth_pending:
+                columns = self._truth_pending[0]
+                n = _column_length(columns)
+                ready = n if final else self._ready_rows(columns)
+                if ready == 0:
+                    break
+                self.accumulator.update(self.aligner.align(_slice_columns(columns, 0, ready)))
+                rows += ready
+                if ready < n:
+                    self._truth_pending[0] = _slice_columns(columns, ready, n)
+                    break
+                self._truth_pending.popleft()
+        return rows
+
+    def close(self):
+        """Menutup percobaan: sisa baris dievaluasi (atau dihitung tanpa pasangan) dan hasil akhirnya disimpan."""
+        self._evaluate(final=True)
+        if self.aligner is not None:
+            self.accumulator.update(self.aligner.finish())
+        elif self._truth_pending or self._pred_pending:
+            # Mode per posisi: baris sisa di salah satu file tidak punya pasangan.
+            empty = np.empty(0, dtype=np.uint8)
+            self.accumulator.update({'columns': {}, 'y_true': empty, 'y_pred': empty, 'truth_time': None, 'pred_time': None,
+                                     'invalid_time': 0,
+                                     'unmatched_truth': sum(map(_column_length, self._truth_pending)),
+                                     'unmatched_pred': sum(map(_column_length, self._pred_pending))})
+        self._truth_pending.clear()
+        self._pred_pending.clear()
+        self.partial = self.accumulator.finish()
+        return self.partial
+
+    def snapshot(self):
+        return self.partial if self.closed else self.accumulator.snapshot()
+
+
+class Watcher:
+    """Semua percobaan yang dipantau untuk sekumpulan dataset."""
+
+    def __init__(self, datasets, base_dir='.', align_tolerance=None, positional=False, idle=DEFAULT_IDLE):
+        self.datasets = datasets
+        self.base_dir = base_dir
+        self.idle = idle
+        self.tolerances = {ds['name']: alignment_tolerance(ds, align_tolerance, positional) for ds in datasets}
+        self.vocabularies = {ds['name']: LabelVocabulary() for ds in datasets}
+        self.trials = {ds['name']: {} for ds in datasets}
+        self.failed = set()
+        self.rows = 0
+        self.version = 0
+        self._json = (None, b'{}')
+
+    def scan(self):
+        """Menambahkan pasangan file percobaan yang baru muncul."""
+        for dataset in self.datasets:
+            trials = self.trials[dataset['name']]
+            found, _ = discover_trials(dataset, self.base_dir)
+            for scenario, truth_path, pred_path in found:
+                key = (truth_path, pred_path)
+                if key in trials or key in self.failed:
+                    continue
+                trials[key] = LiveTrial(scenario, truth_path, pred_path, dataset['schema'],
+                                        self.vocabularies[dataset['name']], self.tolerances[dataset['name']])
+                print(f"[{dataset['name']}] Percobaan baru '{scenario}': {truth_path}")
+
+    def _open_trials(self):
+        return [(name, key, trial) for name, trials in self.trials.items() for key, trial in trials.items() if not trial.closed]
+
+    def _fail(self, name, key, error):
+        print(f"[{name}] Error saat memproses file '{key[0]}': {error}")
+        del self.trials[name][key]
+        self.failed.add(key)
+        self.version += 1
+
+    async def poll(self):
+        """Satu putaran: pindai folder, baca ekor semua file terbuka lalu evaluasi baris barunya."""
+        self.scan()
+        pending = self._open_trials()
+        reads = await asyncio.gather(*(asyncio.to_thread(trial.read) for _, _, trial in pending), return_exceptions=True)
+        for (name, key, trial), chunks in zip(pending, reads):
+            try:
+                if isinstance(chunks, BaseException):
+                    raise chunks
+                rows = trial.consume(*chunks)
+                if rows:
+                    self.rows += rows
+                    self.version += 1
+                if trial.idle_seconds() >= self.idle:
+                    trial.close()
+                    self.version += 1
+                    print(f"[{name}] Percobaan selesai: {trial.source} ({trial.partial['rows']} baris)")
+            except Exception as e:
+                self._fail(name, key, e)
+
+    def close_all(self):
+        for name, key, trial in self._open_trials():
+            try:
+                trial.close()
+            except Exception as e:
+                self._fail(name, key, e)
+        self.version += 1
+
+    def results(self):
+        """Hasil berjalan per dataset (format evaluate_dataset) dari snapshot semua percobaan."""
+        results = {}
+        for dataset in self.datasets:
+            name = dataset['name']
+            result = new_result(dataset, align_tolerance=self.tolerances[name], vocabulary=self.vocabularies[name])
+            for trial in self.trials[name].values():
+                merge_trial(result, trial.scenario, trial.source, trial.snapshot(), paths=trial.paths)
+            if result['files']:
+                results[name] = finalize_result(result)
+        return results
+
+    def summaries(self):
+        """Ringkasan berjalan per dataset: jumlah, akurasi, confusion matrix, akurasi per transisi dan waktu tunda."""
+        summaries = {}
+        for name, result in self.results().items():
+            summary = build_metrics_summary(result)
+            cm, labels = sorted_confusion(result['confusion'], result['label_names'])
+            summaries[name] = {
+                'files': result['files'],
+                'open': sum(not trial.closed for trial in self.trials[name].values()),
+                'rows': summary['rows'],
+                'accuracy': summary['accuracy'],
+                'confusion': pd.DataFrame(cm, index=labels, columns=labels),
+                'classes': summary['classes'],
+                'transitions': build_transition_table(result['transition_counts'], result['delays'], result['vocabulary']),
+                'delays': summary['delays'],
+            }
+        return summaries
+
+    def print_summary(self, summaries=None):
+        summaries = self.summaries() if summaries is None else summaries
+        stamp = datetime.now().strftime('%H:%M:%S')
+        for name, summary in summaries.items():
+            print(f"\n--- Ringkasan Langsung {name} ({stamp}): {summary['files']} percobaan ({summary['open']} berjalan), "
+                  f"{summary['rows']} baris, akurasi {summary['accuracy'] * 100:.2f}% ---")
+            print(summary['confusion'].to_string())
+            for key in ('transitions', 'delays'):
+                if not summary[key].empty:
+                    print(summary[key].to_string(index=False))
+        if not summaries:
+            print(f"\n--- Ringkasan Langsung ({stamp}): belum ada baris yang dievaluasi ---")
+
+    def summary_json(self):
+        """Ringkasan berjalan sebagai JSON (byte); dihitung ulang hanya jika ada perubahan."""
+        version, body = self._json
+        if version != self.version:
+            payload = {
+                name: {
+                    'files': summary['files'],
+                    'open': summary['open'],
+                    'rows': summary['rows'],
+                    'accuracy': summary['accuracy'],
+                    'confusion': summary['confusion'].to_dict(),
+                    'classes': summary['classes'].to_dict('records'),
+                    'transitions': summary['transitions'].to_dict('records'),
+                    'delays': summary['delays'].to_dict('records'),
+                }
+                for name, summary in self.summaries().items()
+            }
+            body = json.dumps(payload, ensure_ascii=False, default=_json_value).encode('utf-8')
+            self._json = (self.version, body)
+        return body
+
+    async def _serve(self, reader, writer):
+        try:
+            await reader.readuntil(b'\r\n\r\n')
+            body = self.summary_json()
+            writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/json; charset=utf-8\r\n'
+                         + f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode('ascii') + body)
+            await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def run(self, interval=DEFAULT_INTERVAL, refresh=DEFAULT_REFRESH, port=None, duration=None):
+        """Memantau sampai duration detik berlalu (None: sampai dihentikan dengan Ctrl+C)."""
+        loop = asyncio.get_running_loop()
+        server = None
+        if port is not None:
+            server = await asyncio.start_server(self._serve, '127.0.0.1', port)
+            print(f"Ringkasan langsung tersedia sebagai JSON di http://127.0.0.1:{port}/")
+        started = last_print = loop.time()
+        printed = self.version
+        try:
+            while duration is None or loop.time() - started < duration:
+                await self.poll()
+                if self.version != printed and loop.time() - last_print >= refresh:
+                    self.print_summary()
+                    printed, last_print = self.version, loop.time()
+                await asyncio.sleep(interval)
+        finally:
+            if server is not None:
+                server.close()
+                await server.wait_closed()
+
+
+def _json_value(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def run_watch(names=None, *, config_path=None, base_dir='.', interval=DEFAULT_INTERVAL, refresh=DEFAULT_REFRESH,
+              idle=DEFAULT_IDLE, port=None, duration=None, align_tolerance=None, positional=False):
+    """
+    Memantau dataset (atau yang dipilih lewat names) dan mencetak ringkasan
+    berjalan. Saat berhenti (Ctrl+C atau setelah duration detik) semua
+    percobaan ditutup dan ringkasan akhir dicetak. Mengembalikan ringkasan akhir.
+    """
+    datasets = select_datasets(load_config(config_path), names)
+    watcher = Watcher(datasets, base_dir, align_tolerance, positional, idle)
+    print(f"Memantau {', '.join(ds['name'] for ds in datasets)} setiap {interval} detik (Ctrl+C untuk berhenti)...")
+    try:
+        asyncio.run(watcher.run(interval, refresh, port, duration))
+    except KeyboardInterrupt:
+        print("\nPemantauan dihentikan.")
+    watcher.close_all()
+    summaries = watcher.summaries()
+    watcher.print_summary(summaries)
+    return summaries
@@ -0,0 +1,48 @@
+import contextlib
+import io
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from pengujian.config import load_config, select_datasets  # noqa: E402
+from pengujian.engine import evaluate_dataset  # noqa: E402
+
+
+def dataset(name):
+    return select_datasets(load_config(None), [name])[0]
+
+
+def evaluate(name, base_dir=REPO, **kwargs):
+    """Hasil evaluate_dataset satu dataset repo tanpa keluaran cetak."""
+    kwargs.setdefault('collect_rows', False)
+    kwargs.setdefault('io_workers', 1)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return evaluate_dataset(dataset(name), base_dir, **kwargs)
+
+
+def _without_extension(frame):
+    """Nama sumber dibandingkan tanpa ekstensi (.csv atau .pgrec)."""
+    return frame.assign(source=frame['source'].map(lambda source: os.path.splitext(source)[0]))
+
+
+def assert_same_result(expected, actual):
+    """Confusion, hitungan per transisi, waktu tunda dan segmen dua hasil evaluasi sama persis."""
+    assert expected['files'] == actual['files'] and expected['rows'] == actual['rows']
+    np.testing.assert_array_equal(expected['confusion'], actual['confusion'])
+    assert expected['transition_counts'] == actual['transition_counts']
+    pd.testing.assert_frame_equal(_without_extension(expected['delays']).reset_index(drop=True),
+                                  _without_extension(actual['delays']).reset_index(drop=True), check_dtype=False)
+    segments = [pd.concat(result['mismatch_segments'], ignore_index=True).drop(columns=['source', 'truth_path', 'pred_path'])
+                for result in (expected, actual)]
+    pd.testing.assert_frame_equal(*segments, check_dtype=False)
+
+
+@pytest.fixture(scope='session')
+def plain_results():
+    return {name: evaluate(name) for name in ('10ws', '50ws')}
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pengujian.labels import LabelVocabulary
+from pengujian.loader import iter_trial_chunks
+from pengujian.segments import build_segment_table, read_rows, segment_rows, split_at_gaps
+from pengujian.streaming import TrialAccumulator
+
+START = pd.Timestamp('2025-08-06 15:53:34')
+STEP = pd.Timedelta(milliseconds=200)
+
+
+def write_trial(path, labels, rows=None):
+    """File skema 'sistem' dengan satu baris per 200 ms; rows memilih (dan boleh mengulang) baris yang ditulis."""
+    rows = np.arange(len(labels)) if rows is None else np.asarray(rows)
+    pd.DataFrame({
+        'Timestamp': [(START + STEP * int(i)).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3] for i in rows],
+        'Tegangan_V': 230.0 + rows,
+        'Hasil_Prediksi': np.asarray(labels, dtype=object)[rows],
+    }).to_csv(path, index=False)
+    return str(path)
+
+
+def evaluate_pair(truth_path, pred_path, chunksize=None):
+    vocabulary = LabelVocabulary()
+    accumulator = TrialAccumulator(vocabulary)
+    for chunk in iter_trial_chunks(truth_path, pred_path, 'sistem', vocabulary, chunksize, None, 0.05):
+        accumulator.update(chunk)
+    partial = accumulator.finish()
+    segments = partial['mismatch_segments'].assign(source='x', truth_path=truth_path, pred_path=pred_path)
+    return partial, build_segment_table(segments, vocabulary.names)
+
+
+TRUTH = ['NORMAL'] * 8 + ['ARC FLASH'] * 12
+# Prediksi terlambat tiga baris.
+PRED = ['NORMAL'] * 11 + ['ARC FLASH'] * 9
+
+
+def assert_segments_read_matching_rows(table):
+    for _, segment in table.iterrows():
+        assert segment['Baris Akhir'] - segment['Baris Awal'] + 1 == segment['Jumlah Baris']
+        rows = segment_rows(segment, pred_column='Hasil_Prediksi')
+        assert len(rows) == segment['Jumlah Baris']
+        assert (rows['Prediksi_Model'] == segment['Prediksi_Model']).all()
+        pred = read_rows(segment['Path Prediksi'], segment['Baris Awal Prediksi'], segment['Baris Akhir Prediksi'])
+        assert (pred['Timestamp'].to_numpy() == rows['Timestamp'].to_numpy()).all()
+
+
+@pytest.mark.parametrize('chunksize', [None, 3])
+def test_dropped_prediction_row(tmp_path, chunksize):
+    truth = write_trial(tmp_path / 'kebenaran.csv', TRUTH)
+    pred = write_trial(tmp_path / 'prediksi.csv', PRED, [i for i in range(20) if i not in (3, 9)])
+    partial, table = evaluate_pair(truth, pred, chunksize)
+
+    assert partial['rows'] == 18
+    assert (partial['unmatched_truth'], partial['unmatched_pred'], partial['invalid_time_rows']) == (2, 0, 0)
+    # Baris kebenaran 9 tidak punya pasangan, jadi segmen 8..10 dipecah.
+    assert table[['Baris Awal', 'Baris Akhir', 'Baris Awal Prediksi', 'Baris Akhir Prediksi']].values.tolist() == [
+        [8, 8, 7, 7], [10, 10, 8, 8]]
+    assert_segments_read_matching_rows(table)
+
+    delays = partial['delays']
+    assert len(delays) == 1
+    # Transisi di baris kebenaran 8 (awal segmen), terdeteksi di baris prediksi 9 (baris asli 11).
+    assert delays.loc[0, 'truth_index'] == table.loc[0, 'Baris Awal'] == 8
+    assert delays.loc[0, 'pred_index'] == 9
+    assert delays.loc[0, 'delay_rows'] == 2
+    assert delays.loc[0, 'delay_seconds'] == pytest.approx(0.6)
+
+
+@pytest.mark.parametrize('chunksize', [None, 3])
+def test_duplicated_prediction_row(tmp_path, chunksize):
+    truth = write_trial(tmp_path / 'kebenaran.csv', TRUTH)
+    expected, _ = evaluate_pair(truth, write_trial(tmp_path / 'prediksi.csv', PRED), chunksize)
+    pred = write_trial(tmp_path / 'prediksi_ganda.csv', PRED, sorted(list(range(20)) + [9]))
+    partial, table = evaluate_pair(truth, pred, chunksize)
+
+    assert (partial['confusion'] == expected['confusion']).all()
+    assert (partial['unmatched_truth'], partial['unmatched_pred']) == (0, 1)
+    # Baris prediksi ganda (10) dilewati, jadi segmen dipecah agar tetap berurutan di kedua file.
+    assert table[['Baris Awal', 'Baris Akhir', 'Baris Awal Prediksi', 'Baris Akhir Prediksi']].values.tolist() == [
+        [8, 9, 8, 9], [10, 10, 11, 11]]
+    assert_segments_read_matching_rows(table)
+    assert partial['delays'][['truth_index', 'pred_index']].values.tolist() == [[8, 12]]
+
+
+def test_invalid_truth_time_is_not_unmatched(tmp_path):
+    truth = write_trial(tmp_path / 'kebenaran.csv', TRUTH)
+    lines = open(truth).read().splitlines(True)
+    lines[4] = 'bukan waktu' + lines[4][lines[4].index(','):]
+    open(truth, 'w').writelines(lines)
+    partial, _ = evaluate_pair(truth, write_trial(tmp_path / 'prediksi.csv', PRED))
+
+    assert (partial['rows'], partial['invalid_time_rows']) == (19, 1)
+    assert (partial['unmatched_truth'], partial['unmatched_pred']) == (0, 1)
+
+
+@pytest.mark.parametrize('chunksize', [None, 3])
+def test_invalid_time_in_unread_prediction_tail(tmp_path, chunksize):
+    truth = write_trial(tmp_path / 'kebenaran.csv', TRUTH[:5])
+    pred = write_trial(tmp_path / 'prediksi.csv', TRUTH)
+    lines = open(pred).read().splitlines(True)
+    lines[18] = 'bukan waktu' + lines[18][lines[18].index(','):]
+    open(pred, 'w').writelines(lines)
+    partial, _ = evaluate_pair(truth, pred, chunksize)
+
+    # Sisa file prediksi yang tidak pernah dibaca ke buffer dipisah dengan cara yang sama.
+    assert (partial['rows'], partial['invalid_time_rows']) == (5, 1)
+    assert (partial['unmatched_truth'], partial['unmatched_pred']) == (0, 14)
+
+
+def test_split_at_gaps_breaks_segments_where_rows_skip():
+    starts, lengths = np.array([0, 4]), np.array([3, 4])
+    rows = np.array([0, 1, 2, 3, 4, 5, 7, 8])
+    pred_rows = np.array([0, 1, 3, 4, 5, 6, 7, 8])
+    new_starts, new_lengths, source = split_at_gaps(starts, lengths, rows, pred_rows)
+    assert new_starts.tolist() == [0, 2, 4, 6]
+    assert new_lengths.tolist() == [2, 1, 2, 2]
+    assert source.tolist() == [0, 0, 1, 1]
@@ -0,0 +1,41 @@
+import contextlib
+import io
+import json
+import os
+
+import pytest
+
+from pengujian.benchmark import SPEC_FILE, parse_count, run_benchmark, synthesize_dataset
+from pengujian.engine import evaluate_dataset
+
+
+def test_parse_count():
+    assert [parse_count(text) for text in ['10k', '1M', '1.5m', '35000']] == [10_000, 1_000_000, 1_500_000, 35_000]
+
+
+@pytest.mark.parametrize('schema_name', ['sistem', 'percobaan'])
+def test_synthetic_dataset_is_evaluated_and_reused(tmp_path, schema_name):
+    dataset = synthesize_dataset(str(tmp_path), schema_name, 1003, files=3, transitions=4)
+    spec_path = os.path.join(tmp_path, dataset['root'], SPEC_FILE)
+    written_at = os.path.getmtime(spec_path)
+    assert synthesize_dataset(str(tmp_path), schema_name, 1003, files=3, transitions=4) == dataset
+    assert os.path.getmtime(spec_path) == written_at
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = evaluate_dataset(dataset, str(tmp_path))
+    assert result['files'] == 3 and result['rows'] == 1003
+    assert result['confusion'].sum() == 1003
+    assert len(result['delays']) > 0
+
+
+def test_run_benchmark_appends_record(tmp_path):
+    output = tmp_path / 'hasil.jsonl'
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(2):
+            run_benchmark([2000], schemas=('sistem',), files=2, workdir=str(tmp_path), output=str(output), figures=False)
+    records = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+    assert len(records) == 2
+    record = records[-1]
+    assert record['schema'] == 'sistem' and record['rows'] == 2000
+    assert {'label_encode', 'report_build', 'lainnya'} <= set(record['stages'])
+    assert sum(record['stages'].values()) == pytest.approx(record['total_seconds'], abs=1e-3)
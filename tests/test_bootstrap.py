@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pengujian.bootstrap import BLOCK_REPLICATES, bootstrap_intervals
+
+
+def test_intervals_depend_only_on_seed(plain_results):
+    result = plain_results['10ws']
+    replicates = 2 * BLOCK_REPLICATES + 100
+    serial = bootstrap_intervals(result, replicates, seed=3, workers=1)
+    parallel = bootstrap_intervals(result, replicates, seed=3, workers=2)
+    pd.testing.assert_frame_equal(serial, parallel)
+    assert not serial.equals(bootstrap_intervals(result, replicates, seed=4, workers=1))
+
+
+def test_intervals_contain_point_estimate(plain_results):
+    result = plain_results['10ws']
+    intervals = bootstrap_intervals(result, 1000, workers=1)
+    assert ((intervals['Batas Bawah'] <= intervals['Nilai'] + 1e-9) & (intervals['Nilai'] <= intervals['Batas Atas'] + 1e-9)).all()
+    overall = intervals[(intervals['Nama'] == 'Semua Data') & (intervals['Metrik'] == 'Akurasi')]
+    assert overall['Nilai'].item() == pytest.approx(np.trace(result['confusion']) / result['confusion'].sum() * 100)
@@ -0,0 +1,32 @@
+import contextlib
+import io
+
+import numpy as np
+import pandas as pd
+
+from conftest import REPO, dataset
+from pengujian.compare import build_comparison_table, build_delay_comparison_table, compare_windows, summarize_result
+
+
+def test_comparison_table_matches_dataset_metrics(plain_results):
+    summaries = [summarize_result(plain_results[name]) for name in ('50ws', '10ws')]
+    table = build_comparison_table(summaries)
+
+    assert table['Ukuran Window'].tolist() == sorted(s['window'] for s in summaries)
+    assert not any('nan' in column.lower() for column in table.columns)
+    for _, row in table.iterrows():
+        confusion = plain_results[row['Dataset']]['confusion']
+        assert row['Total Data'] == confusion.sum()
+        assert row['Akurasi (%)'] == round(np.trace(confusion) / confusion.sum() * 100, 2)
+        assert row['Transisi Terdeteksi'] == len(plain_results[row['Dataset']]['delays'])
+    delay_table = build_delay_comparison_table(summaries)
+    assert delay_table.groupby('Dataset')['Jumlah'].sum().to_dict() == dict(zip(table['Dataset'], table['Transisi Terdeteksi']))
+
+
+def test_worker_processes_match_in_process_summaries():
+    datasets = [dataset('10ws'), dataset('50ws')]
+    with contextlib.redirect_stdout(io.StringIO()):
+        serial = compare_windows(datasets, REPO, workers=1)
+        parallel = compare_windows(datasets, REPO, workers=2)
+    pd.testing.assert_frame_equal(build_comparison_table(serial), build_comparison_table(parallel))
+    pd.testing.assert_frame_equal(build_delay_comparison_table(serial), build_delay_comparison_table(parallel))
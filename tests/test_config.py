@@ -0,0 +1,37 @@
+import json
+import os
+
+import pytest
+
+from pengujian.config import SCHEMAS, load_config, output_folder, select_datasets
+
+
+def test_default_config_covers_every_window_size():
+    datasets = load_config(None)
+    assert [ds['name'] for ds in datasets] == ['10ws', '20ws', '25ws', '50ws']
+    assert all(ds['schema'] in SCHEMAS for ds in datasets)
+
+
+def test_json_config_overrides_defaults(tmp_path):
+    path = tmp_path / 'pengujian.json'
+    dataset = dict(load_config(None)[0], name='uji', root='data_uji')
+    path.write_text(json.dumps({'datasets': [dataset]}), encoding='utf-8')
+    datasets = load_config(str(path))
+    assert [ds['name'] for ds in datasets] == ['uji']
+    assert output_folder(datasets[0], 'dasar') == os.path.join('dasar', 'data_uji', dataset['output']['folder'])
+    assert output_folder(datasets[0], 'dasar', 'keluaran') == os.path.join('keluaran', 'uji')
+
+
+def test_unknown_schema_is_rejected(tmp_path):
+    path = tmp_path / 'pengujian.json'
+    path.write_text(json.dumps([{'name': 'uji', 'schema': 'lain'}]), encoding='utf-8')
+    with pytest.raises(ValueError, match='lain'):
+        load_config(str(path))
+
+
+def test_select_datasets_keeps_requested_order():
+    datasets = load_config(None)
+    assert [ds['name'] for ds in select_datasets(datasets, ['50ws', '10ws'])] == ['50ws', '10ws']
+    assert select_datasets(datasets, None) == datasets
+    with pytest.raises(ValueError, match='99ws'):
+        select_datasets(datasets, ['10ws', '99ws'])
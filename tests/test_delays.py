@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pengujian.delays import transition_delays
+from pengujian.labels import LabelVocabulary
+from pengujian.rle import runs_from_codes
+
+
+def per_transition_scan(y_true, y_pred):
+    """Rujukan: untuk setiap transisi kebenaran, baris pertama sesudahnya yang prediksinya sudah sama."""
+    rows = []
+    for start in range(1, len(y_true)):
+        if y_true[start] == y_true[start - 1]:
+            continue
+        hits = [i for i in range(start, len(y_pred)) if y_pred[i] == y_true[start]]
+        if hits:
+            rows.append((y_true[start - 1], y_true[start], start, hits[0]))
+    return rows
+
+
+def find_delays(y_true, y_pred, truth_time=None, pred_time=None):
+    vocab = LabelVocabulary()
+    truth = runs_from_codes(vocab.encode(np.asarray(y_true, dtype=object)))
+    pred = runs_from_codes(vocab.encode(np.asarray(y_pred, dtype=object)))
+    delays = transition_delays(truth, pred, truth_time, pred_time)
+    names = np.asarray(vocab.names, dtype=object)
+    return delays.assign(label_from=names[delays['code_from']], label_to=names[delays['code_to']])
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_delays_match_per_transition_scan(seed):
+    rng = np.random.default_rng(seed)
+    labels = np.array(['NORMAL', 'ARC FLASH', 'NO CONTACT'], dtype=object)
+    y_true = labels[np.repeat(rng.integers(0, 3, 30), rng.integers(1, 12, 30))]
+    y_pred = np.roll(y_true, int(rng.integers(0, 5)))
+    delays = find_delays(y_true, y_pred)
+    expected = per_transition_scan(list(y_true), list(y_pred))
+    assert list(zip(delays['label_from'], delays['label_to'], delays['truth_index'], delays['pred_index'])) == expected
+    assert (delays['delay_rows'] == delays['pred_index'] - delays['truth_index']).all()
+    assert delays['delay_seconds'].isna().all()
+
+
+def test_delay_seconds_use_both_time_columns():
+    y_true = ['NORMAL', 'NORMAL', 'ARC FLASH', 'ARC FLASH', 'ARC FLASH']
+    y_pred = ['NORMAL', 'NORMAL', 'NORMAL', 'NORMAL', 'ARC FLASH']
+    time = pd.to_datetime(['2025-08-06 15:53:34.000', '2025-08-06 15:53:34.200', '2025-08-06 15:53:34.400',
+                           '2025-08-06 15:53:34.600', '2025-08-06 15:53:34.800']).to_numpy()
+    delays = find_delays(y_true, y_pred, time, time)
+    assert delays[['truth_index', 'pred_index', 'delay_rows']].values.tolist() == [[2, 4, 2]]
+    assert delays.loc[0, 'delay_seconds'] == pytest.approx(0.4)
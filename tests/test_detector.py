@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from pengujian.detector import ArcFlashDetector, RollingStats, benchmark
+from pengujian.labels import LabelVocabulary
+from pengujian.sweep import classify, rolling_features, rolling_mean_std
+
+
+def synthetic_signal(n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    segment = np.arange(n) // 500 % 3
+    voltage = np.choose(segment, [330 + rng.normal(0, 1, n), rng.uniform(0, 340, n), np.zeros(n)])
+    current = np.choose(segment, [np.full(n, 0.06), rng.uniform(0, 0.1, n), np.zeros(n)])
+    return voltage, current
+
+
+@pytest.mark.parametrize('size', [1, 10, 50])
+@pytest.mark.parametrize('ddof', [0, 1])
+def test_rolling_stats_matches_sweep(size, ddof):
+    voltage, _ = synthetic_signal()
+    stats = RollingStats(size, ddof)
+    means, stds = [], []
+    for value in voltage:
+        stats.push(value)
+        means.append(stats.mean)
+        stds.append(stats.std)
+    mean, std = rolling_mean_std(voltage, size, ddof)
+    np.testing.assert_allclose(means, mean, rtol=0, atol=1e-6)
+    np.testing.assert_allclose(stds, std, rtol=0, atol=1e-4)
+
+
+def test_detector_labels_match_sweep_classify():
+    voltage, current = synthetic_signal()
+    vocabulary = LabelVocabulary()
+    labels = ArcFlashDetector(10, ddof=1).run(zip(voltage, current))
+    expected = classify(rolling_features(voltage, current, 10, ddof=1), vocabulary)
+    assert [vocabulary.code(label) for label in labels] == expected.tolist()
+
+
+def test_rolling_stats_rejects_empty_window():
+    with pytest.raises(ValueError):
+        RollingStats(0)
+
+
+def test_benchmark_reports_seconds_per_sample():
+    assert 0 < benchmark(n_samples=2000) < 0.005
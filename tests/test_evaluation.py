@@ -0,0 +1,78 @@
+import os
+import shutil
+
+import pytest
+
+from pengujian.cache import TrialCache
+from pengujian.manifest import ResultManifest
+from pengujian.recording import convert_datasets
+
+from conftest import REPO, assert_same_result, evaluate
+
+
+@pytest.mark.parametrize('name', ['10ws', '50ws'])
+@pytest.mark.parametrize('chunksize', [7, 500])
+def test_chunked_matches_unchunked(plain_results, name, chunksize):
+    assert_same_result(plain_results[name], evaluate(name, chunksize=chunksize))
+
+
+@pytest.mark.parametrize('name', ['10ws', '50ws'])
+def test_prefetch_matches_sequential(plain_results, name):
+    assert_same_result(plain_results[name], evaluate(name, io_workers=4))
+
+
+@pytest.mark.parametrize('name', ['10ws', '50ws'])
+def test_cache_matches_csv(plain_results, tmp_path, name):
+    cache = TrialCache(str(tmp_path / 'cache'))
+    # Run pertama mengisi cache, run kedua membaca kolom lewat memmap.
+    for _ in range(2):
+        assert_same_result(plain_results[name], evaluate(name, cache=cache))
+
+
+@pytest.mark.parametrize('name', ['10ws', '50ws'])
+def test_manifest_matches_csv(plain_results, tmp_path, name):
+    manifest = ResultManifest(str(tmp_path / 'hasil'))
+    assert_same_result(plain_results[name], evaluate(name, manifest=manifest))
+    assert manifest.hits == 0
+    assert_same_result(plain_results[name], evaluate(name, manifest=manifest))
+    assert manifest.hits == plain_results[name]['files']
+
+
+def test_manifest_recomputes_only_changed_pair(plain_results, tmp_path):
+    root = 'hasil_pengujian_10ws'
+    shutil.copytree(os.path.join(REPO, root), tmp_path / root)
+    manifest = ResultManifest(str(tmp_path / 'hasil'))
+    evaluate('10ws', str(tmp_path), manifest=manifest)
+
+    changed = tmp_path / root / 'normal ke arc ke off dari sistem' / 'normal arc off dari sistem1.csv'
+    lines = changed.read_text().splitlines(True)
+    lines[40] = lines[40].replace('NORMAL', 'ARC FLASH')
+    changed.write_text(''.join(lines))
+
+    files = plain_results['10ws']['files']
+    manifest = ResultManifest(str(tmp_path / 'hasil'))
+    incremental = evaluate('10ws', str(tmp_path), manifest=manifest)
+    assert (manifest.hits, manifest.misses) == (files - 1, 1)
+    assert_same_result(evaluate('10ws', str(tmp_path)), incremental)
+    assert incremental['confusion'].sum() == plain_results['10ws']['confusion'].sum()
+    assert (incremental['confusion'] != plain_results['10ws']['confusion']).any()
+
+
+
+def test_manifest_index_written_once_per_run(plain_results, tmp_path, monkeypatch):
+    writes = []
+    write_index = ResultManifest._write_index
+    monkeypatch.setattr(ResultManifest, '_write_index', lambda self: writes.append(1) or write_index(self))
+    manifest = ResultManifest(str(tmp_path / 'hasil'))
+    evaluate('10ws', manifest=manifest)
+    assert len(writes) == 1 and not manifest.dirty
+    assert len(ResultManifest(str(tmp_path / 'hasil')).index) == plain_results['10ws']['files']
+    evaluate('10ws', manifest=manifest)
+    assert len(writes) == 1
+
+@pytest.mark.parametrize('name', ['10ws', '50ws'])
+def test_recording_matches_csv(plain_results, tmp_path, name):
+    converted = convert_datasets([name], base_dir=REPO, output_root=str(tmp_path))
+    assert converted > 0
+    assert_same_result(plain_results[name], evaluate(name, base_dir=str(tmp_path)))
+    assert not any(name.endswith('.csv') for _, _, files in os.walk(tmp_path) for name in files)
@@ -0,0 +1,38 @@
+import contextlib
+import io
+
+import pandas as pd
+
+from conftest import REPO
+from pengujian.engine import run
+from pengujian.export import DATETIME_FORMAT, write_excel
+
+
+def test_excel_sheet_is_capped_and_spill_holds_all_rows(tmp_path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = run(['10ws'], base_dir=REPO, output_root=str(tmp_path), figures=False, excel_rows=50)['10ws']
+    folder = tmp_path / '10ws'
+    assert result['mismatch_rows'] > 50
+
+    sheets = pd.read_excel(folder / 'laporan_pengujian_lengkap.xlsx', sheet_name=None)
+    detail = sheets['Detail Kesalahan']
+    assert len(detail) == 50
+    info = dict(zip(sheets['Info Kesalahan']['Keterangan'], sheets['Info Kesalahan']['Nilai']))
+    assert info['Total baris kesalahan'] == result['mismatch_rows']
+    assert info['File detail kesalahan lengkap'] == 'detail_kesalahan.csv'
+
+    spill = pd.read_csv(folder / 'detail_kesalahan.csv')
+    assert len(spill) == result['mismatch_rows']
+    columns = ['Sumber_File', 'Tegangan_V', 'Label_Seharusnya', 'Prediksi_Model']
+    pd.testing.assert_frame_equal(spill[columns].head(50), detail[columns], check_dtype=False)
+
+
+def test_write_excel_keeps_milliseconds(tmp_path):
+    from openpyxl import load_workbook
+
+    times = pd.to_datetime(['2025-08-06 15:53:34.200', '2025-08-06 15:53:34.400'])
+    path = tmp_path / 'waktu.xlsx'
+    write_excel(path, [('Data', pd.DataFrame({'Timestamp': times, 'Nilai': [1, 2]}))])
+    sheet = load_workbook(path)['Data']
+    assert sheet['A2'].number_format == DATETIME_FORMAT
+    assert pd.Timestamp(sheet['A3'].value) == times[1]
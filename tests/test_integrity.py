@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from pengujian.integrity import feature_violations, fit_window, violation_ranges
+from pengujian.sweep import rolling_features
+
+
+def synthetic_recording(window, ddof, n=2000, seed=0):
+    """Sinyal sintetis dengan fitur tercatat dari window/ddof tertentu, dibulatkan 2 desimal seperti perangkat."""
+    rng = np.random.default_rng(seed)
+    segment = np.arange(n) // 250 % 3
+    voltage = np.choose(segment, [330 + rng.normal(0, 1, n), rng.uniform(0, 340, n), np.zeros(n)])
+    current = np.choose(segment, [0.06 + rng.normal(0, 0.002, n), rng.uniform(0, 0.1, n), np.zeros(n)])
+    logged = {feature: np.round(values, 2) for feature, values in rolling_features(voltage, current, window, ddof).items()}
+    return voltage, current, logged
+
+
+@pytest.mark.parametrize('window, ddof', [(10, 1), (20, 0), (25, 1)])
+def test_fit_window_recovers_logged_window(window, ddof):
+    voltage, current, logged = synthetic_recording(window, ddof)
+    fitted_window, fitted_ddof, fraction = fit_window(voltage, current, logged, range(1, 51))
+    assert (fitted_window, fitted_ddof) == (window, ddof)
+    assert fraction == 1.0
+
+
+def test_feature_violations_reports_wrong_window():
+    voltage, current, logged = synthetic_recording(25, 1)
+    mask, _ = feature_violations(voltage, current, logged, 25, 1)
+    assert not mask.any()
+    mask, max_error = feature_violations(voltage, current, logged, 20, 1)
+    assert mask.any() and max_error['std_v'] > 1.0
+    assert not mask[:19].any()
+
+
+def test_violation_ranges_are_inclusive():
+    mask = np.array([0, 1, 1, 0, 0, 1, 0, 1], dtype=bool)
+    assert violation_ranges(mask) == [(1, 2), (5, 5), (7, 7)]
@@ -0,0 +1,19 @@
+import numpy as np
+import pandas as pd
+
+from pengujian.labels import LABELS, LabelVocabulary
+
+
+def test_categorical_encode_adds_no_phantom_label():
+    vocabulary = LabelVocabulary()
+    codes = vocabulary.encode(pd.Categorical(['NORMAL', 'ARC FLASH ⚠', 'Status: Off Contact']))
+    assert codes.tolist() == [0, 1, 2]
+    assert vocabulary.names == LABELS
+
+
+def test_categorical_missing_matches_factorize_path():
+    categorical, plain = LabelVocabulary(), LabelVocabulary()
+    values = ['NORMAL', None, 'ARC FLASH']
+    codes = categorical.encode(pd.Categorical(values))
+    assert codes.tolist() == plain.encode(np.array(values, dtype=object)).tolist()
+    assert categorical.names == plain.names
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from pengujian.metrics import class_report, confusion_matrix
+
+sklearn_metrics = pytest.importorskip('sklearn.metrics')
+
+
+def test_class_report_matches_sklearn():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 3, 500)
+    y_pred = np.where(rng.random(500) < 0.8, y_true, rng.integers(0, 3, 500))
+    # Kelas 2 tidak pernah diprediksi: precision-nya 0 seperti zero_division=0.
+    y_pred[y_pred == 2] = 0
+    labels = ['NORMAL', 'ARC FLASH', 'NO CONTACT']
+    names = np.array(labels)
+
+    report, text = class_report(confusion_matrix(y_true, y_pred, 3), labels)
+    expected = sklearn_metrics.classification_report(names[y_true], names[y_pred], output_dict=True, zero_division=0)
+    assert report.keys() == expected.keys()
+    assert report['accuracy'] == pytest.approx(expected['accuracy'])
+    for name in labels + ['macro avg', 'weighted avg']:
+        for key in ('precision', 'recall', 'f1-score', 'support'):
+            assert report[name][key] == pytest.approx(expected[name][key]), (name, key)
+    assert text == sklearn_metrics.classification_report(names[y_true], names[y_pred], zero_division=0)
@@ -0,0 +1,22 @@
+import json
+import subprocess
+import sys
+
+from conftest import REPO
+
+HEAVY_MODULES = ['matplotlib', 'seaborn', 'sklearn', 'openpyxl']
+
+
+def test_metrics_only_loads_no_heavy_modules():
+    code = (
+        "import contextlib, io, json, sys\n"
+        "from pengujian import run_metrics\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    summaries = run_metrics(['10ws'], base_dir=sys.argv[1])\n"
+        f"print(json.dumps([sorted(summaries), [m for m in {HEAVY_MODULES!r} if m in sys.modules]]))\n"
+    )
+    out = subprocess.run([sys.executable, '-c', code, REPO], cwd=REPO, capture_output=True, text=True, check=True)
+    names, loaded = json.loads(out.stdout.strip().splitlines()[-1])
+    assert names == ['10ws']
+    assert loaded == []
+
@@ -0,0 +1,34 @@
+import filecmp
+
+import numpy as np
+
+from conftest import REPO, dataset
+from pengujian.loader import discover_trials
+from pengujian.recording import csv_to_recording, read_recording, recording_to_csv
+
+
+def test_round_trip_keeps_text(tmp_path):
+    source = tmp_path / 'percobaan.csv'
+    source.write_text('Timestamp,A,B,Tegangan_V,Hasil_Prediksi\n'
+                      '2025-08-06 15:53:34.604,007,-0,235.10,NORMAL\n'
+                      '2025-08-06 15:53:34.820,+5,3,,ARC FLASH\n')
+    header = csv_to_recording(str(source), str(tmp_path / 'percobaan.pgrec'), 'sistem')
+    assert [column['kind'] for column in header['columns']] == ['datetime', 'number_category', 'number_category', 'float',
+                                                                'category']
+    recording_to_csv(str(tmp_path / 'percobaan.pgrec'), str(tmp_path / 'kembali.csv'))
+    assert filecmp.cmp(source, tmp_path / 'kembali.csv', shallow=False)
+
+    columns = read_recording(str(tmp_path / 'percobaan.pgrec'))
+    assert columns['A'].tolist() == [7.0, 5.0]
+    assert np.isnan(columns['Tegangan_V'][1])
+
+
+def test_round_trip_repo_files(tmp_path):
+    for name in ('10ws', '50ws'):
+        ds = dataset(name)
+        trials, _ = discover_trials(ds, REPO)
+        _, truth_path, pred_path = trials[0]
+        for path in {truth_path, pred_path}:
+            csv_to_recording(path, str(tmp_path / 'r.pgrec'), ds['schema'], ds['window_size'])
+            recording_to_csv(str(tmp_path / 'r.pgrec'), str(tmp_path / 'r.csv'))
+            assert filecmp.cmp(path, tmp_path / 'r.csv', shallow=False)
@@ -0,0 +1,40 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from pengujian.render import FINGERPRINT_FILE, FigureRenderer, fingerprint
+
+
+def submit_figures(folder, value=1):
+    renderer = FigureRenderer(workers=1)
+    renderer.table(pd.DataFrame({'Metrik': ['Akurasi'], 'Nilai': [value]}), folder, 'tabel.png', 'Judul')
+    renderer.confusion_matrix(np.array([[value, 0], [0, 2]]), ['A', 'B'], os.path.join(folder, 'cm.png'),
+                              'Judul', 'Kebenaran', 'Prediksi')
+    renderer.close()
+    return renderer
+
+
+def test_unchanged_figures_are_skipped(tmp_path):
+    assert submit_figures(str(tmp_path)).skipped == 0
+    assert (tmp_path / 'tabel.png').exists() and (tmp_path / 'cm.png').exists()
+    assert (tmp_path / FINGERPRINT_FILE).exists()
+    assert submit_figures(str(tmp_path)).skipped == 2
+
+    (tmp_path / 'cm.png').unlink()
+    assert submit_figures(str(tmp_path)).skipped == 1
+    assert submit_figures(str(tmp_path), value=3).skipped == 0
+
+
+def test_fingerprint_follows_inputs():
+    cm = np.array([[1, 0], [0, 2]])
+    assert fingerprint('confusion_matrix', (cm, ['A', 'B']), {}) == fingerprint('confusion_matrix', (cm.copy(), ['A', 'B']), {})
+    assert fingerprint('confusion_matrix', (cm, ['A', 'B']), {}) != fingerprint('confusion_matrix', (cm.astype(np.int32), ['A', 'B']), {})
+    assert fingerprint('tabel', (), {'title': 'x'}) != fingerprint('tabel', (), {'title': 'y'})
+
+
+def test_disabled_renderer_writes_nothing(tmp_path):
+    renderer = FigureRenderer(enabled=False)
+    renderer.table(pd.DataFrame({'a': [1]}), str(tmp_path), 'tabel.png', 'Judul')
+    renderer.close()
+    assert list(tmp_path.iterdir()) == []
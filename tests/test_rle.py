@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from pengujian.rle import confusion_from_runs, predictions_per_truth_run, runs_from_codes
+
+
+def random_codes(rng, n_labels=3, n_runs=40):
+    return np.repeat(rng.integers(0, n_labels, n_runs), rng.integers(1, 10, n_runs))
+
+
+def test_runs_roundtrip():
+    codes = np.array([2, 2, 0, 0, 0, 1, 2, 2])
+    runs = runs_from_codes(codes)
+    assert runs.starts.tolist() == [0, 2, 5, 6]
+    assert runs.lengths.tolist() == [2, 3, 1, 2]
+    assert runs.codes.tolist() == [2, 0, 1, 2]
+    assert np.array_equal(np.repeat(runs.codes, runs.lengths), codes)
+    assert len(runs_from_codes([]).starts) == 0
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_confusion_matches_bincount(seed):
+    rng = np.random.default_rng(seed)
+    truth = random_codes(rng)
+    pred = np.roll(truth, int(rng.integers(0, 6)))
+    pred[rng.integers(0, len(pred), 10)] = rng.integers(0, 3, 10)
+    expected = np.bincount(truth * 3 + pred, minlength=9).reshape(3, 3)
+    np.testing.assert_array_equal(confusion_from_runs(runs_from_codes(truth), runs_from_codes(pred), 3), expected)
+
+
+def test_predictions_per_truth_run():
+    truth = np.array([0, 0, 1, 1, 1, 2, 0, 0])
+    pred = np.array([0, 0, 0, 1, 1, 2, 2, 0])
+    counts = predictions_per_truth_run(runs_from_codes(truth), runs_from_codes(pred), 3)
+    assert counts.tolist() == [[2, 0, 0], [1, 2, 0], [0, 0, 1], [1, 0, 1]]
+
+
+def test_mismatched_lengths_raise():
+    with pytest.raises(ValueError):
+        confusion_from_runs(runs_from_codes([0, 1]), runs_from_codes([0]), 2)
@@ -0,0 +1,52 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import REPO
+from pengujian.cache import TrialCache
+from pengujian.loader import iter_csv_columns
+from pengujian.rle import runs_from_codes
+from pengujian.segments import RowIndex, chunk_segments, merge_segments, read_rows, row_offsets
+
+TRIAL = os.path.join(REPO, 'hasil_pengujian_10ws', 'normal ke arc ke off dari sistem', 'normal arc off dari sistem1.csv')
+
+
+def test_merge_segments_joins_segments_across_chunk_boundaries():
+    rng = np.random.default_rng(0)
+    truth = np.repeat(rng.integers(0, 3, 40), rng.integers(1, 8, 40)).astype(np.uint8)
+    pred = np.roll(truth, 3)
+    expected = chunk_segments(runs_from_codes(truth), runs_from_codes(pred))
+    for chunksize in (1, 5, 17):
+        frames = [chunk_segments(runs_from_codes(truth[i:i + chunksize]), runs_from_codes(pred[i:i + chunksize]), offset=i)
+                  for i in range(0, len(truth), chunksize)]
+        pd.testing.assert_frame_equal(merge_segments(frames), expected, check_dtype=False)
+
+
+@pytest.mark.parametrize('start, end', [(0, 0), (179, 185), (700, 10_000)])
+def test_read_rows_matches_csv(tmp_path, start, end):
+    expected = pd.read_csv(TRIAL).iloc[start:end + 1]
+    cache = TrialCache(str(tmp_path / 'cache'))
+    for _ in iter_csv_columns(TRIAL, None, cache):
+        pass
+    assert cache.load(TRIAL) is not None
+    index = RowIndex(str(tmp_path / 'indeks.npz'))
+    for rows in (read_rows(TRIAL, start, end), read_rows(TRIAL, start, end, index=index), read_rows(TRIAL, start, end, cache)):
+        assert list(rows.index) == list(expected.index)
+        np.testing.assert_array_equal(rows['Tegangan_V'], expected['Tegangan_V'])
+        np.testing.assert_array_equal(np.asarray(rows['Hasil_Prediksi'], dtype=object), expected['Hasil_Prediksi'].to_numpy())
+
+
+def test_row_index_is_stored_and_rebuilt_when_file_changes(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text('a,b\n1,x\n2,y\n3,z', encoding='utf-8')
+    np.testing.assert_array_equal(row_offsets(path), [4, 8, 12, 15])
+
+    RowIndex(str(tmp_path / 'indeks.npz')).offsets(path)
+    index = RowIndex(str(tmp_path / 'indeks.npz'))
+    assert list(np.load(index.path)) == [RowIndex.key(path)]
+    assert read_rows(path, 2, 2, index=index)['a'].tolist() == [3]
+
+    path.write_text('a,b\n10,x\n20,y\n', encoding='utf-8')
+    assert read_rows(path, 1, 1, index=index)['a'].tolist() == [20]
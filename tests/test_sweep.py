@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pengujian.sweep import rolling_mean_std
+
+
+@pytest.mark.parametrize('window', [1, 5, 25])
+@pytest.mark.parametrize('ddof', [0, 1])
+def test_rolling_mean_std_matches_pandas(window, ddof):
+    rng = np.random.default_rng(window)
+    # Tegangan besar dengan riak kecil lalu turun ke level arus (seperti kontak lepas):
+    # kasus terburuk bagi jumlah kumulatif kuadrat.
+    values = 230.0 + rng.normal(0, 0.01, 2000)
+    values[100:400] = 0.05 + rng.normal(0, 0.001, 300)
+    mean, std = rolling_mean_std(values, window, ddof)
+
+    rolling = pd.Series(values).rolling(window, min_periods=1)
+    np.testing.assert_allclose(mean, rolling.mean().to_numpy(), rtol=0, atol=1e-9)
+    expected_std = rolling.std(ddof=ddof).fillna(0.0).to_numpy()
+    # Selisih kumulatif kuadrat: galat absolut jauh di bawah resolusi 0.01 data perangkat.
+    np.testing.assert_allclose(std, expected_std, rtol=0, atol=1e-4)
+
+
+def test_rolling_mean_std_fills_missing_values():
+    mean, std = rolling_mean_std([1.0, np.nan, 3.0], 2)
+    np.testing.assert_allclose(mean, [1.0, 1.0, 2.0])
+    np.testing.assert_allclose(std, [0.0, 0.0, 1.0])
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+from pengujian import loader
+from pengujian.loader import TIMESTAMP_FORMAT, invalid_time_mask, parse_timestamps, time_values
+
+TEXT = ['2025-08-06 15:53:34.123', '2025-08-06 15:53:34.5', '', 'rusak', '2025-02-30 00:00:00.000',
+        '2025-08-06 15:53:35.000000001']
+
+
+def expected_timestamps(values):
+    return pd.to_datetime(pd.Series(values), format=TIMESTAMP_FORMAT, errors='coerce').to_numpy(dtype='datetime64[ns]')
+
+
+def test_parse_timestamps_matches_pandas():
+    np.testing.assert_array_equal(parse_timestamps(pd.Series(TEXT)), expected_timestamps(TEXT))
+
+
+def test_parse_timestamps_without_pyarrow(monkeypatch):
+    monkeypatch.setattr(loader, 'pa', None)
+    np.testing.assert_array_equal(parse_timestamps(pd.Series(TEXT)), expected_timestamps(TEXT))
+
+
+def test_text_time_column_parsed_per_unique_value():
+    values = time_values(pd.Categorical(['0.0', '0.2', 'x', '0.2', None]))
+    np.testing.assert_array_equal(values, [0.0, 0.2, np.nan, 0.2, np.nan])
+    assert invalid_time_mask(values).tolist() == [False, False, True, False, True]
+
+
+def test_invalid_timestamps_counted():
+    values = parse_timestamps(pd.Series(TEXT))
+    assert int(invalid_time_mask(values).sum()) == 3
+    assert time_values(None) is None
+
@@ -0,0 +1,58 @@
+import json
+import threading
+import time
+
+from pengujian import timing
+
+
+def test_nested_stages_count_own_time_once():
+    with timing.collect() as times:
+        with timing.stage('luar', file='a.csv'):
+            time.sleep(0.01)
+            with timing.stage('dalam'):
+                timing.count_rows(5)
+                time.sleep(0.05)
+    assert times.calls == {'luar': 1, 'dalam': 1}
+    assert times.rows['dalam'] == 5 and times.rows['luar'] == 0
+    # Waktu tahap dalam tidak ikut dihitung di tahap luar.
+    assert 0.009 < times.seconds['luar'] < times.seconds['dalam']
+    assert times.seconds['dalam'] >= 0.045
+    # Tahap dalam mewarisi file tahap luarnya.
+    assert set(times.files['a.csv'].seconds) == {'luar', 'dalam'}
+    assert abs(times.total() - (times.finished - times.started)) < 0.01
+
+
+def test_background_thread_stages_are_kept_apart():
+    def load():
+        with timing.stage('baca'):
+            time.sleep(0.05)
+
+    with timing.collect() as times:
+        with timing.stage('hitung'):
+            worker = threading.Thread(target=load)
+            worker.start()
+            time.sleep(0.05)
+            worker.join()
+    assert set(times.background.seconds) == {'baca'}
+    # Tahap thread pemuat berjalan bersamaan, jadi tidak masuk total thread utama.
+    assert set(times.main_seconds()) == {'hitung'}
+    assert times.main_seconds()['hitung'] <= times.finished - times.started
+    assert 'baca' in times.summary()['background_stages']
+
+
+def test_stage_without_collector_is_noop():
+    with timing.stage('apa saja'):
+        timing.count_rows(10)
+    assert timing._active is None
+
+
+def test_traces_are_valid_json(tmp_path):
+    with timing.collect() as times:
+        with timing.stage('baca', file='a.csv'):
+            timing.count_rows(3)
+    timing.write_json(times, tmp_path / 'trace.json')
+    timing.write_chrome_trace(times, tmp_path / 'chrome.json')
+    trace = json.loads((tmp_path / 'trace.json').read_text(encoding='utf-8'))
+    assert trace['stages']['baca']['rows'] == 3
+    assert trace['files']['a.csv']['baca']['calls'] == 1
+    json.loads((tmp_path / 'chrome.json').read_text(encoding='utf-8'))
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from pengujian.labels import LabelVocabulary
+from pengujian.streaming import TrialAccumulator
+
+
+def per_run_tensor(y_true, y_pred, n):
+    """Rujukan per run: sampel run kebenaran (selain run pertama, panjang > 1) dihitung per (asal, tujuan, prediksi)."""
+    tensor = np.zeros((n, n, n), dtype=np.int64)
+    bounds = np.flatnonzero(np.diff(y_true)) + 1
+    starts = np.concatenate(([0], bounds))
+    ends = np.concatenate((bounds, [len(y_true)]))
+    for run in range(1, len(starts)):
+        if ends[run] - starts[run] > 1:
+            for predicted in y_pred[starts[run]:ends[run]]:
+                tensor[y_true[starts[run - 1]], y_true[starts[run]], predicted] += 1
+    return tensor
+
+
+@pytest.mark.parametrize('chunksize', [1, 2, 7, 1000])
+def test_transition_tensor_matches_per_run_counts_for_any_chunking(chunksize):
+    rng = np.random.default_rng(chunksize)
+    y_true = np.repeat(rng.integers(0, 3, 60), rng.integers(1, 10, 60)).astype(np.uint8)
+    y_pred = np.where(rng.random(len(y_true)) < 0.8, y_true, rng.integers(0, 3, len(y_true))).astype(np.uint8)
+    accumulator = TrialAccumulator(LabelVocabulary(), collect_rows=False)
+    for i in range(0, len(y_true), chunksize):
+        accumulator.update({'y_true': y_true[i:i + chunksize], 'y_pred': y_pred[i:i + chunksize], 'truth_time': None,
+                            'pred_time': None, 'columns': {}, 'invalid_time': 0})
+    partial = accumulator.finish()
+    np.testing.assert_array_equal(partial['transition_confusion'], per_run_tensor(y_true, y_pred, 3))
+    assert partial['confusion'].sum() == len(y_true)
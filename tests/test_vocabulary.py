@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pengujian.labels import MAX_LABELS, LabelVocabulary
+
+
+def test_spellings_of_both_schemas_share_codes():
+    vocab = LabelVocabulary()
+    values = np.array(['NORMAL ', 'Status: Normal', 'ARC FLASH ⚠', 'Status: Arc Flash',
+                       ' NO CONTACT', 'Status: Off Contact'], dtype=object)
+    codes = vocab.encode(values)
+    assert codes.dtype == np.uint8
+    assert codes.tolist() == [0, 0, 1, 1, 2, 2]
+    assert vocab.names == ['NORMAL', 'ARC FLASH', 'NO CONTACT']
+
+
+def test_unknown_label_gets_new_code():
+    vocab = LabelVocabulary()
+    assert vocab.encode(np.array(['NORMAL', ' SPARK ⚠', 'SPARK'], dtype=object)).tolist() == [0, 3, 3]
+    assert vocab.names[3] == 'SPARK'
+    assert len(LabelVocabulary()) == 3
+
+
+def test_names_from_codes():
+    vocab = LabelVocabulary()
+    assert vocab.transition_key(1, 0) == 'Arc ke Normal'
+    assert vocab.display_name(2) == 'Off Contact'
+    assert vocab.output_names({'label_names': {'NORMAL': 'Status: Normal'}})[:2] == ['Status: Normal', 'ARC FLASH']
+    categorical = vocab.categorical(np.array([2, 0], dtype=np.uint8))
+    assert list(categorical) == ['NO CONTACT', 'NORMAL']
+    assert isinstance(categorical, pd.Categorical)
+
+
+def test_too_many_labels():
+    vocab = LabelVocabulary()
+    with pytest.raises(ValueError):
+        vocab.encode(np.array([f'L{i}' for i in range(MAX_LABELS)], dtype=object))
@@ -0,0 +1,35 @@
+import asyncio
+import contextlib
+import io
+import os
+import shutil
+
+from conftest import REPO, assert_same_result, dataset
+from pengujian.watch import Watcher
+
+
+def test_growing_files_match_batch_evaluation(plain_results, tmp_path):
+    ds = dataset('10ws')
+    shutil.copytree(os.path.join(REPO, ds['root']), tmp_path / ds['root'])
+    contents = {}
+    for folder, _, files in os.walk(tmp_path / ds['root']):
+        for name in files:
+            if name.endswith('.csv'):
+                path = os.path.join(folder, name)
+                with open(path, 'rb') as f:
+                    contents[path] = f.read()
+                # Separuh pertama file, berakhir di tengah baris.
+                with open(path, 'wb') as f:
+                    f.write(contents[path][:len(contents[path]) // 2])
+
+    watcher = Watcher([ds], str(tmp_path), idle=3600)
+    with contextlib.redirect_stdout(io.StringIO()):
+        asyncio.run(watcher.poll())
+        assert 0 < watcher.rows < plain_results['10ws']['rows']
+        for path, data in contents.items():
+            with open(path, 'ab') as f:
+                f.write(data[len(data) // 2:])
+        asyncio.run(watcher.poll())
+        watcher.close_all()
+        result = watcher.results()['10ws']
+    assert_same_result(plain_results['10ws'], result)